@@ -23,7 +23,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from app.db.base_class import Base
 
 # Import all models here for Alembic autogenerate
-from app.models import user, issue  # Import modules, not classes directly
+from app.models import user, issue, daily_stats, hourly_stats, issue_event, job_run, queued_job, stream_event  # Import modules, not classes directly
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,34 @@
+"""add issue query indexes
+
+Revision ID: 4b7e2c9a1f3d
+Revises: 110c25cf9d1d
+Create Date: 2026-10-18 09:12:40.113204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2c9a1f3d'
+down_revision: Union[str, Sequence[str], None] = '110c25cf9d1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_issues_created_at_id', 'issues', ['created_at', 'id'], unique=False)
+    op.create_index('ix_issues_created_by_created_at', 'issues', ['created_by', 'created_at', 'id'], unique=False)
+    op.create_index('ix_issues_status_severity', 'issues', ['status', 'severity'], unique=False)
+    op.create_index('ix_issues_status_updated_at', 'issues', ['status', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issues_status_updated_at', table_name='issues')
+    op.drop_index('ix_issues_status_severity', table_name='issues')
+    op.drop_index('ix_issues_created_by_created_at', table_name='issues')
+    op.drop_index('ix_issues_created_at_id', table_name='issues')
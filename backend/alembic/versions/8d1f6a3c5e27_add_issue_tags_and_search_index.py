@@ -0,0 +1,77 @@
+"""add issue tags and full-text search index
+
+Revision ID: 8d1f6a3c5e27
+Revises: 4b7e2c9a1f3d
+Create Date: 2026-10-18 10:41:05.527318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d1f6a3c5e27'
+down_revision: Union[str, Sequence[str], None] = '4b7e2c9a1f3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('issues', sa.Column('tags', sa.String(), nullable=True))
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("""
+            ALTER TABLE issues ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'C')
+            ) STORED
+        """)
+        op.execute("CREATE INDEX ix_issues_search_vector ON issues USING gin (search_vector)")
+    elif dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE issues_fts USING fts5(
+                title, description, tags, content='issues', content_rowid='rowid'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+                INSERT INTO issues_fts(rowid, title, description, tags)
+                VALUES (new.rowid, new.title, new.description, new.tags);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+                INSERT INTO issues_fts(issues_fts, rowid, title, description, tags)
+                VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description, tags ON issues BEGIN
+                INSERT INTO issues_fts(issues_fts, rowid, title, description, tags)
+                VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+                INSERT INTO issues_fts(rowid, title, description, tags)
+                VALUES (new.rowid, new.title, new.description, new.tags);
+            END
+        """)
+        # Index rows that existed before the FTS table
+        op.execute("INSERT INTO issues_fts(issues_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_issues_search_vector")
+        op.execute("ALTER TABLE issues DROP COLUMN IF EXISTS search_vector")
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS issues_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS issues_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS issues_fts_ai")
+        op.execute("DROP TABLE IF EXISTS issues_fts")
+
+    op.drop_column('issues', 'tags')
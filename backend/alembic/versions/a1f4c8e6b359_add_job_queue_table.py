@@ -0,0 +1,47 @@
+"""add job queue table
+
+Revision ID: a1f4c8e6b359
+Revises: e9a3c5f1d276
+Create Date: 2026-10-18 20:44:09.286531
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f4c8e6b359'
+down_revision: Union[str, Sequence[str], None] = 'e9a3c5f1d276'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_queue',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('task', sa.String(length=100), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('run_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_by', sa.String(length=255), nullable=True),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_queue_status_run_at', 'job_queue', ['status', 'run_at'], unique=False)
+    op.create_index('ix_job_queue_status_locked_until', 'job_queue', ['status', 'locked_until'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_queue_status_locked_until', table_name='job_queue')
+    op.drop_index('ix_job_queue_status_run_at', table_name='job_queue')
+    op.drop_table('job_queue')
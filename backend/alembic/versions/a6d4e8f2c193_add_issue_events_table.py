@@ -0,0 +1,43 @@
+"""add issue events table
+
+Revision ID: a6d4e8f2c193
+Revises: f1b7c3d9a842
+Create Date: 2026-10-18 15:41:52.204617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d4e8f2c193'
+down_revision: Union[str, Sequence[str], None] = 'f1b7c3d9a842'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('issue_events',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('issue_id', sa.UUID(), nullable=False),
+    sa.Column('event_type', sa.String(length=20), nullable=False),
+    sa.Column('from_status', sa.String(length=20), nullable=True),
+    sa.Column('to_status', sa.String(length=20), nullable=True),
+    sa.Column('from_severity', sa.String(length=20), nullable=True),
+    sa.Column('to_severity', sa.String(length=20), nullable=True),
+    sa.Column('actor_id', sa.UUID(), nullable=True),
+    sa.Column('occurred_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_issue_events_issue_id_occurred_at', 'issue_events', ['issue_id', 'occurred_at'], unique=False)
+    op.create_index('ix_issue_events_type_occurred_at', 'issue_events', ['event_type', 'occurred_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issue_events_type_occurred_at', table_name='issue_events')
+    op.drop_index('ix_issue_events_issue_id_occurred_at', table_name='issue_events')
+    op.drop_table('issue_events')
@@ -0,0 +1,36 @@
+"""extend issue status severity index with keyset order
+
+Revision ID: b3e7d1a5c829
+Revises: f5a7c3e9b264
+Create Date: 2026-10-19 11:04:27.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e7d1a5c829'
+down_revision: Union[str, Sequence[str], None] = 'f5a7c3e9b264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Status/severity filtered pages are read in (created_at, id) order from
+    # the index instead of sorting every match; the (status, severity) prefix
+    # still answers the dashboard breakdown, so the old index is redundant.
+    op.create_index(
+        'ix_issues_status_severity_created_at', 'issues',
+        ['status', 'severity', 'created_at', 'id'], unique=False
+    )
+    op.drop_index('ix_issues_status_severity', table_name='issues')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_issues_status_severity', 'issues', ['status', 'severity'], unique=False)
+    op.drop_index('ix_issues_status_severity_created_at', table_name='issues')
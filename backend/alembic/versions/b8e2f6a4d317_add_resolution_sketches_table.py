@@ -0,0 +1,36 @@
+"""add resolution sketches table
+
+Revision ID: b8e2f6a4d317
+Revises: a6d4e8f2c193
+Create Date: 2026-10-18 16:37:15.661908
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f6a4d317'
+down_revision: Union[str, Sequence[str], None] = 'a6d4e8f2c193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resolution_sketches',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('severity', sa.String(length=20), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('sketch', sa.Text(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('date', 'severity', name='uq_resolution_sketches_date_severity')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('resolution_sketches')
@@ -0,0 +1,30 @@
+"""add issue attachment columns
+
+Revision ID: c3a9e5b7d214
+Revises: 8d1f6a3c5e27
+Create Date: 2026-10-18 11:58:19.402771
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9e5b7d214'
+down_revision: Union[str, Sequence[str], None] = '8d1f6a3c5e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('issues', sa.Column('file_path', sa.String(), nullable=True))
+    op.add_column('issues', sa.Column('file_checksum', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('issues', 'file_checksum')
+    op.drop_column('issues', 'file_path')
@@ -0,0 +1,38 @@
+"""add stream events table
+
+Revision ID: c4e8b2d6f471
+Revises: a1f4c8e6b359
+Create Date: 2026-10-18 23:12:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8b2d6f471'
+down_revision: Union[str, Sequence[str], None] = 'a1f4c8e6b359'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stream_events',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('event_type', sa.String(length=20), nullable=False),
+    sa.Column('issue_id', sa.UUID(), nullable=True),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('data', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_stream_events_created_at'), 'stream_events', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_stream_events_created_at'), table_name='stream_events')
+    op.drop_table('stream_events')
@@ -0,0 +1,75 @@
+"""add issue assigned_to
+
+Revision ID: d2c7a9e4b158
+Revises: b8e2f6a4d317
+Create Date: 2026-10-18 18:05:22.418390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2c7a9e4b158'
+down_revision: Union[str, Sequence[str], None] = 'b8e2f6a4d317'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite search triggers as of 8d1f6a3c5e27; batch mode rebuilds issues on
+# SQLite, which drops them and renumbers the rowids they key on
+SQLITE_SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+        INSERT INTO issues_fts(rowid, title, description, tags)
+        VALUES (new.rowid, new.title, new.description, new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description, tags)
+        VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description, tags ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description, tags)
+        VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+        INSERT INTO issues_fts(rowid, title, description, tags)
+        VALUES (new.rowid, new.title, new.description, new.tags);
+    END
+    """,
+]
+
+
+def _restore_sqlite_search() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for statement in SQLITE_SEARCH_TRIGGERS:
+        op.execute(statement)
+    op.execute("INSERT INTO issues_fts(issues_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Batch mode: SQLite can't ALTER constraints, so it copies the table there
+    with op.batch_alter_table('issues') as batch_op:
+        batch_op.add_column(sa.Column('assigned_to', sa.UUID(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_issues_assigned_to_users', 'users', ['assigned_to'], ['id'], ondelete='SET NULL'
+        )
+    _restore_sqlite_search()
+    op.create_index('ix_issues_assigned_to_created_at', 'issues', ['assigned_to', 'created_at', 'id'], unique=False)
+    op.create_index('ix_issues_status_assigned_to_severity', 'issues', ['status', 'assigned_to', 'severity'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issues_status_assigned_to_severity', table_name='issues')
+    op.drop_index('ix_issues_assigned_to_created_at', table_name='issues')
+    with op.batch_alter_table('issues') as batch_op:
+        batch_op.drop_constraint('fk_issues_assigned_to_users', type_='foreignkey')
+        batch_op.drop_column('assigned_to')
+    _restore_sqlite_search()
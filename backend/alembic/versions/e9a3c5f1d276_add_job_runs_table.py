@@ -0,0 +1,42 @@
+"""add job runs table
+
+Revision ID: e9a3c5f1d276
+Revises: d2c7a9e4b158
+Create Date: 2026-10-18 19:21:47.903115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a3c5f1d276'
+down_revision: Union[str, Sequence[str], None] = 'd2c7a9e4b158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_runs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('job_id', sa.String(length=100), nullable=False),
+    sa.Column('scheduled_for', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('worker', sa.String(length=255), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('duration_ms', sa.Float(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('job_id', 'scheduled_for', name='uq_job_runs_job_id_scheduled_for')
+    )
+    op.create_index('ix_job_runs_started_at', 'job_runs', ['started_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_runs_started_at', table_name='job_runs')
+    op.drop_table('job_runs')
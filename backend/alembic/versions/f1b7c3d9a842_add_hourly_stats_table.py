@@ -0,0 +1,41 @@
+"""add hourly stats table
+
+Revision ID: f1b7c3d9a842
+Revises: e5f8a2c4b961
+Create Date: 2026-10-18 14:22:07.930415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b7c3d9a842'
+down_revision: Union[str, Sequence[str], None] = 'e5f8a2c4b961'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = [
+    'issues_created', 'issues_closed',
+    'status_open', 'status_in_progress', 'status_resolved', 'status_closed',
+    'severity_low', 'severity_medium', 'severity_high', 'severity_critical',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('hourly_stats',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    *(sa.Column(name, sa.Integer(), server_default='0', nullable=False) for name in COUNTER_COLUMNS),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('hour')
+    )
+    # Build the rollups for existing issues with: python -m scripts.backfill_rollups
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('hourly_stats')
@@ -0,0 +1,90 @@
+"""key sqlite search index on issue id
+
+Revision ID: f5a7c3e9b264
+Revises: c4e8b2d6f471
+Create Date: 2026-10-19 09:12:40.316852
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a7c3e9b264'
+down_revision: Union[str, Sequence[str], None] = 'c4e8b2d6f471'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _drop_sqlite_search() -> None:
+    op.execute("DROP TRIGGER IF EXISTS issues_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS issues_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS issues_fts_ai")
+    op.execute("DROP TABLE IF EXISTS issues_fts")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The external-content FTS5 table was keyed on the implicit rowid of
+    # issues, which VACUUM may renumber; key it on the issue id instead.
+    # PostgreSQL's generated tsvector column is unaffected.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    _drop_sqlite_search()
+    op.execute("CREATE VIRTUAL TABLE issues_fts USING fts5(issue_id, title, description, tags)")
+    op.execute("""
+        CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+            INSERT INTO issues_fts(issue_id, title, description, tags)
+            VALUES (new.id, new.title, new.description, new.tags);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+            DELETE FROM issues_fts WHERE issues_fts MATCH '{issue_id}: "' || old.id || '"';
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description, tags ON issues BEGIN
+            DELETE FROM issues_fts WHERE issues_fts MATCH '{issue_id}: "' || old.id || '"';
+            INSERT INTO issues_fts(issue_id, title, description, tags)
+            VALUES (new.id, new.title, new.description, new.tags);
+        END
+    """)
+    op.execute("INSERT INTO issues_fts(issue_id, title, description, tags) SELECT id, title, description, tags FROM issues")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    _drop_sqlite_search()
+    op.execute("""
+        CREATE VIRTUAL TABLE issues_fts USING fts5(
+            title, description, tags, content='issues', content_rowid='rowid'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+            INSERT INTO issues_fts(rowid, title, description, tags)
+            VALUES (new.rowid, new.title, new.description, new.tags);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+            INSERT INTO issues_fts(issues_fts, rowid, title, description, tags)
+            VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description, tags ON issues BEGIN
+            INSERT INTO issues_fts(issues_fts, rowid, title, description, tags)
+            VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+            INSERT INTO issues_fts(rowid, title, description, tags)
+            VALUES (new.rowid, new.title, new.description, new.tags);
+        END
+    """)
+    op.execute("INSERT INTO issues_fts(issues_fts) VALUES ('rebuild')")
@@ -1,12 +1,12 @@
 # backend/app/api/auth.py - Make sure this is correct
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.schemas.user import UserCreate, Token, UserOut
 from app.services import user_service
 from app.core.security import create_access_token
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.core.deps import get_current_user
 from app.models.user import User
 
@@ -14,11 +14,11 @@ from app.models.user import User
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/register", response_model=Token)
-def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user."""
     print(f"📝 Registration attempt for: {user_data.email}")
     
-    existing_user = user_service.get_user_by_email(db, user_data.email)
+    existing_user = await user_service.get_user_by_email(db, user_data.email)
     if existing_user:
         print(f"❌ User already exists: {user_data.email}")
         raise HTTPException(
@@ -27,7 +27,7 @@ def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     try:
-        new_user = user_service.create_user(db, user_data)
+        new_user = await user_service.create_user(db, user_data)
         access_token = create_access_token(data={"sub": new_user.email})
         print(f"✅ User registered successfully: {user_data.email}")
         return {"access_token": access_token, "token_type": "bearer"}
@@ -39,11 +39,11 @@ def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
 @router.post("/login", response_model=Token)
-def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
     """Login user."""
     print(f"🔐 Login attempt for: {form_data.username}")
     
-    user = user_service.authenticate_user(db, form_data.username, form_data.password)
+    user = await user_service.authenticate_user(db, form_data.username, form_data.password)
     if not user:
         print(f"❌ Invalid credentials for: {form_data.username}")
         raise HTTPException(
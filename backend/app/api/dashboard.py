@@ -1,31 +1,46 @@
 # backend/app/api/dashboard.py
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.db.session import get_db
-from app.models.issue import Issue, IssueStatus
-from app.core.deps import get_current_user
-from app.models.user import User
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import uuid
+from app.db.session import get_async_db
+from app.services.dashboard import dashboard_summary
+from app.core.deps import get_current_user, require_roles
+from app.core.cache import cache
+from app.models.user import User, RoleEnum
+from app.models.job_run import JobRun
+from app.models.queued_job import QueuedJob
+from app.schemas.job_run import JobRunOut, QueuedJobOut
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 @router.get("/stats")
-def get_dashboard_stats(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    # Get issue counts by status
-    total_issues = db.query(Issue).count()
-    open_issues = db.query(Issue).filter(Issue.status == IssueStatus.OPEN).count()
-    in_progress_issues = db.query(Issue).filter(Issue.status == IssueStatus.IN_PROGRESS).count()
-    resolved_issues = db.query(Issue).filter(Issue.status == IssueStatus.RESOLVED).count()
-    closed_issues = db.query(Issue).filter(Issue.status == IssueStatus.CLOSED).count()
-    
-    # Get recent issues (last 5)
-    recent_issues = db.query(Issue).order_by(Issue.created_at.desc()).limit(5).all()
-    
-    return {
-        "total_issues": total_issues,
-        "open_issues": open_issues,
-        "in_progress_issues": in_progress_issues,
-        "resolved_issues": resolved_issues,
-        "closed_issues": closed_issues,
-        "recent_issues": recent_issues
-    }
\ No newline at end of file
+@cache.cached("issues")
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    return await dashboard_summary(db)
+
+@router.get("/jobs", response_model=List[JobRunOut])
+async def get_job_runs(
+    job_id: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_roles(RoleEnum.ADMIN))
+):
+    """Latest scheduled job runs across all workers, with duration and outcome."""
+    query = select(JobRun).order_by(JobRun.started_at.desc()).limit(limit)
+    if job_id:
+        query = query.where(JobRun.job_id == job_id)
+    return (await db.scalars(query)).all()
+
+@router.get("/queue/{job_id}", response_model=QueuedJobOut)
+async def get_queued_job(
+    job_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_roles(RoleEnum.ADMIN))
+):
+    """Status of a background job queued with app.workers.enqueue."""
+    job = await db.get(QueuedJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,25 +1,71 @@
 # backend/app/api/issue.py
 
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, Response, Header
+from fastapi.responses import StreamingResponse, JSONResponse
+from sqlalchemy import select, insert, update as sql_update, delete as sql_delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from pydantic import ValidationError
 from typing import List, Optional
+from datetime import datetime, timedelta
 import os
 import uuid
-import shutil
 from pathlib import Path
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.issue import Issue, IssueStatus, IssueSeverity
-from app.schemas.issue import IssueCreate, IssueUpdate, IssueOut, IssueFilter
+from app.schemas.issue import (
+    IssueCreate, IssueUpdate, IssueOut, IssueFilter,
+    BatchOperationType, IssueBatchRequest, IssueBatchResult, IssueBatchResponse
+)
 from app.core.deps import get_current_user, require_roles
+from app.core.config import settings
+from app.core.cache import cache
+from app.core.issue_events import issue_event_data
+from app.core.websocket import manager
+from app.core.pagination import apply_keyset, encode_cursor
+from app.core.etag import weak_etag, rows_etag, etag_matches, not_modified, set_etag
+from app.services.export import EXPORT_FORMATS, export_issues, export_value
+from app.services.search import apply_search
+from app.services.uploads import save_upload
+from app.services.stats import record_issue_changes
+from app.services.dashboard import issue_counts, assignee_workload
+from app.services.sketches import resolution_percentiles
 from app.models.user import User, RoleEnum
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
 # Create upload directory
-UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+def ensure_can_view(created_by, current_user: User):
+    """REPORTER can only see their own issues."""
+    if current_user.role == RoleEnum.REPORTER and created_by != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+# REPORTERs can only update title, description, severity, tags
+REPORTER_UPDATE_FIELDS = {"title", "description", "severity", "tags"}
+
+def allowed_update_fields(update: IssueUpdate, created_by, current_user: User) -> dict:
+    """Fields current_user may set. MAINTAINER+ can update any issue, REPORTER only their own."""
+    update_dict = update.dict(exclude_unset=True)
+    
+    if current_user.role == RoleEnum.REPORTER:
+        if created_by != current_user.id:
+            raise HTTPException(status_code=403, detail="Access denied")
+        update_dict = {k: v for k, v in update_dict.items() if k in REPORTER_UPDATE_FIELDS}
+    
+    return update_dict
+
+async def ensure_assignees_exist(db: AsyncSession, assignee_ids) -> set:
+    """Return the subset of assignee_ids that aren't existing users."""
+    assignee_ids = {assignee_id for assignee_id in assignee_ids if assignee_id is not None}
+    if not assignee_ids:
+        return set()
+    found = (await db.scalars(select(User.id).where(User.id.in_(assignee_ids)))).all()
+    return assignee_ids - set(found)
+
 @router.post("/", response_model=IssueOut)
 async def create_issue(
     title: str = Form(...),
@@ -27,123 +73,406 @@ async def create_issue(
     severity: IssueSeverity = Form(IssueSeverity.MEDIUM),
     tags: Optional[str] = Form(None),
     file: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new issue with optional file upload."""
     
     file_path = None
+    file_checksum = None
     if file:
-        # Generate unique filename
-        file_extension = os.path.splitext(file.filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = UPLOAD_DIR / unique_filename
-        
-        # Save file
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        file_path = str(file_path)
+        # Streamed to disk off the event loop; rejects oversized or disallowed files
+        file_path, file_checksum = await save_upload(file, UPLOAD_DIR)
     
     new_issue = Issue(
+        id=uuid.uuid4(),
         title=title,
         description=description,
         severity=severity,
         tags=tags,
         file_path=file_path,
+        file_checksum=file_checksum,
         created_by=current_user.id
     )
     
     db.add(new_issue)
-    db.commit()
-    db.refresh(new_issue)
+    change = (new_issue.id, None, (IssueStatus.OPEN, severity))
+    await db.run_sync(record_issue_changes, [change], current_user.id)
+    await db.commit()
+    await cache.invalidate("issues")
+    await db.refresh(new_issue)
+    await manager.notify_issue_created(issue_event_data(new_issue))
     return new_issue
 
-@router.get("/", response_model=List[IssueOut])
-def list_issues(
-    status: Optional[IssueStatus] = Query(None),
-    severity: Optional[IssueSeverity] = Query(None),
-    assigned_to: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+# Columns list_issues can return on their own with ?fields=
+PROJECTABLE_FIELDS = [name for name in IssueOut.model_fields if name in Issue.__table__.c]
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Validate a comma-separated sparse fieldset; `id` is always included."""
+    if not fields:
+        return None
+    
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in PROJECTABLE_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(PROJECTABLE_FIELDS)}"
+        )
+    
+    return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+
+def filtered_issues_query(
+    current_user: User,
+    status: Optional[IssueStatus] = None,
+    severity: Optional[IssueSeverity] = None,
+    assigned_to: Optional[uuid.UUID] = None
 ):
-    """List issues with filtering. REPORTER sees only their issues."""
+    """Build the issue SELECT shared by list endpoints. REPORTER sees only their issues."""
     
-    query = db.query(Issue)
+    query = select(Issue)
     
     # Role-based filtering
     if current_user.role == RoleEnum.REPORTER:
-        query = query.filter(Issue.created_by == current_user.id)
+        query = query.where(Issue.created_by == current_user.id)
     
     # Apply filters
     if status:
-        query = query.filter(Issue.status == status)
+        query = query.where(Issue.status == status)
     if severity:
-        query = query.filter(Issue.severity == severity)
+        query = query.where(Issue.severity == severity)
     if assigned_to:
-        query = query.filter(Issue.assigned_to == assigned_to)
+        query = query.where(Issue.assigned_to == assigned_to)
+    
+    return query
+
+@router.post("/batch", response_model=IssueBatchResponse)
+async def batch_issues(
+    batch: IssueBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Apply many create/update/status/delete operations in one transaction.
+    
+    Every operation gets its own result. Rejected operations (validation, 403,
+    404, 409) don't stop the others; accepted ones are written with one
+    executemany per operation kind and committed together.
+    """
+    
+    operations = batch.operations
+    if len(operations) > settings.ISSUES_BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.ISSUES_BATCH_MAX_OPERATIONS} operations per batch"
+        )
+    
+    # One SELECT for every existing issue the batch touches
+    target_ids = {operation.id for operation in operations if operation.id is not None}
+    owners, files, states, current = {}, {}, {}, {}
+    if target_ids:
+        rows = (await db.execute(
+            select(
+                Issue.id, Issue.title, Issue.created_by, Issue.assigned_to, Issue.file_path,
+                Issue.status, Issue.severity, Issue.created_at, Issue.updated_at
+            ).where(Issue.id.in_(target_ids))
+        )).all()
+        owners = {row.id: row.created_by for row in rows}
+        files = {row.id: row.file_path for row in rows if row.file_path}
+        states = {row.id: (row.status, row.severity, row.created_at, row.updated_at) for row in rows}
+        # Event payloads for the change notifications sent after commit
+        current = {row.id: row._asdict() for row in rows}
+    
+    # One SELECT to check every assignee the batch sets
+    unknown_assignees = await ensure_assignees_exist(db, (
+        operation.data.assigned_to for operation in operations if operation.data is not None
+    ))
+    
+    columns = Issue.__table__.c
+    now = datetime.utcnow()
+    results, inserts, updates, deletes = [], [], [], []
+    touched = set()
+    changes, events = [], []
+    
+    for index, operation in enumerate(operations):
+        result = IssueBatchResult(index=index, op=operation.op, id=operation.id, status_code=200)
+        results.append(result)
+        
+        try:
+            if operation.op == BatchOperationType.CREATE:
+                fields = operation.data.dict(exclude_unset=True) if operation.data else {}
+                # POST /api/issues/ can't set these either: new issues start OPEN and unassigned
+                rejected = [name for name in fields if name not in IssueCreate.model_fields]
+                if rejected:
+                    raise HTTPException(status_code=422, detail=f"{', '.join(rejected)} can't be set on create")
+                data = IssueCreate(**fields)
+                result.id = uuid.uuid4()
+                result.status_code = 201
+                inserts.append({
+                    "id": result.id,
+                    **data.dict(),
+                    "created_by": current_user.id,
+                    "created_at": now,
+                    "updated_at": now
+                })
+                changes.append((result.id, None, (IssueStatus.OPEN, data.severity)))
+                events.append(("issue_created", {**inserts[-1], "status": IssueStatus.OPEN}))
+                continue
+            
+            if operation.id is None:
+                raise HTTPException(status_code=422, detail="id is required")
+            if operation.id in touched:
+                raise HTTPException(status_code=409, detail="Issue already changed earlier in this batch")
+            if operation.id not in owners:
+                raise HTTPException(status_code=404, detail="Issue not found")
+            
+            if operation.op == BatchOperationType.DELETE:
+                # Only ADMIN can delete
+                if current_user.role != RoleEnum.ADMIN:
+                    raise HTTPException(status_code=403, detail="Access denied")
+                deletes.append(operation.id)
+                changes.append((operation.id, states[operation.id], None))
+                events.append(("issue_deleted", current[operation.id]))
+            else:
+                update = operation.data or IssueUpdate()
+                if operation.op == BatchOperationType.STATUS:
+                    if update.status is None:
+                        raise HTTPException(status_code=422, detail="status is required")
+                    if current_user.role == RoleEnum.REPORTER:
+                        raise HTTPException(status_code=403, detail="Access denied")
+                    update = IssueUpdate(status=update.status)
+                
+                values = allowed_update_fields(update, owners[operation.id], current_user)
+                values = {k: v for k, v in values.items() if k in columns}
+                if values.get("assigned_to") in unknown_assignees:
+                    raise HTTPException(status_code=422, detail="Assignee not found")
+                if values:
+                    updates.append({"id": operation.id, **values, "updated_at": now})
+                    events.append(("issue_updated", {**current[operation.id], **updates[-1]}))
+                    status, severity, created_at, _ = states[operation.id]
+                    changes.append((
+                        operation.id,
+                        states[operation.id],
+                        (values.get("status", status), values.get("severity", severity), created_at)
+                    ))
+            
+            touched.add(operation.id)
+        except HTTPException as e:
+            result.status_code = e.status_code
+            result.detail = e.detail
+        except ValidationError as e:
+            result.status_code = 422
+            result.detail = "; ".join(error["msg"] for error in e.errors())
+    
+    try:
+        if inserts:
+            await db.execute(insert(Issue), inserts)
+        if updates:
+            await db.execute(sql_update(Issue), updates)
+        if deletes:
+            await db.execute(
+                sql_delete(Issue).where(Issue.id.in_(deletes)),
+                execution_options={"synchronize_session": False}
+            )
+        await db.run_sync(record_issue_changes, changes, current_user.id)
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="Batch could not be applied; no changes were made")
+    
+    if changes:
+        await cache.invalidate("issues")
+    
+    # Coalesced with each other (and any other recent change) before going out
+    for kind, data in events:
+        if kind == "issue_created":
+            await manager.notify_issue_created(issue_event_data(data))
+        elif kind == "issue_updated":
+            await manager.notify_issue_updated(issue_event_data(data), current_user.email)
+        else:
+            await manager.notify_issue_deleted(issue_event_data(data), current_user.email)
+    
+    # Delete associated files once the rows are gone
+    for issue_id in deletes:
+        if issue_id in files and os.path.exists(files[issue_id]):
+            os.remove(files[issue_id])
+    
+    return {"results": results}
+
+@router.get("/", response_model=List[IssueOut])
+async def list_issues(
+    response: Response,
+    status: Optional[IssueStatus] = Query(None),
+    severity: Optional[IssueSeverity] = Query(None),
+    assigned_to: Optional[uuid.UUID] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.ISSUES_PAGE_SIZE, ge=1, le=settings.ISSUES_MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of issue fields"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List issues newest first, one keyset page at a time.
+    
+    The cursor for the next page is returned in the X-Next-Cursor header and is
+    absent on the last page. Pages carry a weak ETag; a matching If-None-Match
+    gets 304 after reading only (id, updated_at) for the page.
+    
+    With `fields=` only those columns are selected and returned, e.g.
+    `fields=title,status,severity` skips loading descriptions entirely.
+    """
+    
+    selected = parse_fields(fields)
+    
+    # Fetch one extra row to learn whether another page exists
+    query = apply_keyset(
+        filtered_issues_query(current_user, status, severity, assigned_to),
+        Issue.created_at, Issue.id, cursor
+    ).limit(limit + 1)
+    scope = (current_user.id, status, severity, assigned_to, cursor, limit, selected)
+    
+    if if_none_match:
+        versions = (await db.execute(query.with_only_columns(Issue.id, Issue.updated_at))).all()
+        etag = rows_etag(scope, versions)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    
+    if selected:
+        # Cursor and ETag need created_at/updated_at even when the client didn't ask for them
+        columns = dict.fromkeys(selected + ["created_at", "updated_at"])
+        issues = (await db.execute(
+            query.with_only_columns(*(Issue.__table__.c[name] for name in columns))
+        )).all()
+    else:
+        issues = (await db.scalars(query)).all()
+    
+    set_etag(response, rows_etag(scope, [(issue.id, issue.updated_at) for issue in issues]))
+    
+    if len(issues) > limit:
+        issues = issues[:limit]
+        last = issues[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    
+    if selected:
+        # Slim rows skip IssueOut validation and are encoded directly
+        return JSONResponse(
+            [{name: export_value(getattr(issue, name)) for name in selected} for issue in issues],
+            headers=dict(response.headers)
+        )
+    
+    return issues
+
+@router.get("/export")
+def export_issues_stream(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    status: Optional[IssueStatus] = Query(None),
+    severity: Optional[IssueSeverity] = Query(None),
+    assigned_to: Optional[uuid.UUID] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream every matching issue as NDJSON or CSV with the same filters and scoping as list_issues."""
     
-    return query.order_by(Issue.created_at.desc()).all()
+    statement = filtered_issues_query(current_user, status, severity, assigned_to)
+    
+    return StreamingResponse(
+        export_issues(statement, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="issues.{format}"'}
+    )
+
+@router.get("/search", response_model=List[IssueOut])
+async def search_issues(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(settings.ISSUES_PAGE_SIZE, ge=1, le=settings.ISSUES_MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Full-text search over title, description and tags, best match first."""
+    
+    query = apply_search(filtered_issues_query(current_user), q, db.get_bind().dialect.name)
+    return (await db.scalars(query.limit(limit))).all()
+
+@router.get("/workload")
+@cache.cached("issues")
+async def get_workload(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_roles(RoleEnum.MAINTAINER, RoleEnum.ADMIN))
+):
+    """Open issues per assignee by severity, from one grouped index-only query."""
+    
+    return await assignee_workload(db)
 
 @router.get("/{issue_id}", response_model=IssueOut)
-def get_issue(
-    issue_id: str,
-    db: Session = Depends(get_db),
+async def get_issue(
+    issue_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get issue by ID with role-based access control."""
+    """Get issue by ID with role-based access control.
     
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    A matching If-None-Match gets 304 after reading only updated_at/created_by.
+    """
+    
+    if if_none_match:
+        version = (await db.execute(
+            select(Issue.updated_at, Issue.created_by).where(Issue.id == issue_id)
+        )).first()
+        if version is None:
+            raise HTTPException(status_code=404, detail="Issue not found")
+        ensure_can_view(version.created_by, current_user)
+        
+        etag = weak_etag(issue_id, version.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    
+    issue = await db.get(Issue, issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
     
-    # REPORTER can only see their own issues
-    if current_user.role == RoleEnum.REPORTER and issue.created_by != current_user.id:
-        raise HTTPException(status_code=403, detail="Access denied")
+    ensure_can_view(issue.created_by, current_user)
     
+    set_etag(response, weak_etag(issue.id, issue.updated_at))
     return issue
 
 @router.put("/{issue_id}", response_model=IssueOut)
-def update_issue(
-    issue_id: str,
+async def update_issue(
+    issue_id: uuid.UUID,
     update: IssueUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update issue. MAINTAINER+ can update any issue, REPORTER only their own."""
     
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = await db.get(Issue, issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
     
-    # REPORTER can only update their own issues and limited fields
-    if current_user.role == RoleEnum.REPORTER:
-        if issue.created_by != current_user.id:
-            raise HTTPException(status_code=403, detail="Access denied")
-        # REPORTERs can only update title, description, severity
-        allowed_fields = {"title", "description", "severity", "tags"}
-        update_dict = update.dict(exclude_unset=True)
-        update_dict = {k: v for k, v in update_dict.items() if k in allowed_fields}
-    else:
-        # MAINTAINER+ can update all fields
-        update_dict = update.dict(exclude_unset=True)
+    update_dict = allowed_update_fields(update, issue.created_by, current_user)
+    if await ensure_assignees_exist(db, [update_dict.get("assigned_to")]):
+        raise HTTPException(status_code=422, detail="Assignee not found")
+    before = (issue.status, issue.severity, issue.created_at, issue.updated_at)
     
     for field, value in update_dict.items():
         setattr(issue, field, value)
     
-    db.commit()
-    db.refresh(issue)
+    change = (issue.id, before, (issue.status, issue.severity, issue.created_at))
+    await db.run_sync(record_issue_changes, [change], current_user.id)
+    await db.commit()
+    await cache.invalidate("issues")
+    await db.refresh(issue)
+    await manager.notify_issue_updated(issue_event_data(issue), current_user.email)
     return issue
 
 @router.delete("/{issue_id}")
-def delete_issue(
-    issue_id: str,
-    db: Session = Depends(get_db),
+async def delete_issue(
+    issue_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_roles(RoleEnum.ADMIN))  # Only ADMIN can delete
 ):
     """Delete issue (ADMIN only)."""
     
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = await db.get(Issue, issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
     
@@ -151,33 +480,29 @@ def delete_issue(
     if issue.file_path and os.path.exists(issue.file_path):
         os.remove(issue.file_path)
     
-    db.delete(issue)
-    db.commit()
+    event = issue_event_data(issue)
+    await db.delete(issue)
+    change = (issue.id, (issue.status, issue.severity, issue.created_at, issue.updated_at), None)
+    await db.run_sync(record_issue_changes, [change], current_user.id)
+    await db.commit()
+    await cache.invalidate("issues")
+    await manager.notify_issue_deleted(event, current_user.email)
     return {"message": "Issue deleted successfully"}
 
 @router.get("/stats/dashboard")
-def get_dashboard_stats(
-    db: Session = Depends(get_db),
+@cache.cached("issues")
+async def get_dashboard_stats(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_roles(RoleEnum.MAINTAINER, RoleEnum.ADMIN))
 ):
     """Get dashboard statistics for charts."""
     
-    # Issues by severity
-    severity_stats = db.query(
-        Issue.severity,
-        db.func.count(Issue.id).label('count')
-    ).filter(
-        Issue.status.in_([IssueStatus.OPEN, IssueStatus.TRIAGED, IssueStatus.IN_PROGRESS])
-    ).group_by(Issue.severity).all()
-    
-    # Issues by status
-    status_stats = db.query(
-        Issue.status,
-        db.func.count(Issue.id).label('count')
-    ).group_by(Issue.status).all()
-    
+    counts = await issue_counts(db)
+    today = datetime.utcnow().date()
+    percentiles = await db.run_sync(resolution_percentiles, today - timedelta(days=30), today)
     return {
-        "severity_breakdown": [{"severity": s.severity, "count": s.count} for s in severity_stats],
-        "status_breakdown": [{"status": s.status, "count": s.count} for s in status_stats],
-        "total_open": sum(s.count for s in severity_stats)
-    }
\ No newline at end of file
+        "severity_breakdown": counts["severity_breakdown"],
+        "status_breakdown": counts["status_breakdown"],
+        "total_open": counts["total_open"],
+        "resolution_percentiles": percentiles
+    }
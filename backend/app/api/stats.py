@@ -0,0 +1,131 @@
+# backend/app/api/stats.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from app.db.session import get_async_db
+from app.core.config import settings
+from app.services.rollups import Bucket, range_stats
+from app.services.analytics import time_in_status, mttr_by_severity, throughput
+from app.services.sketches import resolution_percentiles
+from app.core.deps import get_current_user, require_roles
+from app.core.cache import cache
+from app.models.user import User, RoleEnum
+from app.workers import enqueue
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+def as_utc(moment: datetime) -> datetime:
+    """Rollups and events are keyed by naive UTC timestamps."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+def checked_range(from_: datetime, to: datetime) -> Tuple[datetime, datetime]:
+    start, end = as_utc(from_), as_utc(to)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="'from' must be before 'to'")
+    return start, end
+
+def analytics_range(
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = Query(None)
+) -> Tuple[datetime, datetime]:
+    """Event-log window: defaults to the last 30 days, capped at ANALYTICS_MAX_RANGE_DAYS.
+
+    The default end is rounded up to the minute so repeated loads share a cache key.
+    """
+    end = to or (datetime.utcnow() + timedelta(minutes=1)).replace(second=0, microsecond=0)
+    start, end = checked_range(from_ or end - timedelta(days=30), end)
+    if end - start > timedelta(days=settings.ANALYTICS_MAX_RANGE_DAYS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range is limited to {settings.ANALYTICS_MAX_RANGE_DAYS} days"
+        )
+    return start, end
+
+@router.get("/range")
+@cache.cached("issues")
+async def get_range_stats(
+    from_: datetime = Query(..., alias="from"),
+    to: datetime = Query(...),
+    bucket: Bucket = Query(Bucket.DAY),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Created/closed counts and status/severity levels per bucket, from the hourly rollups."""
+    start, end = checked_range(from_, to)
+
+    try:
+        buckets = await db.run_sync(range_stats, start, end, bucket)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"from": start, "to": end, "bucket": bucket, "buckets": buckets}
+
+@router.get("/time-in-status")
+@cache.cached("issues")
+async def get_time_in_status(
+    window: Tuple[datetime, datetime] = Depends(analytics_range),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Count, total and average hours of status stays that began in the window."""
+    start, end = window
+    return {"from": start, "to": end, "statuses": await db.run_sync(time_in_status, start, end)}
+
+@router.get("/mttr")
+@cache.cached("issues")
+async def get_mttr(
+    window: Tuple[datetime, datetime] = Depends(analytics_range),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Mean time to resolve per severity for issues resolved in the window."""
+    start, end = window
+    return {"from": start, "to": end, "severities": await db.run_sync(mttr_by_severity, start, end)}
+
+@router.get("/throughput")
+@cache.cached("issues")
+async def get_throughput(
+    window: Tuple[datetime, datetime] = Depends(analytics_range),
+    bucket: Bucket = Query(Bucket.WEEK),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Issues created and resolved per day, week or month."""
+    start, end = window
+
+    try:
+        buckets = await db.run_sync(throughput, start, end, bucket)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"from": start, "to": end, "bucket": bucket, "buckets": buckets}
+
+@router.get("/resolution-percentiles")
+@cache.cached("issues")
+async def get_resolution_percentiles(
+    window: Tuple[datetime, datetime] = Depends(analytics_range),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """p50/p90/p99 hours to resolve per severity, merged from the daily sketches."""
+    start, end = window
+    percentiles = await db.run_sync(resolution_percentiles, start.date(), end.date())
+    return {"from": start.date(), "to": end.date(), "severities": percentiles}
+
+@router.post("/rebuild", status_code=202)
+async def rebuild(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_roles(RoleEnum.ADMIN))
+):
+    """Queue a full recount of the daily stats and hourly rollups for app.workers.
+
+    Both are safe under live traffic: the stats rebuild locks today's row
+    first, and the rollups are rebuilt from the event log for settled hours only.
+    Each job invalidates the cached stats once its rebuild has committed.
+    """
+    jobs = [enqueue(db, "rebuild_stats"), enqueue(db, "rebuild_rollups")]
+    await db.commit()
+    return {"jobs": [job.id for job in jobs]}
@@ -1,15 +1,99 @@
-# backend/api/stream.py
-from fastapi import APIRouter
+# backend/app/api/stream.py
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
+from typing import Optional
 import asyncio
+import json
+import logging
+
+from app.core.config import settings
+from app.core.deps import get_current_user_websocket
+from app.core.event_stream import event_stream, may_see
+
+logger = logging.getLogger(__name__)
+router = APIRouter(tags=["stream"])
+
+def format_event(event: dict) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {event['frame']}\n\n"
+
+def resync_event() -> str:
+    """Tells the client to refetch; its next reconnect resumes from the current id."""
+    data = json.dumps({"type": "resync", "last_event_id": event_stream.last_id})
+    return f"id: {event_stream.last_id}\nevent: resync\ndata: {data}\n\n"
 
-router = APIRouter()
+async def event_source(user_id: str, role: str, last_event_id: Optional[int], resync: bool):
+    subscriber = event_stream.subscribe(user_id, role)
+    try:
+        yield f"retry: {settings.SSE_RETRY_MS}\n\n"
 
-async def event_stream():
-	while True:
-		yield f"data: ping\n\n"
-		await asyncio.sleep(5)
+        # Subscribed before replaying, so nothing published meanwhile is missed;
+        # anything both replayed and queued is sent once
+        replayed = set()
+        if resync:
+            yield resync_event()
+        elif last_event_id is not None:
+            events = await event_stream.replay(last_event_id)
+            if events is None:
+                yield resync_event()
+            else:
+                for event in events:
+                    replayed.add(event["id"])
+                    if may_see(subscriber.role, subscriber.user_id, event["issue"].get("created_by")):
+                        yield format_event(event)
+
+        while True:
+            try:
+                async with asyncio.timeout(settings.SSE_KEEPALIVE_SECONDS):
+                    event = await subscriber.queue.get()
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if event is None:  # fell too far behind
+                subscriber.overflowed = False
+                yield resync_event()
+            elif event["id"] not in replayed:
+                yield format_event(event)
+    finally:
+        event_stream.unsubscribe(subscriber)
 
 @router.get("/stream")
-async def stream():
-	return StreamingResponse(event_stream(), media_type="text/event-stream")
+async def stream(
+    token: Optional[str] = Query(None),
+    last_event_id_query: Optional[str] = Query(None, alias="last_event_id"),
+    authorization: Optional[str] = Header(None),
+    last_event_id: Optional[str] = Header(None)
+):
+    """Server-sent issue change events.
+
+    EventSource can't set headers, so the token may come as ?token=. On
+    reconnect the browser sends Last-Event-ID and missed events are replayed;
+    a client further behind than the buffer gets a "resync" event and should
+    refetch the issue list. With SSE_PERSIST_EVENTS a replay can repeat
+    events from just before Last-Event-ID (ids may commit out of order), so
+    clients should ignore event ids they have already applied.
+    """
+    if token is None and authorization and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    try:
+        user = await get_current_user_websocket(token)
+    except Exception as e:
+        logger.error(f"Stream authentication failed: {e}")
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+
+    raw_id = last_event_id or last_event_id_query
+    resume_from, resync = None, False
+    if raw_id:
+        try:
+            resume_from = int(raw_id)
+        except ValueError:
+            resync = True
+
+    return StreamingResponse(
+        event_source(str(user.id), user.role.value, resume_from, resync),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
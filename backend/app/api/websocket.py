@@ -18,18 +18,20 @@ async def websocket_endpoint(
     
     user = None
     user_id = None
+    role = None
     
     # Authenticate user if token provided
     if token:
         try:
             user = await get_current_user_websocket(token)
             user_id = str(user.id) if user else None
+            role = user.role.value if user else None
         except Exception as e:
             logger.error(f"WebSocket authentication failed: {e}")
             await websocket.close(code=1008)  # Policy violation
             return
     
-    await manager.connect(websocket, user_id)
+    await manager.connect(websocket, user_id, role)
     
     try:
         # Send welcome message
@@ -45,9 +47,10 @@ async def websocket_endpoint(
             # Handle ping/pong for connection health
             if data == "ping":
                 await manager.send_personal_message("pong", websocket)
+                continue
             
-            # You can add more message handling here
-            logger.info(f"Received message from {user_id or 'anonymous'}: {data}")
+            # Anything else is a topic (un)subscription request
+            await manager.handle_client_message(websocket, data)
             
     except WebSocketDisconnect:
         manager.disconnect(websocket, user_id)
@@ -0,0 +1,232 @@
+# backend/app/core/cache.py
+
+from fastapi.encoders import jsonable_encoder
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from typing import Awaitable, Callable, Optional
+from app.core.config import settings
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class MemoryBackend:
+    """In-process LRU with per-entry TTL. Each worker process has its own copy."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def _get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value, ttl: Optional[int] = None):
+        self._entries[key] = (time.monotonic() + ttl if ttl else None, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str):
+        return self._get(key)
+
+    async def set(self, key: str, value, ttl: Optional[int] = None):
+        self._set(key, value, ttl)
+
+    async def add(self, key: str, value, ttl: Optional[int] = None) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def incr(self, key: str) -> int:
+        return self.incr_blocking(key)
+
+    def incr_blocking(self, key: str) -> int:
+        value = int(self._get(key) or 0) + 1
+        self._set(key, value)
+        return value
+
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+
+class RedisBackend:
+    """Shared cache on any Redis-protocol server (Redis, Valkey, KeyDB...)."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis  # optional dependency, only needed with REDIS_URL
+        self.url = url
+        self.redis = redis.from_url(url)
+        self._blocking = None
+
+    async def get(self, key: str):
+        return await self.redis.get(key)
+
+    async def set(self, key: str, value, ttl: Optional[int] = None):
+        await self.redis.set(key, value, ex=ttl)
+
+    async def add(self, key: str, value, ttl: Optional[int] = None) -> bool:
+        return bool(await self.redis.set(key, value, ex=ttl, nx=True))
+
+    async def incr(self, key: str) -> int:
+        return await self.redis.incr(key)
+
+    def incr_blocking(self, key: str) -> int:
+        # The asyncio client belongs to the API's event loop; threads get a plain one
+        if self._blocking is None:
+            import redis
+            self._blocking = redis.Redis.from_url(self.url)
+        return self._blocking.incr(key)
+
+    async def delete(self, key: str):
+        await self.redis.delete(key)
+
+def _key_part(value) -> Optional[str]:
+    """Stable text for arguments that identify a response; None for dependencies."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return repr(value)
+    if isinstance(value, Enum):
+        return repr(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (tuple, list)):
+        parts = [_key_part(item) for item in value]
+        return None if None in parts else "(" + ",".join(parts) + ")"
+    return None
+
+class Cache:
+    """JSON response cache with namespace invalidation and single-flight loading.
+
+    Keys embed a per-namespace generation number, so invalidate() is a
+    single increment rather than a key scan. On a miss only one caller per
+    process computes the value (the rest await the same future), and across
+    processes a short backend lock lets one worker compute while the others
+    poll for its result.
+    """
+
+    LOCK_TTL = 10
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, backend, default_ttl: int = 30):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self._inflight = {}
+
+    async def _generation(self, namespace: str) -> str:
+        return str(int(await self.backend.get(f"cache-gen:{namespace}") or 0))
+
+    async def invalidate(self, namespace: str):
+        try:
+            await self.backend.incr(f"cache-gen:{namespace}")
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for {namespace}: {e}")
+
+    def invalidate_blocking(self, namespace: str):
+        """invalidate() for code outside the event loop: queue tasks and scheduler jobs.
+
+        With the in-process backend only this process's entries are dropped;
+        other processes keep theirs until CACHE_TTL_SECONDS runs out.
+        """
+        try:
+            self.backend.incr_blocking(f"cache-gen:{namespace}")
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for {namespace}: {e}")
+
+    async def get_or_compute(self, namespace: str, key: str, compute: Callable[[], Awaitable], ttl: Optional[int] = None):
+        ttl = ttl or self.default_ttl
+        try:
+            full_key = f"cache:{namespace}:{await self._generation(namespace)}:{key}"
+            cached = await self.backend.get(full_key)
+        except Exception as e:
+            logger.warning(f"Cache unavailable, computing directly: {e}")
+            return jsonable_encoder(await compute())
+        if cached is not None:
+            return json.loads(cached)
+
+        inflight = self._inflight.get(full_key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The caller computing it went away; take over below
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[full_key] = future
+        try:
+            value = await self._load(full_key, compute, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; don't log it as unretrieved
+            raise
+        finally:
+            if self._inflight.get(full_key) is future:
+                del self._inflight[full_key]
+
+    async def _load(self, full_key: str, compute, ttl: int):
+        lock_key = f"cache-lock:{full_key}"
+        locked = await self.backend.add(lock_key, "1", self.LOCK_TTL)
+        if not locked:
+            # Another process is computing this key: wait for its result
+            deadline = time.monotonic() + self.LOCK_TTL
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.POLL_INTERVAL)
+                cached = await self.backend.get(full_key)
+                if cached is not None:
+                    return json.loads(cached)
+
+        try:
+            value = jsonable_encoder(await compute())
+            await self.backend.set(full_key, json.dumps(value), ttl)
+            return value
+        finally:
+            if locked:
+                await self.backend.delete(lock_key)
+
+    def cached(self, namespace: str, ttl: Optional[int] = None):
+        """Cache an endpoint's JSON result, keyed by its plain (non-dependency) arguments."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not settings.CACHE_ENABLED:
+                    return await func(*args, **kwargs)
+
+                parts = [f"{name}={part}" for name, part in sorted(
+                    (name, _key_part(value)) for name, value in kwargs.items()
+                ) if part is not None]
+                key = hashlib.sha1(f"{func.__module__}.{func.__qualname__}|{'|'.join(parts)}".encode()).hexdigest()
+                return await self.get_or_compute(namespace, key, lambda: func(*args, **kwargs), ttl)
+
+            return wrapper
+
+        return decorator
+
+def create_cache() -> Cache:
+    backend = None
+    if settings.REDIS_URL:
+        try:
+            backend = RedisBackend(settings.REDIS_URL)
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed; using the in-process cache")
+    return Cache(backend or MemoryBackend(settings.CACHE_MAX_ENTRIES), settings.CACHE_TTL_SECONDS)
+
+cache = create_cache()
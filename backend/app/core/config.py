@@ -7,6 +7,16 @@ import secrets
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql+psycopg2://postgres:postgres@db:5432/tracker"
+    # Serve the issue, dashboard and auth routers from an AsyncSession (asyncpg;
+    # SQLite needs aiosqlite, otherwise they fall back to the threadpool session)
+    USE_ASYNC_DB: bool = False
+    
+    # Connection pool (per process; size for workers * (pool + overflow) <= max_connections)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
     
     # Security
     SECRET_KEY: str = secrets.token_urlsafe(32)
@@ -30,13 +40,83 @@ class Settings(BaseSettings):
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     ]
     
+    # Pagination Configuration
+    ISSUES_PAGE_SIZE: int = 50
+    ISSUES_MAX_PAGE_SIZE: int = 200
+    
+    # Batch mutation Configuration
+    ISSUES_BATCH_MAX_OPERATIONS: int = 500
+    
+    # Export Configuration
+    EXPORT_BATCH_SIZE: int = 1000
+    
     # WebSocket Configuration
     WEBSOCKET_PING_INTERVAL: int = 30
     WEBSOCKET_PING_TIMEOUT: int = 10
+    # Frames buffered per connection before the slow-consumer policy applies
+    WEBSOCKET_SEND_QUEUE_SIZE: int = 256
+    # "drop_oldest": keep the newest frames; "disconnect": also close a client
+    # whose queue stays full for WEBSOCKET_SLOW_CONSUMER_GRACE_SECONDS
+    WEBSOCKET_SLOW_CONSUMER_POLICY: str = "drop_oldest"
+    WEBSOCKET_SLOW_CONSUMER_GRACE_SECONDS: float = 5.0
+    # A single send blocked longer than this closes the connection
+    WEBSOCKET_SEND_TIMEOUT_SECONDS: float = 10.0
+    # Topic subscriptions one connection may hold
+    WEBSOCKET_MAX_TOPICS: int = 100
+    # Issue changes are held this long so repeated changes to one issue go out as one frame
+    WEBSOCKET_COALESCE_MS: int = 50
+    WEBSOCKET_COALESCE_MAX: int = 1000
+    # Relays WebSocket events between worker processes: "redis", "postgres"
+    # (LISTEN/NOTIFY), "none", or "auto" (redis when REDIS_URL is set)
+    PUBSUB_BACKEND: str = "auto"
+    PUBSUB_CHANNEL: str = "issues_tracker_events"
+    # Events published within this window go out as one message
+    PUBSUB_BATCH_MS: int = 10
+    PUBSUB_BATCH_MAX: int = 200
+    
+    # Server-sent events (/api/stream)
+    # Recent events kept in memory for Last-Event-ID replay; clients further behind get "resync"
+    SSE_BUFFER_SIZE: int = 1000
+    # Also keep events in the stream_events table, so replay works across
+    # restarts and workers (ids then come from the table's sequence)
+    SSE_PERSIST_EVENTS: bool = False
+    SSE_EVENT_RETENTION_HOURS: int = 24
+    # Persisted ids are taken at insert but may commit out of order, so a
+    # reconnect also replays events stored this long before Last-Event-ID
+    SSE_REPLAY_LOOKBACK_SECONDS: int = 10
+    # Events waiting for one slow client before it is told to resync
+    SSE_QUEUE_SIZE: int = 256
+    SSE_KEEPALIVE_SECONDS: int = 15
+    SSE_RETRY_MS: int = 3000
     
     # Background Jobs Configuration
     STATS_UPDATE_INTERVAL_MINUTES: int = 30
+    # Most buckets one /api/stats/range response may return
+    STATS_RANGE_MAX_BUCKETS: int = 2000
+    # Widest window the issue_events analytics endpoints accept
+    ANALYTICS_MAX_RANGE_DAYS: int = 366
+    # Relative error of the resolution-time sketches; sketches with different
+    # accuracies can't be merged, so changing it needs a rebuild
+    RESOLUTION_SKETCH_ACCURACY: float = 0.01
     CLEANUP_INTERVAL_HOURS: int = 24
+    HEALTH_CHECK_INTERVAL_MINUTES: int = 5
+    # Where job locks live when the database has no advisory locks (SQLite)
+    SCHEDULER_LOCK_DIR: str = "/tmp/issues-tracker-locks"
+    # Days of job_runs history (and finished queue jobs) kept by the daily cleanup
+    JOB_HISTORY_DAYS: int = 14
+    # Enqueue the scheduled stats/cleanup jobs for `python -m app.workers`
+    # instead of running them in the web process
+    SCHEDULER_USE_QUEUE: bool = False
+    
+    # Job queue / worker Configuration
+    WORKER_CONCURRENCY: int = 4
+    WORKER_USE_PROCESSES: bool = False
+    WORKER_POLL_INTERVAL_SECONDS: float = 1.0
+    # A running job not finished within this is assumed lost and retried
+    JOB_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: int = 10
+    JOB_RETRY_MAX_SECONDS: int = 3600
     
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -54,9 +134,14 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_ID: Optional[str] = None
     GOOGLE_CLIENT_SECRET: Optional[str] = None
     
-    # Redis Configuration (for future caching)
+    # Redis Configuration (shared response cache; in-process cache when unset)
     REDIS_URL: Optional[str] = None
     
+    # Response cache for dashboard/stats endpoints
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: int = 30
+    CACHE_MAX_ENTRIES: int = 1024
+    
     # Monitoring Configuration
     ENABLE_METRICS: bool = True
     METRICS_PATH: str = "/metrics"
@@ -80,6 +165,10 @@ settings = Settings()
 # Derived settings
 DATABASE_URL_ASYNC = settings.DATABASE_URL.replace(
     "postgresql+psycopg2://", "postgresql+asyncpg://"
+).replace(
+    "postgresql://", "postgresql+asyncpg://"
+).replace(
+    "sqlite://", "sqlite+aiosqlite://"
 )
 
 # Environment-specific configurations
@@ -1,10 +1,12 @@
 # backend/app/core/deps.py - Fixed authentication
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User, RoleEnum
 from app.core.config import settings
 
@@ -12,7 +14,7 @@ from app.core.config import settings
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
 # Get the current logged-in user from JWT token
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
     print(f"🔍 Authenticating user with token: {token[:20]}...")
     
     credentials_exception = HTTPException(
@@ -36,19 +38,34 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         raise credentials_exception
 
     # Get user from database
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.scalar(select(User).where(User.email == email))
     if user is None:
         print(f"❌ User not found in database: {email}")
         raise credentials_exception
     
     print(f"✅ User authenticated: {user.email}")
+    
+    # Hand the connection back to the pool until the route actually needs one,
+    # so slow request bodies (uploads) don't pin a pooled connection
+    db.expunge(user)
+    await db.rollback()
     return user
 
 # WebSocket authentication (doesn't use Depends)
-async def get_current_user_websocket(token: str) -> User:
-    """Authenticate user for WebSocket connections."""
+def _user_by_email(email: str):
     from app.db.session import SessionLocal
-    
+
+    db = SessionLocal()
+    try:
+        return db.query(User).filter(User.email == email).first()
+    finally:
+        db.close()
+
+async def get_current_user_websocket(token: str) -> User:
+    """Authenticate user for WebSocket and stream connections.
+
+    The lookup runs in the threadpool so a connect doesn't block the event loop.
+    """
     credentials_exception = Exception("Could not validate credentials")
     
     try:
@@ -59,14 +76,10 @@ async def get_current_user_websocket(token: str) -> User:
     except JWTError:
         raise credentials_exception
 
-    db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.email == email).first()
-        if user is None:
-            raise credentials_exception
-        return user
-    finally:
-        db.close()
+    user = await run_in_threadpool(_user_by_email, email)
+    if user is None:
+        raise credentials_exception
+    return user
 
 # Require a specific role (e.g., ADMIN only)
 def require_role(required_role: RoleEnum):
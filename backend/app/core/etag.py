@@ -0,0 +1,38 @@
+# backend/app/core/etag.py
+
+from fastapi import Response
+from typing import Iterable, Optional
+import hashlib
+
+def weak_etag(*parts) -> str:
+    """Weak validator built from whatever identifies a representation's version."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:24]}"'
+
+def rows_etag(scope: Iterable, rows: Iterable) -> str:
+    """ETag for a list page from its request scope and the (id, updated_at) of each row.
+
+    Any edit bumps an updated_at, and any insert/delete/filter change shifts
+    which ids fall inside the page, so the tag changes exactly when the body would.
+    """
+    return weak_etag(*scope, *(f"{row_id}@{updated_at}" for row_id, updated_at in rows))
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match header (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(opaque(candidate) == opaque(etag) for candidate in if_none_match.split(","))
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
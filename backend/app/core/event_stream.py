@@ -0,0 +1,260 @@
+# backend/app/core/event_stream.py
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+from app.db.session import SessionLocal
+from app.models.stream_event import StreamEvent
+from collections import deque
+from datetime import datetime, timedelta
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, delete, func, insert, or_, select
+from typing import Callable, List, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+SSE_EVENTS = Counter("sse_events_total", "Issue events added to the /api/stream buffer.")
+SSE_REPLAYS = Counter(
+    "sse_replays_total", "Reconnects with Last-Event-ID, by how they were served (buffer, database, resync).",
+    ("source",)
+)
+SSE_OVERFLOWS = Counter("sse_overflows_total", "Stream clients told to resync after their queue filled.")
+
+def may_see(role: Optional[str], user_id: Optional[str], created_by) -> bool:
+    """REPORTERs only get events for issues they created, as in the REST API."""
+    return role != "REPORTER" or (created_by is not None and str(created_by) == user_id)
+
+class Subscriber:
+    """One /api/stream client: a bounded queue of the events it may see.
+
+    A client that lets the queue fill is too far behind to catch up event by
+    event; its queue is replaced by a single None, which the stream turns
+    into a "resync" event.
+    """
+
+    def __init__(self, user_id: str, role: Optional[str]):
+        self.user_id = user_id
+        self.role = role
+        self.queue = asyncio.Queue(maxsize=settings.SSE_QUEUE_SIZE)
+        self.overflowed = False
+
+    def put(self, event: dict):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            SSE_OVERFLOWS.inc()
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+class EventStream:
+    """Issue events numbered for /api/stream, the latest SSE_BUFFER_SIZE kept for replay.
+
+    Events are dicts: {"id", "type", "frame" (the encoded WebSocket message),
+    "issue" (routing fields)}. In memory, ids are assigned per process and
+    start at the process start time in ms * 1000, so an id from an earlier
+    process (a restart) is below this buffer and gets a resync instead of a
+    wrong replay. That is not guaranteed across workers started together: an
+    id from a worker that started less than (its events / 1000) ms before
+    this one can fall inside this buffer and replay the wrong events, so with
+    several workers and no sticky sessions turn SSE_PERSIST_EVENTS on, which
+    gives every worker the same ids. With SSE_PERSIST_EVENTS the publishing
+    process numbers events by inserting them into stream_events and replays
+    come from that table. Its ids are taken at insert but concurrent writers
+    may commit them out of order, so a replay after Last-Event-ID N also
+    repeats events stored up to SSE_REPLAY_LOOKBACK_SECONDS before N; clients
+    drop ids they have already applied.
+    """
+
+    def __init__(self, size: int, persist: bool):
+        self.buffer = deque(maxlen=size)
+        self.persist = persist
+        self.last_id = 0 if persist else int(time.time() * 1000) * 1000
+        # Lowest Last-Event-ID the in-memory buffer can serve
+        self.floor = self.last_id
+        self.subscribers = set()
+        self._pending = []  # (event, relay) waiting to be stored
+        self._persisting = None
+
+    def subscribe(self, user_id: str, role: Optional[str]) -> Subscriber:
+        subscriber = Subscriber(user_id, role)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    def append(self, event: dict):
+        """Buffer a numbered event and queue it for every subscriber who may see it."""
+        if not self.persist:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.floor = max(self.floor, self.buffer[0]["id"])
+            self.buffer.append(event)
+        self.last_id = max(self.last_id, event["id"])
+        SSE_EVENTS.inc()
+
+        created_by = event["issue"].get("created_by")
+        for subscriber in list(self.subscribers):
+            if may_see(subscriber.role, subscriber.user_id, created_by):
+                subscriber.put(event)
+
+    def publish(self, event: dict, relay: Callable[[dict], None]):
+        """Number an event published in this process, buffer it, then pass it to `relay`."""
+        if self.persist:
+            self._pending.append((event, relay))
+            if self._persisting is None:
+                self._persisting = asyncio.create_task(self._persist())
+            return
+
+        event["id"] = self.last_id + 1
+        self.append(event)
+        relay(event)
+
+    def receive(self, event: dict):
+        """Buffer an event relayed from another process."""
+        if not self.persist:
+            self.append({**event, "id": self.last_id + 1})
+        elif event.get("id") is not None:
+            self.append(event)
+
+    async def _persist(self):
+        try:
+            while self._pending:
+                pending, self._pending = self._pending, []
+                events = [event for event, _ in pending]
+                try:
+                    ids = await run_in_threadpool(store_events, events)
+                except Exception as e:
+                    # WebSocket clients still get these; stream clients resync on reconnect
+                    logger.error(f"Storing {len(events)} stream events failed: {e}")
+                    ids = [None] * len(events)
+
+                for (event, relay), event_id in zip(pending, ids):
+                    if event_id is not None:
+                        event["id"] = event_id
+                        self.append(event)
+                    relay(event)
+        finally:
+            self._persisting = None
+
+    async def start(self):
+        """With SSE_PERSIST_EVENTS, continue numbering from the stored events."""
+        if self.persist:
+            last_id = await run_in_threadpool(latest_event_id)
+            if last_id is not None:
+                self.last_id = last_id
+
+    async def drain(self):
+        """Wait for events still being stored (shutdown)."""
+        if self._persisting is not None:
+            await self._persisting
+
+    async def replay(self, last_id: int) -> Optional[List[dict]]:
+        """Events after last_id in id order, or None when they can't all be replayed.
+
+        Persisted replays also include the lookback window before last_id.
+        """
+        if self.persist:
+            lookback = timedelta(seconds=settings.SSE_REPLAY_LOOKBACK_SECONDS)
+            events = await run_in_threadpool(load_events_after, last_id, self.buffer.maxlen, lookback)
+            if events is not None:
+                SSE_REPLAYS.inc(("database",))
+                return events
+        elif self.floor <= last_id <= self.last_id:
+            SSE_REPLAYS.inc(("buffer",))
+            return [event for event in self.buffer if event["id"] > last_id]
+
+        SSE_REPLAYS.inc(("resync",))
+        return None
+
+def store_events(events: List[dict]) -> List[int]:
+    """Insert events into stream_events; returns their ids in the same order."""
+    rows = []
+    for event in events:
+        issue = event["issue"]
+        rows.append({
+            "event_type": event["type"],
+            "issue_id": uuid.UUID(issue["id"]) if issue.get("id") else None,
+            "created_by": uuid.UUID(issue["created_by"]) if issue.get("created_by") else None,
+            "data": event["frame"],
+            "created_at": datetime.utcnow()
+        })
+
+    db = SessionLocal()
+    try:
+        ids = db.scalars(
+            insert(StreamEvent).returning(StreamEvent.id, sort_by_parameter_order=True), rows
+        ).all()
+        db.commit()
+        return ids
+    finally:
+        db.close()
+
+def latest_event_id() -> Optional[int]:
+    db = SessionLocal()
+    try:
+        return db.scalar(select(func.max(StreamEvent.id)))
+    finally:
+        db.close()
+
+def load_events_after(last_id: int, limit: int, lookback: timedelta) -> Optional[List[dict]]:
+    """Stored events after last_id, plus those stored within `lookback` before it.
+
+    The window catches ids below last_id that committed after it. Returns
+    None if some events were pruned or there are more than `limit`.
+    """
+    db = SessionLocal()
+    try:
+        oldest = db.scalar(select(func.min(StreamEvent.id)))
+        if oldest is None or last_id < oldest - 1:
+            return None
+
+        # last_id itself may be a gap in the sequence (a rolled back insert)
+        anchor = db.scalar(
+            select(StreamEvent.created_at).where(StreamEvent.id <= last_id).order_by(StreamEvent.id.desc()).limit(1)
+        )
+        condition = StreamEvent.id > last_id
+        if anchor is not None:
+            condition = or_(
+                condition,
+                and_(StreamEvent.id < last_id, StreamEvent.created_at >= anchor - lookback)
+            )
+
+        rows = db.execute(
+            select(StreamEvent.id, StreamEvent.event_type, StreamEvent.created_by, StreamEvent.data)
+            .where(condition)
+            .order_by(StreamEvent.id)
+            .limit(limit + 1)
+        ).all()
+        if len(rows) > limit:
+            return None
+        return [
+            {
+                "id": row.id, "type": row.event_type, "frame": row.data,
+                "issue": {"created_by": str(row.created_by) if row.created_by else None}
+            }
+            for row in rows
+        ]
+    finally:
+        db.close()
+
+def prune_stream_events() -> int:
+    """Drop stored stream events older than SSE_EVENT_RETENTION_HOURS."""
+    db = SessionLocal()
+    try:
+        cutoff = datetime.utcnow() - timedelta(hours=settings.SSE_EVENT_RETENTION_HOURS)
+        deleted = db.execute(delete(StreamEvent).where(StreamEvent.created_at < cutoff)).rowcount
+        db.commit()
+        return deleted
+    finally:
+        db.close()
+
+event_stream = EventStream(settings.SSE_BUFFER_SIZE, settings.SSE_PERSIST_EVENTS)
+
+Gauge("sse_subscribers", "Open /api/stream connections in this process.", lambda: len(event_stream.subscribers))
@@ -0,0 +1,236 @@
+# backend/app/core/metrics.py
+
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Optional, Sequence
+import threading
+import time
+
+# Per-process registry, like /health/db: under several workers each process
+# reports its own series and a scrape sees whichever worker answered.
+REGISTRY = []
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def samples(self):
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(f"{name}{labels} {_number(value)}" for name, labels, value in self.samples())
+        return "\n".join(lines)
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = list(self._values.items())
+        return [(self.name, _labels(self.labelnames, labels), value) for labels, value in values]
+
+class Gauge(Metric):
+    """Gauge read from `callback` at scrape time, so nothing is updated on the hot path."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float]):
+        super().__init__(name, documentation)
+        self.callback = callback
+
+    def samples(self):
+        return [(self.name, "", self.callback())]
+
+class Histogram(Metric):
+    """Bucketed observations; each observe() is a bisect plus two additions.
+
+    observe() takes a lock because queries are timed from threadpool threads.
+    Metrics only ever updated on the event loop thread (the HTTP middleware)
+    use _observe() directly and skip it.
+    """
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}  # labels -> [per-bucket counts (+Inf last), sum]
+
+    def observe(self, value: float, labels: tuple = ()):
+        with self._lock:
+            self._observe(value, labels)
+
+    def _observe(self, value: float, labels: tuple):
+        series = self.series(labels)
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def series(self, labels: tuple) -> list:
+        """The [per-bucket counts, sum] of one label set, created on first use."""
+        series = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        return series
+
+    def samples(self):
+        with self._lock:
+            values = [(labels, list(counts), total) for labels, (counts, total) in self._values.items()]
+
+        samples = []
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                samples.append((f"{self.name}_bucket", _labels(self.labelnames, labels, le), cumulative))
+            samples.append((f"{self.name}_sum", _labels(self.labelnames, labels), total))
+            samples.append((f"{self.name}_count", _labels(self.labelnames, labels), cumulative))
+        return samples
+
+def render_metrics() -> str:
+    """Every registered metric in the Prometheus text exposition format (0.0.4)."""
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# HTTP
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.",
+    ("method", "route", "status")
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "Database queries issued per HTTP request.",
+    ("route",), buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds", "Time spent in database queries per HTTP request.", ("route",)
+)
+
+# Database
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "Duration of individual database queries.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+)
+
+# Scheduler
+
+JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds", "Scheduled job run time by outcome.",
+    ("job", "outcome"), buckets=(0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+)
+
+class RequestStats:
+    """Database activity of the request being served (see current_request)."""
+
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+# Copied into threadpool calls, so ThreadpoolSession queries are attributed too
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+def instrument_engine(engine):
+    """Time every query on `engine` (a sync Engine, or an AsyncEngine's sync_engine)."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+        DB_QUERY_DURATION.observe(elapsed)
+        stats = current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and database use per route template.
+
+    Routes are labelled by their template (/api/issues/{issue_id}), never the
+    raw path, so label cardinality stays bounded; unmatched paths share one label.
+    The three histogram series of each (method, route, status) are looked up
+    once and then updated in place, one dict lookup per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._series = {}
+
+    def _request_series(self, key: tuple) -> tuple:
+        route = key[1]
+        series = self._series[key] = (
+            REQUEST_DURATION.series(key),
+            REQUEST_DB_QUERIES.series((route,)),
+            REQUEST_DB_SECONDS.series((route,)),
+        )
+        return series
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = RequestStats()
+        token = current_request.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request.reset(token)
+            route = scope.get("route")
+            key = (scope["method"], getattr(route, "path", None) or "unmatched", status)
+            duration, queries, db_seconds = self._series.get(key) or self._request_series(key)
+            # Event loop thread only, so no locking (see Histogram)
+            duration[0][bisect_left(REQUEST_DURATION.buckets, elapsed)] += 1
+            duration[1] += elapsed
+            queries[0][bisect_left(REQUEST_DB_QUERIES.buckets, stats.queries)] += 1
+            queries[1] += stats.queries
+            db_seconds[0][bisect_left(REQUEST_DB_SECONDS.buckets, stats.db_seconds)] += 1
+            db_seconds[1] += stats.db_seconds
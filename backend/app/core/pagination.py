@@ -0,0 +1,42 @@
+# backend/app/core/pagination.py
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from datetime import datetime
+from typing import Tuple
+import base64
+import json
+import uuid
+
+
+def encode_cursor(created_at: datetime, issue_id) -> str:
+    """Build an opaque cursor from the (created_at, id) sort key of the last row."""
+    raw = json.dumps([created_at.isoformat(), str(issue_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor, rejecting anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, issue_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(issue_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def apply_keyset(query, created_at_column, id_column, cursor: str = None):
+    """Order newest first and seek past the cursor instead of using OFFSET.
+
+    The row-value comparison lets the database walk a (created_at, id) index
+    directly, so every page costs the same no matter how deep the client is.
+    """
+    if cursor:
+        created_at, issue_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(created_at_column, id_column) < tuple_(created_at, issue_id)
+        )
+    return query.order_by(created_at_column.desc(), id_column.desc())
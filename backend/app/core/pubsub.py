@@ -0,0 +1,232 @@
+# backend/app/core/pubsub.py
+
+from app.core.config import settings, DATABASE_URL_ASYNC
+from app.core.metrics import Counter, Histogram
+from typing import Awaitable, Callable, Optional
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_LATENCY = Histogram(
+    "pubsub_delivery_latency_seconds", "Time from publishing an event to delivering it in another process.",
+    ("backend",), buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+PUBLISHED_BATCHES = Counter("pubsub_published_batches_total", "Event batches published.", ("backend",))
+PUBLISH_FAILURES = Counter("pubsub_publish_failures_total", "Event batches that could not be published.", ("backend",))
+RECEIVED_EVENTS = Counter("pubsub_received_events_total", "Events received from other processes.", ("backend",))
+
+class RedisBackbone:
+    """Pub/sub on any Redis-protocol server (Redis, Valkey, KeyDB...)."""
+
+    name = "redis"
+    max_payload = None
+
+    def __init__(self, url: str, channel: str):
+        import redis.asyncio as redis  # optional dependency, only needed with REDIS_URL
+        self.redis = redis.from_url(url)
+        self.channel = channel
+
+    async def publish(self, payload: str):
+        await self.redis.publish(self.channel, payload)
+
+    async def listen(self, callback: Callable[[str], Awaitable]):
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    await callback(message["data"])
+        finally:
+            await pubsub.aclose()
+
+    async def close(self):
+        await self.redis.aclose()
+
+class PostgresBackbone:
+    """LISTEN/NOTIFY on the application database; no extra infrastructure."""
+
+    name = "postgres"
+    # NOTIFY payloads must stay under 8000 bytes
+    max_payload = 7900
+
+    def __init__(self, dsn: str, channel: str):
+        import asyncpg
+        self.asyncpg = asyncpg
+        self.dsn = dsn
+        self.channel = channel
+        self._publisher = None
+        # One asyncpg connection runs one query at a time, and overlapping
+        # flushes must not both open it
+        self._publish_lock = asyncio.Lock()
+
+    async def publish(self, payload: str):
+        async with self._publish_lock:
+            if self._publisher is None or self._publisher.is_closed():
+                self._publisher = await self.asyncpg.connect(self.dsn)
+            await self._publisher.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    async def listen(self, callback: Callable[[str], Awaitable]):
+        connection = await self.asyncpg.connect(self.dsn)
+        payloads = asyncio.Queue()
+        try:
+            await connection.add_listener(self.channel, lambda conn, pid, channel, payload: payloads.put_nowait(payload))
+            connection.add_termination_listener(lambda conn: payloads.put_nowait(None))
+            while True:
+                payload = await payloads.get()
+                if payload is None:
+                    raise ConnectionError("LISTEN connection closed")
+                await callback(payload)
+        finally:
+            await connection.close()
+
+    async def close(self):
+        async with self._publish_lock:
+            if self._publisher is not None:
+                await self._publisher.close()
+                self._publisher = None
+
+class Relay:
+    """Relays events between processes over a backbone.
+
+    publish() only appends to a pending batch; the batch is sent after
+    PUBSUB_BATCH_MS (or at PUBSUB_BATCH_MAX events) as one message. The
+    publishing process has already delivered its own events locally, so it
+    drops batches carrying its own origin when they come back.
+    """
+
+    RECONNECT_MAX_SECONDS = 30
+
+    def __init__(self, backbone, deliver: Callable[[dict], Awaitable]):
+        self.backbone = backbone
+        self.deliver = deliver
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.pending = []
+        self._flush_handle = None
+        self._listen_task = None
+        self._flushes = set()
+
+    def publish(self, event: dict):
+        self.pending.append({**event, "sent_at": time.time()})
+        if len(self.pending) >= settings.PUBSUB_BATCH_MAX:
+            self._schedule_flush(0)
+        elif self._flush_handle is None:
+            self._schedule_flush(settings.PUBSUB_BATCH_MS / 1000)
+
+    def _schedule_flush(self, delay: float):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = asyncio.get_running_loop().call_later(delay, self._start_flush)
+
+    def _start_flush(self):
+        self._flush_handle = None
+        task = asyncio.create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    def _payloads(self, events: list):
+        """Serialized batches, split so each fits the backbone's payload limit."""
+        limit = self.backbone.max_payload
+        head, tail = f'{{"origin": {json.dumps(self.origin)}, "events": [', "]}"
+        chunk, size = [], len(head) + len(tail)
+        for event in events:
+            encoded = json.dumps(event, default=str)
+            encoded_size = len(encoded.encode()) + 2
+            if limit is not None and len(head) + len(tail) + encoded_size > limit:
+                logger.warning(f"Event too large for {self.backbone.name} pub/sub; not relayed")
+                continue
+            if limit is not None and chunk and size + encoded_size > limit:
+                yield head + ", ".join(chunk) + tail
+                chunk, size = [], len(head) + len(tail)
+            chunk.append(encoded)
+            size += encoded_size
+        if chunk:
+            yield head + ", ".join(chunk) + tail
+
+    async def flush(self):
+        events, self.pending = self.pending, []
+        for payload in self._payloads(events):
+            try:
+                await self.backbone.publish(payload)
+                PUBLISHED_BATCHES.inc((self.backbone.name,))
+            except Exception as e:
+                PUBLISH_FAILURES.inc((self.backbone.name,))
+                logger.error(f"Publishing events over {self.backbone.name} failed: {e}")
+
+    async def _receive(self, payload):
+        batch = json.loads(payload)
+        if batch.get("origin") == self.origin:
+            return
+
+        now = time.time()
+        for event in batch.get("events", []):
+            DELIVERY_LATENCY.observe(max(now - event.pop("sent_at", now), 0.0), (self.backbone.name,))
+            RECEIVED_EVENTS.inc((self.backbone.name,))
+            try:
+                await self.deliver(event)
+            except Exception as e:
+                logger.error(f"Delivering relayed event failed: {e}")
+
+    async def _listen(self):
+        delay = 1
+        while True:
+            try:
+                await self.backbone.listen(self._receive)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"{self.backbone.name} pub/sub listener stopped ({e}); retrying in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_SECONDS)
+
+    async def start(self):
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await self.flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            await asyncio.gather(self._listen_task, return_exceptions=True)
+        await self.backbone.close()
+
+def create_backbone():
+    """Backbone from PUBSUB_BACKEND; "auto" picks Redis when REDIS_URL is set, else none."""
+    backend = settings.PUBSUB_BACKEND
+    if backend == "auto":
+        backend = "redis" if settings.REDIS_URL else "none"
+
+    try:
+        if backend == "redis":
+            return RedisBackbone(settings.REDIS_URL, settings.PUBSUB_CHANNEL)
+        if backend == "postgres":
+            return PostgresBackbone(DATABASE_URL_ASYNC.replace("postgresql+asyncpg://", "postgresql://"), settings.PUBSUB_CHANNEL)
+    except ImportError as e:
+        logger.warning(f"Pub/sub backend {backend} unavailable ({e}); WebSocket events stay in-process")
+    return None
+
+async def start_relay(manager) -> Optional[Relay]:
+    """Connect `manager` to the other processes, if a backbone is configured."""
+    backbone = create_backbone()
+    if backbone is None:
+        return None
+
+    relay = Relay(backbone, manager.deliver_relayed)
+    await relay.start()
+    manager.relay = relay
+    logger.info(f"WebSocket events relayed over {backbone.name} as {relay.origin}")
+    return relay
+
+async def stop_relay(manager):
+    if manager.relay is not None:
+        relay, manager.relay = manager.relay, None
+        await relay.stop()
@@ -0,0 +1,87 @@
+# backend/app/core/sketch.py
+
+from collections import Counter
+from typing import Optional
+import math
+
+class DDSketch:
+    """Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Positive values fall into logarithmic buckets (gamma^(i-1), gamma^i], so
+    any quantile is returned within `relative_accuracy` of the true value.
+    Two sketches with the same accuracy merge by adding bucket counts, which
+    is what makes per-day sketches combinable over any date range.
+    """
+
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins = Counter()
+        self.zero_count = 0
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float, weight: int = 1):
+        if value < 0:
+            raise ValueError("DDSketch only accepts non-negative values")
+        if value < self.MIN_VALUE:
+            self.zero_count += weight
+        else:
+            self.bins[math.ceil(math.log(value) / self._log_gamma)] += weight
+        self.count += weight
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "DDSketch"):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.bins.update(other.bins)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        running = self.zero_count
+        if running > rank:
+            return 0.0
+        for index in sorted(self.bins):
+            running += self.bins[index]
+            if running > rank:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": {str(index): count for index, count in self.bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DDSketch":
+        sketch = cls(data["relative_accuracy"])
+        sketch.bins = Counter({int(index): count for index, count in data["bins"].items()})
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        return sketch
@@ -1,104 +1,349 @@
 # backend/app/core/websocket.py
 
 from fastapi import WebSocket
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
+from collections import deque
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge, Histogram
+from app.core.issue_events import IssueEventBuffer
+from app.core.event_stream import event_stream, may_see
+import asyncio
 import json
 import logging
+import time
+import uuid
 
 logger = logging.getLogger(__name__)
 
+BROADCAST_DURATION = Histogram(
+    "websocket_broadcast_duration_seconds", "Time to queue one message for all its connections.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+)
+SEND_FAILURES = Counter("websocket_send_failures_total", "WebSocket sends that raised or timed out.")
+DROPPED_FRAMES = Counter("websocket_dropped_frames_total", "Frames dropped from full send queues.")
+SLOW_CONSUMER_DISCONNECTS = Counter(
+    "websocket_slow_consumer_disconnects_total", "Connections closed for not keeping up."
+)
+
+# Close code for clients dropped for falling behind ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+class Connection:
+    """One WebSocket with its own bounded outbound queue and sender task.
+
+    send() only queues, so a client on a slow network delays nobody but
+    itself. When the queue is full the oldest frame is dropped; with the
+    "disconnect" policy a queue that stays full for the grace period, or a
+    single send that blocks past the send timeout, closes the connection.
+    """
+
+    def __init__(self, websocket: WebSocket, user_id: Optional[str] = None, role: Optional[str] = None, on_close=None):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.role = role
+        self.queue = deque()
+        self.max_queue = settings.WEBSOCKET_SEND_QUEUE_SIZE
+        self.disconnect_when_full = settings.WEBSOCKET_SLOW_CONSUMER_POLICY == "disconnect"
+        self.full_since = None
+        self.closed = False
+        self.topics = set()
+        self._on_close = on_close
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._sender())
+
+    def send(self, frame: str):
+        """Queue a frame for delivery without waiting for it."""
+        if self.closed:
+            return
+
+        if len(self.queue) >= self.max_queue:
+            now = time.monotonic()
+            if self.full_since is None:
+                self.full_since = now
+            elif self.disconnect_when_full and now - self.full_since >= settings.WEBSOCKET_SLOW_CONSUMER_GRACE_SECONDS:
+                SLOW_CONSUMER_DISCONNECTS.inc()
+                logger.warning(f"Closing slow WebSocket consumer {self.user_id or 'anonymous'}")
+                self.close(SLOW_CONSUMER_CLOSE_CODE)
+                return
+            self.queue.popleft()
+            DROPPED_FRAMES.inc()
+
+        self.queue.append(frame)
+        self._ready.set()
+
+    async def _sender(self):
+        try:
+            while True:
+                if not self.queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                frame = self.queue.popleft()
+                self.full_since = None
+                # asyncio.timeout rather than wait_for, which on 3.11 can swallow
+                # close()'s cancel when the send finishes at the same moment
+                async with asyncio.timeout(settings.WEBSOCKET_SEND_TIMEOUT_SECONDS):
+                    await self.websocket.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            SEND_FAILURES.inc()
+            logger.error(f"Error sending to WebSocket {self.user_id or 'anonymous'}: {e!r}")
+            self.close(SLOW_CONSUMER_CLOSE_CODE if isinstance(e, asyncio.TimeoutError) else 1011)
+
+    def close(self, code: Optional[int] = None):
+        """Stop sending and drop queued frames; with `code`, also close the socket."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.clear()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+        if code is not None:
+            asyncio.create_task(self._close_socket(code))
+        if self._on_close is not None:
+            self._on_close(self)
+
+    async def _close_socket(self, code: int):
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass  # already gone
+
+# Topics a client can subscribe to over /ws
+ISSUES_TOPIC = "issues"           # every issue event the user may see (default)
+MINE_TOPIC = "mine"               # issues the user created or is assigned to
+ISSUE_TOPIC_PREFIX = "issue:"     # issue:<uuid>
+SEVERITY_TOPIC_PREFIX = "severity:"  # severity:<LOW|MEDIUM|HIGH|CRITICAL>
+
+SEVERITIES = {"LOW", "MEDIUM", "HIGH", "CRITICAL"}
+
+# Issue fields issue_recipients() routes on; all a relayed event needs besides its frame
+ROUTING_FIELDS = ("id", "severity", "created_by", "assigned_to")
+
+def topic_key(topic, user_id: Optional[str]) -> Optional[str]:
+    """Registry key for a client topic, or None if it isn't valid for this user.
+
+    "mine" is stored per user (mine:<user_id>) so fan-out can look up an
+    issue's creator and assignee directly.
+    """
+    if not isinstance(topic, str):
+        return None
+    if topic == ISSUES_TOPIC:
+        return topic
+    if topic == MINE_TOPIC:
+        return f"{MINE_TOPIC}:{user_id}" if user_id else None
+    if topic.startswith(ISSUE_TOPIC_PREFIX):
+        try:
+            return ISSUE_TOPIC_PREFIX + str(uuid.UUID(topic[len(ISSUE_TOPIC_PREFIX):]))
+        except ValueError:
+            return None
+    if topic.startswith(SEVERITY_TOPIC_PREFIX):
+        severity = topic[len(SEVERITY_TOPIC_PREFIX):].upper()
+        return SEVERITY_TOPIC_PREFIX + severity if severity in SEVERITIES else None
+    return None
+
 class ConnectionManager:
+    """Registry of open connections: per socket, per user and per topic.
+
+    Everything is a dict or set, so connect, disconnect and subscription
+    changes cost O(1) (plus the connection's own topics on disconnect), and
+    an issue event only visits the subscribers of its topics.
+    """
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.user_connections: Dict[str, List[WebSocket]] = {}
+        self.connections: Dict[WebSocket, Connection] = {}
+        self.user_connections: Dict[str, Set[Connection]] = {}
+        self.subscribers: Dict[str, Set[Connection]] = {}
+        # Cross-process fan-out (app.core.pubsub), set at startup when configured
+        self.relay = None
+        self.events = IssueEventBuffer(self.publish_frame)
+
+    @property
+    def active_connections(self):
+        return self.connections.keys()
 
-    async def connect(self, websocket: WebSocket, user_id: str = None):
+    async def connect(self, websocket: WebSocket, user_id: str = None, role: Optional[str] = None):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        
+        connection = Connection(
+            websocket, user_id, role, on_close=lambda connection: self.disconnect(connection.websocket)
+        )
+        self.connections[websocket] = connection
+
         if user_id:
-            if user_id not in self.user_connections:
-                self.user_connections[user_id] = []
-            self.user_connections[user_id].append(websocket)
-        
-        logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+            self.user_connections.setdefault(user_id, set()).add(connection)
+            # Authenticated clients get every issue event they may see until they narrow it down
+            self.subscribe(connection, [ISSUES_TOPIC])
+
+        logger.info(f"WebSocket connected. Total connections: {len(self.connections)}")
 
     def disconnect(self, websocket: WebSocket, user_id: str = None):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        
-        if user_id and user_id in self.user_connections:
-            if websocket in self.user_connections[user_id]:
-                self.user_connections[user_id].remove(websocket)
-            if not self.user_connections[user_id]:
-                del self.user_connections[user_id]
-        
-        logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
+        connection = self.connections.pop(websocket, None)
+        if connection is None:
+            return  # already removed (the sender closed it, or a second disconnect)
+        connection.close()
+
+        for key in connection.topics:
+            subscribers = self.subscribers.get(key)
+            if subscribers is not None:
+                subscribers.discard(connection)
+                if not subscribers:
+                    del self.subscribers[key]
+
+        if connection.user_id in self.user_connections:
+            self.user_connections[connection.user_id].discard(connection)
+            if not self.user_connections[connection.user_id]:
+                del self.user_connections[connection.user_id]
+
+        logger.info(f"WebSocket disconnected. Total connections: {len(self.connections)}")
+
+    def subscribe(self, connection: Connection, topics) -> List[str]:
+        """Add topics to a connection; returns the ones that were invalid."""
+        invalid = []
+        for topic in topics:
+            key = topic_key(topic, connection.user_id)
+            if key is None:
+                invalid.append(topic)
+            elif key not in connection.topics:
+                if len(connection.topics) >= settings.WEBSOCKET_MAX_TOPICS:
+                    invalid.append(topic)
+                    continue
+                connection.topics.add(key)
+                self.subscribers.setdefault(key, set()).add(connection)
+        return invalid
+
+    def unsubscribe(self, connection: Connection, topics):
+        for topic in topics:
+            key = topic_key(topic, connection.user_id)
+            if key in connection.topics:
+                connection.topics.discard(key)
+                subscribers = self.subscribers[key]
+                subscribers.discard(connection)
+                if not subscribers:
+                    del self.subscribers[key]
+
+    async def handle_client_message(self, websocket: WebSocket, data: str):
+        """Apply a subscription message from the /ws receive loop.
+
+        {"action": "subscribe" | "unsubscribe", "topics": ["issue:<id>", "severity:HIGH", "mine"]}
+        is answered with the connection's current topics, or an error frame.
+        """
+        connection = self.connections.get(websocket)
+        if connection is None:
+            return
 
-    async def send_personal_message(self, message: str, websocket: WebSocket):
         try:
-            await websocket.send_text(message)
-        except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
+            request = json.loads(data)
+            action, topics = request["action"], request["topics"]
+            if action not in ("subscribe", "unsubscribe") or not isinstance(topics, list):
+                raise ValueError
+        except (ValueError, KeyError, TypeError):
+            connection.send(json.dumps({"type": "error", "message": "Expected {\"action\": \"subscribe\"|\"unsubscribe\", \"topics\": [...]}"}))
+            return
+
+        if not connection.user_id:
+            connection.send(json.dumps({"type": "error", "message": "Subscriptions require a token"}))
+            return
+
+        invalid = []
+        if action == "subscribe":
+            invalid = self.subscribe(connection, topics)
+        else:
+            self.unsubscribe(connection, topics)
+
+        connection.send(json.dumps({
+            "type": "subscriptions",
+            "topics": sorted(MINE_TOPIC if key.startswith(MINE_TOPIC + ":") else key for key in connection.topics),
+            "invalid": invalid
+        }))
+
+    async def send_personal_message(self, message: str, websocket: WebSocket):
+        connection = self.connections.get(websocket)
+        if connection is not None:
+            connection.send(message)
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        if self.active_connections:
+        """Queue a message for all connected clients; returns without waiting for delivery."""
+        if self.connections:
+            started = time.perf_counter()
             message_str = json.dumps(message)
-            disconnected = []
-            
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(message_str)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to connection: {e}")
-                    disconnected.append(connection)
-            
-            # Remove disconnected connections
-            for connection in disconnected:
-                self.disconnect(connection)
+
+            for connection in list(self.connections.values()):
+                connection.send(message_str)
+
+            BROADCAST_DURATION.observe(time.perf_counter() - started)
 
     async def broadcast_to_user(self, message: dict, user_id: str):
-        """Broadcast message to specific user's connections."""
+        """Queue a message for a specific user's connections."""
         if user_id in self.user_connections:
             message_str = json.dumps(message)
-            disconnected = []
-            
-            for connection in self.user_connections[user_id]:
-                try:
-                    await connection.send_text(message_str)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to user {user_id}: {e}")
-                    disconnected.append(connection)
-            
-            # Remove disconnected connections
-            for connection in disconnected:
-                self.disconnect(connection, user_id)
+
+            for connection in list(self.user_connections[user_id]):
+                connection.send(message_str)
+
+    def issue_recipients(self, issue_data: dict) -> Set[Connection]:
+        """Subscribers of any of the issue's topics that are allowed to see it.
+
+        REPORTERs only receive events for issues they created (as in the REST
+        API), and anonymous connections receive no issue events.
+        """
+        created_by = issue_data.get("created_by")
+        keys = [ISSUES_TOPIC]
+        if issue_data.get("id") is not None:
+            keys.append(f"{ISSUE_TOPIC_PREFIX}{issue_data['id']}")
+        if issue_data.get("severity") is not None:
+            keys.append(f"{SEVERITY_TOPIC_PREFIX}{issue_data['severity']}")
+        for owner in {created_by, issue_data.get("assigned_to")} - {None}:
+            keys.append(f"{MINE_TOPIC}:{owner}")
+
+        recipients = set()
+        for key in keys:
+            recipients.update(self.subscribers.get(key, ()))
+
+        return {connection for connection in recipients if may_see(connection.role, connection.user_id, created_by)}
+
+    def deliver_frame(self, frame: str, issue_data: dict):
+        """Queue an encoded issue event for each local subscriber who may see the issue."""
+        started = time.perf_counter()
+        for connection in self.issue_recipients(issue_data):
+            connection.send(frame)
+        BROADCAST_DURATION.observe(time.perf_counter() - started)
+
+    def publish_frame(self, kind: str, frame: str, issue_data: dict):
+        """Deliver an encoded issue event here, then add it to /api/stream, which relays it."""
+        self.deliver_frame(frame, issue_data)
+        routing = {field: issue_data.get(field) for field in ROUTING_FIELDS}
+        event_stream.publish({"type": kind, "frame": frame, "issue": routing}, self.relay_event)
+
+    def relay_event(self, event: dict):
+        """Pass an event on to every other process (once /api/stream has numbered it)."""
+        if self.relay is not None:
+            self.relay.publish(event)
+
+    async def deliver_relayed(self, event: dict):
+        """Relay callback for events published by another process."""
+        self.deliver_frame(event["frame"], event["issue"])
+        event_stream.receive(event)
 
     async def notify_issue_created(self, issue_data: dict):
-        """Notify all users about new issue creation."""
-        await self.broadcast({
-            "type": "issue_created",
-            "data": issue_data,
-            "timestamp": issue_data.get("created_at")
-        })
+        """Notify subscribers about new issue creation (coalesced, see IssueEventBuffer)."""
+        self.events.add("issue_created", issue_data)
 
     async def notify_issue_updated(self, issue_data: dict, updated_by: str):
-        """Notify all users about issue updates."""
-        await self.broadcast({
-            "type": "issue_updated",
-            "data": issue_data,
-            "updated_by": updated_by,
-            "timestamp": issue_data.get("updated_at")
-        })
-
-    async def notify_issue_deleted(self, issue_id: str, deleted_by: str):
-        """Notify all users about issue deletion."""
-        await self.broadcast({
-            "type": "issue_deleted",
-            "issue_id": issue_id,
-            "deleted_by": deleted_by
-        })
+        """Notify subscribers about issue updates."""
+        self.events.add("issue_updated", issue_data, updated_by)
+
+    async def notify_issue_deleted(self, issue_data: dict, deleted_by: str):
+        """Notify subscribers about issue deletion."""
+        self.events.add("issue_deleted", issue_data, deleted_by)
 
 # Global connection manager instance
-manager = ConnectionManager()
\ No newline at end of file
+manager = ConnectionManager()
+
+Gauge("websocket_connections", "Open WebSocket connections in this process.",
+      lambda: len(manager.active_connections))
+Gauge("websocket_connected_users", "Distinct users with an open WebSocket in this process.",
+      lambda: len(manager.user_connections))
+Gauge("websocket_queued_frames", "Frames waiting in WebSocket send queues.",
+      lambda: sum(len(connection.queue) for connection in list(manager.connections.values())))
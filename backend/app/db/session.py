@@ -1,14 +1,38 @@
 # app/db/session.py
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
-from app.core.config import settings
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings, DATABASE_URL_ASYNC
+from app.db.pool import engine_options
+import logging
+
+logger = logging.getLogger(__name__)
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+
+# Plain sessionmaker: sessions are per request/job, and a Session only checks a
+# connection out of the pool when it first runs a statement
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def create_async_db_engine():
+    """Async engine (asyncpg, or aiosqlite for SQLite) only when enabled, so the driver stays optional."""
+    if not settings.USE_ASYNC_DB:
+        return None
+    try:
+        return create_async_engine(DATABASE_URL_ASYNC, **engine_options(DATABASE_URL_ASYNC, async_engine=True))
+    except ImportError as e:
+        logger.warning(f"USE_ASYNC_DB is set but the async driver is not installed ({e}); using the threadpool session")
+        return None
+
+async_engine = create_async_db_engine()
 
-SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+) if async_engine is not None else None
 
 def get_db():
     db = SessionLocal()
@@ -16,3 +40,75 @@ def get_db():
         yield db
     finally:
         db.close()
+
+class ThreadpoolSession:
+    """Awaitable facade over a sync Session with the AsyncSession methods the routers use.
+
+    Each database call runs in Starlette's threadpool, which is exactly what the
+    sync routes did before, so async routes work unchanged when USE_ASYNC_DB is off.
+    """
+
+    def __init__(self, sync_session):
+        self.sync_session = sync_session
+
+    def get_bind(self):
+        return self.sync_session.get_bind()
+
+    def expunge(self, instance):
+        self.sync_session.expunge(instance)
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+    def add_all(self, instances):
+        self.sync_session.add_all(instances)
+
+    async def execute(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.execute, statement, params, **kwargs)
+
+    async def scalars(self, statement, params=None, **kwargs):
+        return (await self.execute(statement, params, **kwargs)).scalars()
+
+    async def scalar(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalar, statement, params, **kwargs)
+
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+
+    async def delete(self, instance):
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self):
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def refresh(self, instance, attribute_names=None):
+        await run_in_threadpool(self.sync_session.refresh, instance, attribute_names)
+
+    async def commit(self):
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self):
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+    async def close(self):
+        await run_in_threadpool(self.sync_session.close)
+
+async def get_async_db():
+    """Session for async routes.
+
+    With USE_ASYNC_DB (and its driver installed) an AsyncSession on the async
+    engine, otherwise a ThreadpoolSession over a regular sync Session.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
+    db = ThreadpoolSession(SessionLocal())
+    try:
+        yield db
+    finally:
+        await db.close()
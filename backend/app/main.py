@@ -2,7 +2,7 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
@@ -10,7 +10,8 @@ import logging
 import os
 
 # Import existing routers
-from app.api import auth, issue, dashboard
+from app.api import auth, issue, dashboard, stats, stream
+from app.core.config import settings
 
 # Configure logging
 logging.basicConfig(
@@ -39,10 +40,23 @@ async def lifespan(app: FastAPI):
     os.makedirs("uploads", exist_ok=True)
     logger.info("Upload directory ensured")
     
+    # Live issue events: /api/stream numbering, and the relay to other worker processes (optional)
+    from app.core.websocket import manager
+    from app.core.event_stream import event_stream
+    from app.core.pubsub import start_relay, stop_relay
+    try:
+        await event_stream.start()
+        await start_relay(manager)
+    except Exception as e:
+        logger.warning(f"Failed to start live issue events: {e}")
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Issues & Insights Tracker...")
+    manager.events.flush()
+    await event_stream.drain()
+    await stop_relay(manager)
 
 # Create FastAPI app
 app = FastAPI(
@@ -68,8 +82,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# Request latency and per-request database use, served at METRICS_PATH
+if settings.ENABLE_METRICS:
+    from app.core.metrics import MetricsMiddleware, instrument_engine, render_metrics, CONTENT_TYPE
+    from app.db.session import engine, async_engine
+    
+    app.add_middleware(MetricsMiddleware)
+    instrument_engine(engine)
+    if async_engine is not None:
+        instrument_engine(async_engine.sync_engine)
+    
+    @app.get(settings.METRICS_PATH, include_in_schema=False)
+    async def metrics():
+        """Prometheus scrape endpoint for this worker process.
+        
+        Async on purpose: rendering on the event loop can't race the middleware's unlocked updates.
+        """
+        return Response(render_metrics(), media_type=CONTENT_TYPE)
+
 # Mount static files for file uploads (only if directory exists)
 if os.path.exists("uploads"):
     app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
@@ -78,6 +111,8 @@ if os.path.exists("uploads"):
 app.include_router(auth.router, prefix="/api")
 app.include_router(issue.router, prefix="/api")
 app.include_router(dashboard.router, prefix="/api")
+app.include_router(stats.router, prefix="/api")
+app.include_router(stream.router, prefix="/api")
 
 # Try to include websocket router if it exists
 try:
@@ -102,15 +137,24 @@ def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "issues-insights-tracker"}
 
+@app.get("/health/db")
+def database_pool_health():
+    """Connection pool usage for this worker process."""
+    from app.db.session import engine, async_engine
+    from app.db.pool import pool_status
+    
+    return {
+        "pid": os.getpid(),
+        "sync": pool_status(engine),
+        "async": pool_status(async_engine.sync_engine) if async_engine is not None else None
+    }
+
 @app.get("/api/config")
 def get_config():
     """Get frontend configuration."""
     return {
-        "upload_max_size": 10 * 1024 * 1024,  # 10MB
-        "supported_file_types": [
-            "image/jpeg", "image/png", "image/gif",
-            "application/pdf", "text/plain", "text/csv"
-        ]
+        "upload_max_size": settings.MAX_UPLOAD_SIZE,
+        "supported_file_types": settings.ALLOWED_FILE_TYPES
     }
 
 # Custom exception handlers
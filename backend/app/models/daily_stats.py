@@ -1,6 +1,6 @@
 # backend/app/models/daily_stats.py
 
-from sqlalchemy import Column, Integer, Date, Enum
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.base import Base
 from app.models.issue import IssueStatus, IssueSeverity
@@ -30,5 +30,28 @@ class DailyStats(Base):
     issues_created_today = Column(Integer, default=0)
     issues_closed_today = Column(Integer, default=0)
     
+    # Checkpoint of the last reconciliation/rebuild that touched this day
+    reconciled_at = Column(DateTime)
+    
+    def __repr__(self):
+        return f"<DailyStats(date={self.date}, total={self.total_issues})>"
+
+class ResolutionSketch(Base):
+    """Time-to-resolve distribution for one severity on one day.
+
+    `sketch` is a serialized app.core.sketch.DDSketch of resolution times in
+    seconds; sketches for any date range are merged on read.
+    """
+    __tablename__ = "resolution_sketches"
+    __table_args__ = (
+        UniqueConstraint("date", "severity", name="uq_resolution_sketches_date_severity"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    date = Column(Date, nullable=False)
+    severity = Column(String(20), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    sketch = Column(Text, nullable=False)
+
     def __repr__(self):
-        return f"<DailyStats(date={self.date}, total={self.total_issues})>"
\ No newline at end of file
+        return f"<ResolutionSketch(date={self.date}, severity={self.severity}, count={self.count})>"
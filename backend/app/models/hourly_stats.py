@@ -0,0 +1,41 @@
+# backend/app/models/hourly_stats.py
+
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base import Base
+from app.models.issue import IssueStatus, IssueSeverity
+import uuid
+
+# Per-status / per-severity columns: the net change in issues with that value
+STATUS_COLUMNS = {status: f"status_{status.value.lower()}" for status in IssueStatus}
+SEVERITY_COLUMNS = {severity: f"severity_{severity.value.lower()}" for severity in IssueSeverity}
+
+class HourlyStats(Base):
+    """Issue activity rolled up per UTC hour.
+
+    issues_created/issues_closed count events in the hour. The status_* and
+    severity_* columns hold net changes, so summing every row up to some hour
+    gives the number of issues in each status/severity at the end of it.
+    """
+    __tablename__ = "hourly_stats"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    hour = Column(DateTime, nullable=False, unique=True)
+
+    issues_created = Column(Integer, nullable=False, default=0, server_default="0")
+    issues_closed = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Net status changes
+    status_open = Column(Integer, nullable=False, default=0, server_default="0")
+    status_in_progress = Column(Integer, nullable=False, default=0, server_default="0")
+    status_resolved = Column(Integer, nullable=False, default=0, server_default="0")
+    status_closed = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Net severity changes
+    severity_low = Column(Integer, nullable=False, default=0, server_default="0")
+    severity_medium = Column(Integer, nullable=False, default=0, server_default="0")
+    severity_high = Column(Integer, nullable=False, default=0, server_default="0")
+    severity_critical = Column(Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"<HourlyStats(hour={self.hour}, created={self.issues_created})>"
@@ -1,5 +1,5 @@
 # backend/app/models/issue.py
-from sqlalchemy import Column, String, Text, Enum, ForeignKey, DateTime
+from sqlalchemy import Column, String, Text, Enum, ForeignKey, DateTime, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
@@ -21,18 +21,95 @@ class IssueSeverity(str, enum.Enum):
 
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        # Keyset pagination / export order and created_at range counts
+        Index("ix_issues_created_at_id", "created_at", "id"),
+        # REPORTER-scoped listing
+        Index("ix_issues_created_by_created_at", "created_by", "created_at", "id"),
+        # Status/severity filtered pages (newest first) and breakdowns
+        Index("ix_issues_status_severity_created_at", "status", "severity", "created_at", "id"),
+        # "Closed today" style lookups
+        Index("ix_issues_status_updated_at", "status", "updated_at"),
+        # Per-assignee listing
+        Index("ix_issues_assigned_to_created_at", "assigned_to", "created_at", "id"),
+        # Workload board: open counts per assignee and severity, index-only
+        Index("ix_issues_status_assigned_to_severity", "status", "assigned_to", "severity"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
     description = Column(Text)
+    tags = Column(String)
+    file_path = Column(String)
+    file_checksum = Column(String(64))
     status = Column(Enum(IssueStatus), default=IssueStatus.OPEN)
     severity = Column(Enum(IssueSeverity), default=IssueSeverity.MEDIUM)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    assigned_to = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Use string reference to avoid circular import
-    creator = relationship("User", back_populates="issues")
+    creator = relationship("User", back_populates="issues", foreign_keys=[created_by])
+    assignee = relationship("User", foreign_keys=[assigned_to])
     
     def __repr__(self):
-        return f"<Issue(id={self.id}, title={self.title}, status={self.status})>"
\ No newline at end of file
+        return f"<Issue(id={self.id}, title={self.title}, status={self.status})>"
+
+# Full-text search index over title, description and tags.
+# PostgreSQL: weighted generated tsvector column with a GIN index.
+# SQLite: FTS5 table kept in sync by triggers. Rows are keyed on the issue id
+# (an indexed column, so triggers find a row with MATCH) rather than the
+# implicit rowid of issues, which VACUUM and table rebuilds may renumber.
+SEARCH_DDL = {
+    "postgresql": [
+        """
+        ALTER TABLE issues ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED
+        """,
+        "CREATE INDEX ix_issues_search_vector ON issues USING gin (search_vector)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE issues_fts USING fts5(issue_id, title, description, tags)",
+        """
+        CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+            INSERT INTO issues_fts(issue_id, title, description, tags)
+            VALUES (new.id, new.title, new.description, new.tags);
+        END
+        """,
+        """
+        CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+            DELETE FROM issues_fts WHERE issues_fts MATCH '{issue_id}: "' || old.id || '"';
+        END
+        """,
+        """
+        CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description, tags ON issues BEGIN
+            DELETE FROM issues_fts WHERE issues_fts MATCH '{issue_id}: "' || old.id || '"';
+            INSERT INTO issues_fts(issue_id, title, description, tags)
+            VALUES (new.id, new.title, new.description, new.tags);
+        END
+        """,
+    ],
+}
+
+# Dropped with the issues table; the PostgreSQL column and index go with it
+SEARCH_DROP_DDL = {
+    "sqlite": [
+        "DROP TRIGGER IF EXISTS issues_fts_au",
+        "DROP TRIGGER IF EXISTS issues_fts_ad",
+        "DROP TRIGGER IF EXISTS issues_fts_ai",
+        "DROP TABLE IF EXISTS issues_fts",
+    ],
+}
+
+for _event, _ddl in (("after_create", SEARCH_DDL), ("before_drop", SEARCH_DROP_DDL)):
+    for _dialect, _statements in _ddl.items():
+        for _statement in _statements:
+            event.listen(
+                Issue.__table__,
+                _event,
+                DDL(_statement).execute_if(dialect=_dialect)
+            )
@@ -0,0 +1,41 @@
+# backend/app/models/issue_event.py
+
+from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base_class import Base
+from datetime import datetime
+import enum
+import uuid
+
+class IssueEventType(str, enum.Enum):
+    CREATED = "created"
+    STATUS_CHANGED = "status_changed"
+    SEVERITY_CHANGED = "severity_changed"
+    DELETED = "deleted"
+
+class IssueEvent(Base):
+    """Append-only history of issue lifecycle changes.
+
+    Rows are never updated or deleted, and outlive the issue they describe,
+    so issue_id deliberately has no foreign key.
+    """
+    __tablename__ = "issue_events"
+    __table_args__ = (
+        # Per-issue history (window partitions, reopen lookups)
+        Index("ix_issue_events_issue_id_occurred_at", "issue_id", "occurred_at"),
+        # Range scans of one kind of event (resolutions, transitions)
+        Index("ix_issue_events_type_occurred_at", "event_type", "occurred_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    issue_id = Column(UUID(as_uuid=True), nullable=False)
+    event_type = Column(String(20), nullable=False)
+    from_status = Column(String(20))
+    to_status = Column(String(20))
+    from_severity = Column(String(20))
+    to_severity = Column(String(20))
+    actor_id = Column(UUID(as_uuid=True))
+    occurred_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<IssueEvent(issue_id={self.issue_id}, type={self.event_type}, at={self.occurred_at})>"
@@ -0,0 +1,39 @@
+# backend/app/models/job_run.py
+
+from sqlalchemy import Column, String, Text, DateTime, Float, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base_class import Base
+from datetime import datetime
+import enum
+import uuid
+
+class JobRunStatus(str, enum.Enum):
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class JobRun(Base):
+    """One execution of a scheduled job, whichever worker ran it.
+
+    (job_id, scheduled_for) is unique, so a tick can only ever be claimed once
+    across the cluster.
+    """
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        UniqueConstraint("job_id", "scheduled_for", name="uq_job_runs_job_id_scheduled_for"),
+        # Recent history and retention pruning
+        Index("ix_job_runs_started_at", "started_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_id = Column(String(100), nullable=False)
+    scheduled_for = Column(DateTime, nullable=False)
+    status = Column(String(20), nullable=False, default=JobRunStatus.RUNNING.value)
+    worker = Column(String(255))
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+    duration_ms = Column(Float)
+    error = Column(Text)
+
+    def __repr__(self):
+        return f"<JobRun(job_id={self.job_id}, scheduled_for={self.scheduled_for}, status={self.status})>"
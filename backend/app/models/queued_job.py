@@ -0,0 +1,45 @@
+# backend/app/models/queued_job.py
+
+from sqlalchemy import Column, String, Text, DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base_class import Base
+from datetime import datetime
+import enum
+import uuid
+
+class QueuedJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class QueuedJob(Base):
+    """A unit of background work for `python -m app.workers`.
+
+    A RUNNING job whose locked_until has passed is treated as abandoned
+    (its worker died) and can be claimed again.
+    """
+    __tablename__ = "job_queue"
+    __table_args__ = (
+        # Claim scans: next due job per status
+        Index("ix_job_queue_status_run_at", "status", "run_at"),
+        # Expired leases
+        Index("ix_job_queue_status_locked_until", "status", "locked_until"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    task = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False, default="{}")
+    status = Column(String(20), nullable=False, default=QueuedJobStatus.QUEUED.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_by = Column(String(255))
+    locked_until = Column(DateTime)
+    last_error = Column(Text)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    def __repr__(self):
+        return f"<QueuedJob(id={self.id}, task={self.task}, status={self.status}, attempts={self.attempts})>"
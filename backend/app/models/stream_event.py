@@ -0,0 +1,25 @@
+# backend/app/models/stream_event.py
+
+from sqlalchemy import Column, String, Text, DateTime, BigInteger, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base_class import Base
+from datetime import datetime
+
+class StreamEvent(Base):
+    """An issue change event as sent on /api/stream, kept for Last-Event-ID replay.
+
+    Only written with SSE_PERSIST_EVENTS. The id sequence then numbers events
+    for every process, so a client can resume against any worker.
+    """
+    __tablename__ = "stream_events"
+
+    # BIGSERIAL on PostgreSQL; SQLite only autoincrements INTEGER primary keys
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_type = Column(String(20), nullable=False)
+    issue_id = Column(UUID(as_uuid=True))
+    created_by = Column(UUID(as_uuid=True))
+    data = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<StreamEvent(id={self.id}, type={self.event_type}, issue_id={self.issue_id})>"
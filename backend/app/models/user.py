@@ -25,7 +25,7 @@ class User(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship to issues
-    issues = relationship("Issue", back_populates="creator")
+    issues = relationship("Issue", back_populates="creator", foreign_keys="Issue.created_by")
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
\ No newline at end of file
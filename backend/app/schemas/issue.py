@@ -1,16 +1,17 @@
 # backend/app/schemas/issue.py
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from enum import Enum
 from datetime import datetime
 
+# Must match the stored values (app.models.issue.IssueStatus, the issuestatus DB enum)
 class IssueStatus(str, Enum):
     OPEN = "OPEN"
-    TRIAGED = "TRIAGED"
     IN_PROGRESS = "IN_PROGRESS"
-    DONE = "DONE"
+    RESOLVED = "RESOLVED"
+    CLOSED = "CLOSED"
 
 class IssueSeverity(str, Enum):
     LOW = "LOW"
@@ -39,6 +40,7 @@ class IssueOut(BaseModel):
     status: IssueStatus
     severity: IssueSeverity
     file_path: Optional[str]
+    file_checksum: Optional[str] = None
     tags: Optional[str]
     created_by: UUID
     assigned_to: Optional[UUID]
@@ -52,4 +54,28 @@ class IssueFilter(BaseModel):
     status: Optional[IssueStatus] = None
     severity: Optional[IssueSeverity] = None
     assigned_to: Optional[UUID] = None
-    created_by: Optional[UUID] = None
\ No newline at end of file
+    created_by: Optional[UUID] = None
+
+class BatchOperationType(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    STATUS = "status"
+    DELETE = "delete"
+
+class IssueBatchOperation(BaseModel):
+    op: BatchOperationType
+    id: Optional[UUID] = None          # required for update, status and delete
+    data: Optional[IssueUpdate] = None  # fields for update (create: no status/assigned_to), `status` for status
+
+class IssueBatchRequest(BaseModel):
+    operations: List[IssueBatchOperation]
+
+class IssueBatchResult(BaseModel):
+    index: int
+    op: BatchOperationType
+    id: Optional[UUID] = None
+    status_code: int
+    detail: Optional[str] = None
+
+class IssueBatchResponse(BaseModel):
+    results: List[IssueBatchResult]
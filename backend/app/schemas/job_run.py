@@ -0,0 +1,35 @@
+# backend/app/schemas/job_run.py
+
+from pydantic import BaseModel
+from typing import Optional
+from uuid import UUID
+from datetime import datetime
+
+class JobRunOut(BaseModel):
+    id: UUID
+    job_id: str
+    scheduled_for: datetime
+    status: str
+    worker: Optional[str]
+    started_at: datetime
+    finished_at: Optional[datetime]
+    duration_ms: Optional[float]
+    error: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+class QueuedJobOut(BaseModel):
+    id: UUID
+    task: str
+    status: str
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    last_error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
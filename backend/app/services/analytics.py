@@ -0,0 +1,138 @@
+# backend/app/services/analytics.py
+
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, func, case
+from app.core.config import settings
+from app.models.issue import IssueStatus, IssueSeverity
+from app.models.issue_event import IssueEvent, IssueEventType
+from app.services.rollups import Bucket, bucket_start, next_bucket
+from app.services.events import resolution_condition, opening_condition
+from collections import defaultdict
+from datetime import date, datetime, time
+import logging
+
+logger = logging.getLogger(__name__)
+
+CREATED = IssueEventType.CREATED.value
+STATUS_CHANGED = IssueEventType.STATUS_CHANGED.value
+DELETED = IssueEventType.DELETED.value
+
+def seconds_between(start, end, dialect: str):
+    """SQL expression for the seconds from `start` to `end`."""
+    if dialect == "sqlite":
+        return (func.julianday(end) - func.julianday(start)) * 86400
+    return func.extract("epoch", end - start)
+
+def _summary(count, total_seconds) -> dict:
+    total_seconds = float(total_seconds or 0)
+    return {
+        "count": count,
+        "total_hours": round(total_seconds / 3600, 2),
+        "avg_hours": round(total_seconds / count / 3600, 2) if count else None,
+    }
+
+def time_in_status(db: Session, start: datetime, end: datetime) -> dict:
+    """Time issues spent in each status for stays that began in [start, end).
+
+    LEAD() over each issue's transitions finds when it left a status; stays
+    still open at the end of the window are cut off there.
+    """
+    end = min(end, datetime.utcnow())
+    dialect = db.get_bind().dialect.name
+
+    stays = select(
+        IssueEvent.to_status.label("status"),
+        IssueEvent.occurred_at.label("entered_at"),
+        func.lead(IssueEvent.occurred_at).over(
+            partition_by=IssueEvent.issue_id, order_by=IssueEvent.occurred_at
+        ).label("left_at"),
+    ).where(
+        IssueEvent.event_type.in_([CREATED, STATUS_CHANGED, DELETED]),
+        IssueEvent.occurred_at >= start,
+        IssueEvent.occurred_at < end
+    ).subquery()
+
+    duration = seconds_between(stays.c.entered_at, func.coalesce(stays.c.left_at, end), dialect)
+    rows = db.execute(
+        select(stays.c.status, func.count(), func.sum(duration))
+        .where(stays.c.status.is_not(None))
+        .group_by(stays.c.status)
+    ).all()
+
+    by_status = {status: _summary(count, seconds) for status, count, seconds in rows}
+    return {status.value: by_status.get(status.value, _summary(0, 0)) for status in IssueStatus}
+
+def mttr_by_severity(db: Session, start: datetime, end: datetime) -> dict:
+    """Mean time to resolve per severity, for resolutions in [start, end).
+
+    Each resolution is measured from the latest creation or reopen of the
+    same issue before it, found through ix_issue_events_issue_id_occurred_at.
+    Issues opened before the event log existed are left out.
+    """
+    dialect = db.get_bind().dialect.name
+    resolved, opened = aliased(IssueEvent), aliased(IssueEvent)
+
+    opened_at = select(func.max(opened.occurred_at)).where(
+        opened.issue_id == resolved.issue_id,
+        opened.occurred_at <= resolved.occurred_at,
+        opening_condition(opened)
+    ).scalar_subquery()
+
+    resolutions = select(
+        resolved.to_severity.label("severity"),
+        resolved.occurred_at.label("resolved_at"),
+        opened_at.label("opened_at"),
+    ).where(
+        resolution_condition(resolved),
+        resolved.occurred_at >= start,
+        resolved.occurred_at < end
+    ).subquery()
+
+    rows = db.execute(
+        select(
+            resolutions.c.severity,
+            func.count(resolutions.c.opened_at),
+            func.sum(seconds_between(resolutions.c.opened_at, resolutions.c.resolved_at, dialect))
+        ).group_by(resolutions.c.severity)
+    ).all()
+
+    by_severity = {severity: _summary(count, seconds) for severity, count, seconds in rows}
+    return {severity.value: by_severity.get(severity.value, _summary(0, 0)) for severity in IssueSeverity}
+
+def throughput(db: Session, start: datetime, end: datetime, bucket: Bucket) -> list:
+    """Issues created and resolved per bucket in [start, end), gaps zero-filled.
+
+    Events are counted per day in SQL (one index range scan) and the days
+    are then rolled up into day/week/month buckets.
+    """
+    if bucket == Bucket.HOUR:
+        raise ValueError("Throughput buckets are day, week or month")
+
+    day = func.date(IssueEvent.occurred_at)
+    rows = db.execute(
+        select(
+            day,
+            func.count(case((IssueEvent.event_type == CREATED, 1))),
+            func.count(case((resolution_condition(), 1)))
+        ).where(
+            IssueEvent.event_type.in_([CREATED, STATUS_CHANGED]),
+            IssueEvent.occurred_at >= start,
+            IssueEvent.occurred_at < end
+        ).group_by(day)
+    ).all()
+
+    per_bucket = defaultdict(lambda: {"created": 0, "resolved": 0})
+    for event_day, created, resolved in rows:
+        if isinstance(event_day, str):
+            event_day = date.fromisoformat(event_day)
+        counts = per_bucket[bucket_start(datetime.combine(event_day, time.min), bucket)]
+        counts["created"] += created
+        counts["resolved"] += resolved
+
+    buckets, current = [], bucket_start(start, bucket)
+    while current < end:
+        if len(buckets) >= settings.STATS_RANGE_MAX_BUCKETS:
+            raise ValueError(f"At most {settings.STATS_RANGE_MAX_BUCKETS} buckets per request")
+        buckets.append({"start": current, **per_bucket.get(current, {"created": 0, "resolved": 0})})
+        current = next_bucket(current, bucket)
+    return buckets
@@ -0,0 +1,109 @@
+# backend/app/services/dashboard.py
+
+from sqlalchemy import select, func, null, union_all
+from sqlalchemy.orm import aliased
+from collections import Counter
+from app.models.issue import Issue, IssueStatus, IssueSeverity
+from app.models.user import User
+
+# Statuses counted as "open" work in the severity breakdown
+ACTIVE_STATUSES = {IssueStatus.OPEN, IssueStatus.IN_PROGRESS}
+
+# Every dashboard figure in one pass: at most 16 (status, severity) groups,
+# answered from the covering index ix_issues_status_severity_created_at
+SUMMARY_QUERY = select(
+    Issue.status, Issue.severity, func.count().label("count")
+).group_by(Issue.status, Issue.severity)
+
+RECENT_ISSUES_LIMIT = 5
+
+# The dashboard in one round trip: the latest issues, then the SUMMARY_QUERY
+# groups with NULL issue columns. Each row is either an issue or a group.
+_recent = select(*Issue.__table__.c, null().label("group_count")).order_by(
+    Issue.created_at.desc(), Issue.id.desc()
+).limit(RECENT_ISSUES_LIMIT).subquery()
+_rows = union_all(
+    select(_recent),
+    select(*(
+        column if column.name in ("status", "severity") else null()
+        for column in Issue.__table__.c
+    ), func.count()).group_by(Issue.status, Issue.severity)
+).subquery()
+_row_issue = aliased(Issue, _rows)
+DASHBOARD_QUERY = select(_row_issue, _rows.c.status, _rows.c.severity, _rows.c.group_count)
+
+# Open work per assignee and severity, answered from ix_issues_status_assigned_to_severity
+WORKLOAD_QUERY = select(
+    Issue.assigned_to, Issue.severity, func.count().label("count")
+).where(Issue.status.in_(ACTIVE_STATUSES)).group_by(Issue.assigned_to, Issue.severity)
+
+def _counts(groups) -> dict:
+    """Totals plus status and severity breakdowns from SUMMARY_QUERY's groups."""
+    by_status = Counter()
+    active_by_severity = Counter()
+    for status, severity, count in groups:
+        by_status[status] += count
+        if status in ACTIVE_STATUSES:
+            active_by_severity[severity] += count
+
+    status_breakdown = [{"status": status, "count": by_status[status]} for status in IssueStatus]
+    severity_breakdown = [
+        {"severity": severity, "count": active_by_severity[severity]} for severity in IssueSeverity
+    ]
+
+    return {
+        "total_issues": sum(by_status.values()),
+        "open_issues": by_status[IssueStatus.OPEN],
+        "in_progress_issues": by_status[IssueStatus.IN_PROGRESS],
+        "resolved_issues": by_status[IssueStatus.RESOLVED],
+        "closed_issues": by_status[IssueStatus.CLOSED],
+        "total_open": sum(active_by_severity.values()),
+        "status_breakdown": status_breakdown,
+        "severity_breakdown": severity_breakdown
+    }
+
+async def issue_counts(db) -> dict:
+    """Totals plus status and severity breakdowns from a single aggregate query."""
+    return _counts((await db.execute(SUMMARY_QUERY)).all())
+
+async def dashboard_summary(db) -> dict:
+    """Everything the dashboard shows: issue_counts() plus the latest issues, in one statement."""
+    groups, recent_issues = [], []
+    for issue, status, severity, count in (await db.execute(DASHBOARD_QUERY)).all():
+        if count is None:
+            recent_issues.append(issue)
+        else:
+            groups.append((status, severity, count))
+
+    summary = _counts(groups)
+    summary["recent_issues"] = sorted(recent_issues, key=lambda issue: (issue.created_at, issue.id), reverse=True)
+    return summary
+
+async def assignee_workload(db) -> list:
+    """Open issue counts per assignee broken down by severity, busiest first.
+
+    Unassigned open issues are reported under assignee_id None.
+    """
+    by_assignee = {}
+    for assigned_to, severity, count in (await db.execute(WORKLOAD_QUERY)).all():
+        by_assignee.setdefault(assigned_to, Counter())[severity] += count
+
+    assignee_ids = [assignee_id for assignee_id in by_assignee if assignee_id is not None]
+    users = {}
+    if assignee_ids:
+        users = {user.id: user for user in (await db.execute(
+            select(User.id, User.name, User.email).where(User.id.in_(assignee_ids))
+        )).all()}
+
+    workload = []
+    for assignee_id, counts in by_assignee.items():
+        user = users.get(assignee_id)
+        workload.append({
+            "assignee_id": assignee_id,
+            "name": user.name if user else None,
+            "email": user.email if user else None,
+            "total_open": sum(counts.values()),
+            "severity_breakdown": {severity.value: counts[severity] for severity in IssueSeverity}
+        })
+    workload.sort(key=lambda row: (row["assignee_id"] is None, -row["total_open"]))
+    return workload
@@ -0,0 +1,90 @@
+# backend/app/services/events.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, func, and_, or_
+from app.models.issue import IssueStatus
+from app.models.issue_event import IssueEvent, IssueEventType
+from datetime import datetime
+from typing import Optional
+
+CLOSED = [IssueStatus.RESOLVED.value, IssueStatus.CLOSED.value]
+
+def resolution_condition(event=IssueEvent):
+    """A move from an open status into RESOLVED/CLOSED."""
+    return and_(
+        event.event_type == IssueEventType.STATUS_CHANGED.value,
+        event.to_status.in_(CLOSED),
+        or_(event.from_status.is_(None), event.from_status.not_in(CLOSED))
+    )
+
+def is_resolution(before: Optional[tuple], after: Optional[tuple]) -> bool:
+    """Python-side resolution_condition() for a (before, after) change."""
+    was_closed = before is not None and _value(before[0]) in CLOSED
+    return after is not None and _value(after[0]) in CLOSED and not was_closed
+
+def opening_condition(event=IssueEvent):
+    """A creation, or a reopen from RESOLVED/CLOSED back to an open status."""
+    return or_(
+        event.event_type == IssueEventType.CREATED.value,
+        and_(
+            event.event_type == IssueEventType.STATUS_CHANGED.value,
+            event.from_status.in_(CLOSED),
+            event.to_status.not_in(CLOSED)
+        )
+    )
+
+def _value(value):
+    return getattr(value, "value", value)
+
+def issue_event(issue_id, before: Optional[tuple], after: Optional[tuple], actor_id=None, occurred_at: Optional[datetime] = None) -> Optional[dict]:
+    """The issue_events row for one (before, after) change, or None if nothing tracked changed.
+
+    States are (status, severity, ...) tuples as used by the stats counters.
+    A change of both status and severity is one status_changed event that
+    carries both from/to pairs.
+    """
+    from_status, from_severity = map(_value, before[:2]) if before is not None else (None, None)
+    to_status, to_severity = map(_value, after[:2]) if after is not None else (None, None)
+
+    if before is None:
+        event_type = IssueEventType.CREATED
+    elif after is None:
+        event_type = IssueEventType.DELETED
+    elif from_status != to_status:
+        event_type = IssueEventType.STATUS_CHANGED
+    elif from_severity != to_severity:
+        event_type = IssueEventType.SEVERITY_CHANGED
+    else:
+        return None
+
+    return {
+        "issue_id": issue_id,
+        "event_type": event_type.value,
+        "from_status": from_status,
+        "to_status": to_status,
+        "from_severity": from_severity,
+        "to_severity": to_severity,
+        "actor_id": actor_id,
+        "occurred_at": occurred_at or datetime.utcnow(),
+    }
+
+def record_issue_events(db: Session, changes, actor_id=None):
+    """Append events for (issue_id, before, after) changes in the caller's transaction."""
+    now = datetime.utcnow()
+    rows = [
+        row for row in (issue_event(issue_id, before, after, actor_id, now) for issue_id, before, after in changes)
+        if row is not None
+    ]
+    if rows:
+        db.execute(insert(IssueEvent), rows)
+
+def latest_openings(db: Session, issue_ids) -> dict:
+    """When each issue was last created or reopened, from one grouped query."""
+    if not issue_ids:
+        return {}
+    rows = db.execute(
+        select(IssueEvent.issue_id, func.max(IssueEvent.occurred_at))
+        .where(IssueEvent.issue_id.in_(list(issue_ids)), opening_condition())
+        .group_by(IssueEvent.issue_id)
+    )
+    return dict(rows.all())
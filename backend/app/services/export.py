@@ -0,0 +1,79 @@
+# backend/app/services/export.py
+
+from app.db.session import engine
+from app.models.issue import Issue
+from app.core.config import settings
+from datetime import datetime
+import csv
+import enum
+import io
+import json
+import uuid
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+def export_value(value):
+    """Convert a raw column value into something json/csv can write."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def stream_issue_rows(statement):
+    """Yield issue rows as dicts from a server-side cursor.
+
+    Runs on its own connection because the request session is closed before a
+    StreamingResponse starts sending. Only `EXPORT_BATCH_SIZE` rows are held in
+    memory at any time.
+    """
+    columns = list(Issue.__table__.columns)
+    statement = statement.with_only_columns(*columns).order_by(None).order_by(
+        Issue.created_at.desc(), Issue.id.desc()
+    )
+
+    with engine.connect() as connection:
+        result = connection.execution_options(
+            stream_results=True,
+            yield_per=settings.EXPORT_BATCH_SIZE
+        ).execute(statement)
+
+        for row in result:
+            yield {column.name: export_value(value) for column, value in zip(columns, row)}
+
+def ndjson_lines(rows):
+    """Encode rows one at a time as newline-delimited JSON."""
+    for row in rows:
+        yield json.dumps(row, separators=(",", ":")) + "\n"
+
+def csv_lines(rows):
+    """Encode rows one at a time as CSV, header first."""
+    buffer = io.StringIO()
+    writer = None
+
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+            writer.writeheader()
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    if writer is None:
+        # Empty export still gets a header row
+        writer = csv.DictWriter(buffer, fieldnames=[c.name for c in Issue.__table__.columns])
+        writer.writeheader()
+        yield buffer.getvalue()
+
+def export_issues(statement, export_format: str):
+    """Return a line generator for the requested export format."""
+    rows = stream_issue_rows(statement)
+    if export_format == "csv":
+        return csv_lines(rows)
+    return ndjson_lines(rows)
@@ -0,0 +1,240 @@
+# backend/app/services/rollups.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, insert, delete, exists
+from sqlalchemy.exc import IntegrityError
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.issue import Issue, IssueStatus, IssueSeverity
+from app.models.hourly_stats import HourlyStats, STATUS_COLUMNS, SEVERITY_COLUMNS
+from app.models.issue_event import IssueEvent, IssueEventType
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+CLOSED_STATUSES = {IssueStatus.RESOLVED, IssueStatus.CLOSED}
+
+COUNTER_COLUMNS = ["issues_created", "issues_closed", *STATUS_COLUMNS.values(), *SEVERITY_COLUMNS.values()]
+
+# rebuild_rollups leaves alone hours that may still get live deltas, from a
+# transaction that started just before the hour ended
+REBUILD_SETTLE = timedelta(minutes=5)
+
+class Bucket(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+def hour_of(moment: Optional[datetime] = None) -> datetime:
+    """The UTC hour a change is rolled up into."""
+    return (moment or datetime.utcnow()).replace(minute=0, second=0, microsecond=0)
+
+def _enum(enum_class, value):
+    try:
+        return enum_class(getattr(value, "value", value))
+    except ValueError:
+        return None
+
+def issue_rollup_delta(before: Optional[tuple] = None, after: Optional[tuple] = None) -> Counter:
+    """HourlyStats changes for one issue going from `before` to `after`.
+
+    States are (status, severity, ...) tuples, None for a side where the
+    issue doesn't exist. Creates and closes are counted once as events;
+    deletes only take the issue out of the status/severity levels.
+    """
+    delta = Counter()
+    statuses = {}
+
+    for side, state, sign in (("before", before, -1), ("after", after, 1)):
+        if state is None:
+            continue
+        status, severity = _enum(IssueStatus, state[0]), _enum(IssueSeverity, state[1])
+        delta[STATUS_COLUMNS.get(status)] += sign
+        delta[SEVERITY_COLUMNS.get(severity)] += sign
+        statuses[side] = status
+
+    if before is None and after is not None:
+        delta["issues_created"] += 1
+    if statuses.get("after") in CLOSED_STATUSES and statuses.get("before") not in CLOSED_STATUSES:
+        delta["issues_closed"] += 1
+
+    delta.pop(None, None)
+    return delta
+
+def apply_rollup_delta(db: Session, delta: Counter, hour: Optional[datetime] = None):
+    """Add `delta` to the hour's HourlyStats row inside the caller's transaction."""
+    delta = {column: amount for column, amount in delta.items() if amount}
+    if not delta:
+        return
+
+    hour = hour or hour_of()
+    table = HourlyStats.__table__
+    statement = table.update().where(table.c.hour == hour).values({
+        column: table.c[column] + amount for column, amount in delta.items()
+    })
+
+    if db.execute(statement).rowcount == 0:
+        try:
+            # Savepoint: a concurrent transaction may create the same hour first
+            with db.begin_nested():
+                db.add(HourlyStats(hour=hour))
+        except IntegrityError:
+            pass
+        db.execute(statement)
+
+def bucket_start(moment: datetime, bucket: Bucket) -> datetime:
+    moment = hour_of(moment)
+    if bucket == Bucket.HOUR:
+        return moment
+    moment = moment.replace(hour=0)
+    if bucket == Bucket.WEEK:
+        return moment - timedelta(days=moment.weekday())
+    if bucket == Bucket.MONTH:
+        return moment.replace(day=1)
+    return moment
+
+def next_bucket(start: datetime, bucket: Bucket) -> datetime:
+    if bucket == Bucket.HOUR:
+        return start + timedelta(hours=1)
+    if bucket == Bucket.DAY:
+        return start + timedelta(days=1)
+    if bucket == Bucket.WEEK:
+        return start + timedelta(weeks=1)
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+def _levels(totals: Counter) -> dict:
+    return {
+        "status": {status.value: totals[column] for status, column in STATUS_COLUMNS.items()},
+        "severity": {severity.value: totals[column] for severity, column in SEVERITY_COLUMNS.items()},
+    }
+
+def range_stats(db: Session, start: datetime, end: datetime, bucket: Bucket) -> list:
+    """Bucketed activity for [start, end) from the hourly rollups, gaps zero-filled.
+
+    Each bucket has the created/closed events inside it and the status and
+    severity levels at its end (a running sum of the net changes, seeded with
+    everything rolled up before the range).
+    """
+    columns = [HourlyStats.__table__.c[column] for column in COUNTER_COLUMNS]
+
+    first = bucket_start(start, bucket)
+    starts = [first]
+    while next_bucket(starts[-1], bucket) < end:
+        if len(starts) >= settings.STATS_RANGE_MAX_BUCKETS:
+            raise ValueError(f"At most {settings.STATS_RANGE_MAX_BUCKETS} buckets per request")
+        starts.append(next_bucket(starts[-1], bucket))
+
+    before = db.execute(
+        select(*(func.coalesce(func.sum(column), 0) for column in columns)).where(HourlyStats.hour < first)
+    ).one()
+    levels = Counter(dict(zip(COUNTER_COLUMNS, before)))
+
+    per_bucket = defaultdict(Counter)
+    for row in db.execute(
+        select(HourlyStats.hour, *columns)
+        .where(HourlyStats.hour >= first, HourlyStats.hour < end)
+        .order_by(HourlyStats.hour)
+    ):
+        per_bucket[bucket_start(row.hour, bucket)].update(dict(zip(COUNTER_COLUMNS, row[1:])))
+
+    buckets = []
+    for bucket_from in starts:
+        changes = per_bucket.get(bucket_from, Counter())
+        levels.update(changes)
+        buckets.append({
+            "start": bucket_from,
+            "issues_created": changes["issues_created"],
+            "issues_closed": changes["issues_closed"],
+            **_levels(levels),
+        })
+    return buckets
+
+def _event_states(event) -> tuple:
+    """The (before, after) states of an issue_events row, None where the issue didn't exist."""
+    before = None if event.event_type == IssueEventType.CREATED.value else (event.from_status, event.from_severity)
+    after = None if event.event_type == IssueEventType.DELETED.value else (event.to_status, event.to_severity)
+    return before, after
+
+def _seed_issue(hours: defaultdict, state: tuple, created_at: datetime, moved_at: datetime, last_hour: datetime):
+    """Roll up an issue the event log doesn't cover: created OPEN, then moved to `state`."""
+    status, severity = state
+    hours[min(hour_of(created_at), last_hour)].update(issue_rollup_delta(after=(IssueStatus.OPEN, severity)))
+    if _enum(IssueStatus, status) != IssueStatus.OPEN:
+        hours[min(hour_of(moved_at), last_hour)].update(issue_rollup_delta((IssueStatus.OPEN, severity), state))
+
+def rebuild_rollups(batch_size: Optional[int] = None, cutoff: Optional[datetime] = None) -> int:
+    """Recompute hourly_stats before `cutoff` by replaying the issue_events log in one streaming pass.
+
+    Every event is rolled up into its hour exactly as its live delta was.
+    Issues older than the log have no "created" event: they are seeded as
+    created OPEN in their created_at hour and moved there to the state their
+    first event started from, or, with no events at all, moved to their
+    current status in their updated_at hour (the only approximated part).
+
+    Only hours before `cutoff` (by default the last hour that ended at least
+    REBUILD_SETTLE ago) are replaced, in one transaction; live writes only
+    touch later hours, so this is safe under traffic. Returns the number of
+    hours written.
+    """
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    cutoff = hour_of(cutoff or datetime.utcnow() - REBUILD_SETTLE)
+    last_hour = cutoff - timedelta(hours=1)
+    hours = defaultdict(Counter)
+
+    db = SessionLocal()
+    try:
+        # issue id -> (state before its first event, when that event happened).
+        # Events after the cutoff are only looked at to find issues older than the log.
+        unseeded, issue_id = {}, None
+        events = db.execute(
+            select(
+                IssueEvent.issue_id, IssueEvent.event_type, IssueEvent.from_status, IssueEvent.from_severity,
+                IssueEvent.to_status, IssueEvent.to_severity, IssueEvent.occurred_at
+            ).order_by(IssueEvent.issue_id, IssueEvent.occurred_at),
+            execution_options={"stream_results": True, "yield_per": batch_size}
+        )
+        for event in events:
+            if event.issue_id != issue_id:
+                issue_id = event.issue_id
+                if event.event_type != IssueEventType.CREATED.value:
+                    unseeded[issue_id] = ((event.from_status, event.from_severity), event.occurred_at)
+            if event.occurred_at < cutoff:
+                hours[hour_of(event.occurred_at)].update(issue_rollup_delta(*_event_states(event)))
+
+        ids = list(unseeded)
+        for offset in range(0, len(ids), batch_size):
+            chunk = ids[offset:offset + batch_size]
+            created = dict(db.execute(select(Issue.id, Issue.created_at).where(Issue.id.in_(chunk))).all())
+            for issue_id in chunk:
+                state, first_at = unseeded[issue_id]
+                created_at = created.get(issue_id) or first_at
+                _seed_issue(hours, state, created_at, created_at, last_hour)
+
+        issues = db.execute(
+            select(Issue.status, Issue.severity, Issue.created_at, Issue.updated_at)
+            .where(~exists().where(IssueEvent.issue_id == Issue.id)),
+            execution_options={"stream_results": True, "yield_per": batch_size}
+        )
+        for status, severity, created_at, updated_at in issues:
+            _seed_issue(hours, (status, severity), created_at, updated_at or created_at, last_hour)
+
+        db.execute(delete(HourlyStats).where(HourlyStats.hour < cutoff))
+        records = [{"hour": hour, **{column: counts[column] for column in COUNTER_COLUMNS}} for hour, counts in hours.items()]
+        for offset in range(0, len(records), batch_size):
+            db.execute(insert(HourlyStats), records[offset:offset + batch_size])
+        db.commit()
+
+        logger.info(f"Rebuilt hourly rollups before {cutoff}: {len(records)} hours")
+        return len(records)
+
+    except Exception as e:
+        logger.error(f"Error rebuilding hourly rollups: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,46 @@
+# backend/app/services/search.py
+
+from sqlalchemy import column, func, literal_column, or_, table
+from app.models.issue import Issue
+
+issues_fts = table("issues_fts", column("issue_id"))
+
+def _fts5_match(q: str) -> str:
+    """Quote every term so user input can't break FTS5 query syntax (terms are ANDed).
+
+    Only the text columns are searched, not issue_id.
+    """
+    terms = " ".join('"' + term.replace('"', '""') + '"' for term in q.split())
+    return f"{{title description tags}}: ({terms})"
+
+def apply_search(query, q: str, dialect: str):
+    """Restrict an issue SELECT to rows matching `q`, best match first.
+
+    Uses the search index created alongside the issues table (see
+    app.models.issue.SEARCH_DDL) and falls back to ILIKE on other databases.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery("english", q)
+        vector = literal_column("issues.search_vector")
+        return query.where(vector.op("@@")(tsquery)).order_by(
+            func.ts_rank(vector, tsquery).desc(), Issue.created_at.desc()
+        )
+
+    if dialect == "sqlite":
+        # Column weights mirror the PostgreSQL setweight order: title, description, tags
+        return query.join(
+            issues_fts, issues_fts.c.issue_id == Issue.id
+        ).where(
+            literal_column("issues_fts").op("MATCH")(_fts5_match(q))
+        ).order_by(
+            func.bm25(literal_column("issues_fts"), 0.0, 10.0, 1.0, 5.0), Issue.created_at.desc()
+        )
+
+    pattern = f"%{q}%"
+    return query.where(
+        or_(
+            Issue.title.ilike(pattern),
+            Issue.description.ilike(pattern),
+            Issue.tags.ilike(pattern)
+        )
+    ).order_by(Issue.created_at.desc())
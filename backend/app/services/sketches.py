@@ -0,0 +1,92 @@
+# backend/app/services/sketches.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from app.core.config import settings
+from app.core.sketch import DDSketch
+from app.models.issue import IssueSeverity
+from app.models.daily_stats import ResolutionSketch
+from app.services.events import is_resolution, latest_openings
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Optional
+import json
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+def _value(value):
+    return getattr(value, "value", value)
+
+def resolution_samples(db: Session, changes, now: Optional[datetime] = None) -> list:
+    """(severity, seconds) for every change in `changes` that resolves an issue.
+
+    Time to resolve runs from the issue's latest creation/reopen event, or
+    from its created_at when it predates the event log.
+    """
+    now = now or datetime.utcnow()
+    resolved = [(issue_id, before, after) for issue_id, before, after in changes if is_resolution(before, after)]
+    if not resolved:
+        return []
+
+    openings = latest_openings(db, {issue_id for issue_id, _, _ in resolved})
+    samples = []
+    for issue_id, before, after in resolved:
+        opened_at = openings.get(issue_id) or (before[2] if len(before) > 2 else None)
+        if opened_at is not None:
+            samples.append((_value(after[1]), max((now - opened_at).total_seconds(), 0.0)))
+    return samples
+
+def record_resolution_times(db: Session, samples, day: Optional[date] = None):
+    """Add resolution times to the day's per-severity sketches in the caller's transaction.
+
+    Each sketch row is locked while it is read, updated and written back, so
+    concurrent resolutions of the same severity serialize instead of losing samples.
+    """
+    by_severity = defaultdict(list)
+    for severity, seconds in samples:
+        by_severity[severity].append(seconds)
+
+    day = day or datetime.utcnow().date()
+    for severity, values in by_severity.items():
+        lookup = select(ResolutionSketch).where(
+            ResolutionSketch.date == day, ResolutionSketch.severity == severity
+        )
+        if db.scalar(lookup) is None:
+            try:
+                # Savepoint: a concurrent transaction may create the same row first
+                with db.begin_nested():
+                    db.add(ResolutionSketch(
+                        date=day, severity=severity, count=0,
+                        sketch=json.dumps(DDSketch(settings.RESOLUTION_SKETCH_ACCURACY).to_dict())
+                    ))
+            except IntegrityError:
+                pass
+
+        row = db.scalar(lookup.with_for_update())
+        sketch = DDSketch.from_dict(json.loads(row.sketch))
+        for seconds in values:
+            sketch.add(seconds)
+        row.sketch = json.dumps(sketch.to_dict())
+        row.count = sketch.count
+
+def resolution_percentiles(db: Session, start: date, end: date) -> dict:
+    """p50/p90/p99 hours to resolve per severity for resolutions on days [start, end]."""
+    merged = {}
+    for row in db.scalars(
+        select(ResolutionSketch).where(ResolutionSketch.date >= start, ResolutionSketch.date <= end)
+    ):
+        sketch = DDSketch.from_dict(json.loads(row.sketch))
+        if row.severity in merged:
+            merged[row.severity].merge(sketch)
+        else:
+            merged[row.severity] = sketch
+
+    result = {}
+    for severity in IssueSeverity:
+        sketch = merged.get(severity.value)
+        result[severity.value] = {"count": sketch.count if sketch else 0}
+        for q in QUANTILES:
+            seconds = sketch.quantile(q) if sketch else None
+            result[severity.value][f"p{round(q * 100)}_hours"] = round(seconds / 3600, 2) if seconds is not None else None
+    return result
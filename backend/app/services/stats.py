@@ -1,93 +1,394 @@
 # backend/app/services/stats.py
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import select, func, and_, exists
+from sqlalchemy.exc import IntegrityError
 from app.db.session import SessionLocal
-from app.models.issue import Issue, IssueStatus, IssueSeverity
+from app.models.issue import Issue, IssueStatus
 from app.models.daily_stats import DailyStats
-from datetime import date, datetime, timedelta
+from app.models.issue_event import IssueEvent, IssueEventType
+from app.services.rollups import issue_rollup_delta, apply_rollup_delta
+from app.services.events import record_issue_events, resolution_condition, is_resolution
+from app.services.sketches import resolution_samples, record_resolution_times
+from app.workers.locks import job_lock
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
-def update_stats():
-    """Background job to update daily statistics."""
-    
+# DailyStats column counting each status; RESOLVED and CLOSED both land in
+# done_count. No status maps to the legacy triaged_count column.
+STATUS_COUNTERS = {
+    IssueStatus.OPEN.value: "open_count",
+    IssueStatus.IN_PROGRESS.value: "in_progress_count",
+    IssueStatus.RESOLVED.value: "done_count",
+    IssueStatus.CLOSED.value: "done_count",
+}
+
+SEVERITY_COUNTERS = {
+    "LOW": "low_count",
+    "MEDIUM": "medium_count",
+    "HIGH": "high_count",
+    "CRITICAL": "critical_count",
+}
+
+# Point-in-time counters carried over from one day's row to the next
+SNAPSHOT_COUNTERS = sorted(set(STATUS_COUNTERS.values()) | set(SEVERITY_COUNTERS.values())) + ["total_issues"]
+
+# Issue ids per statement when re-scanning changed rows
+RESCAN_CHUNK = 500
+
+# Held by every reconcile run, whichever job or queue task started it
+RECONCILE_LOCK = "reconcile_stats"
+
+def stats_day(moment: Optional[datetime] = None) -> date:
+    """The DailyStats day a change belongs to (issue timestamps are UTC)."""
+    return (moment or datetime.utcnow()).date()
+
+def _day_range(day: date) -> Tuple[datetime, datetime]:
+    day_start = datetime.combine(day, time.min)
+    return day_start, day_start + timedelta(days=1)
+
+def _value(value):
+    return getattr(value, "value", value)
+
+def _issue_counters(state: tuple, day: date) -> Counter:
+    """The DailyStats counters one issue contributes to `day`'s row.
+
+    `state` is (status, severity[, created_at[, updated_at]]); a missing or
+    None created_at means "now". An issue counts as created today if it was
+    created on `day`, matching the reconciliation's created_at count.
+    """
+    status, severity, created_at = (tuple(state) + (None,))[:3]
+    status, severity = _value(status), _value(severity)
+
+    counters = Counter({
+        STATUS_COUNTERS.get(status): 1,
+        SEVERITY_COUNTERS.get(severity): 1,
+        "total_issues": 1,
+    })
+    if stats_day(created_at) == day:
+        counters["issues_created_today"] += 1
+
+    counters.pop(None, None)
+    return counters
+
+def issue_stats_delta(before: Optional[tuple] = None, after: Optional[tuple] = None) -> Counter:
+    """Counter changes for one issue going from `before` to `after`.
+
+    None means the issue doesn't exist on that side, so (None, after) is a
+    create and (before, None) a delete. A move into RESOLVED/CLOSED counts as
+    a close, like a resolution event in issue_events.
+    """
+    day = stats_day()
+    delta = Counter()
+    if after is not None:
+        delta.update(_issue_counters(after, day))
+    if before is not None:
+        delta.subtract(_issue_counters(before, day))
+
+    if is_resolution(before, after):
+        delta["issues_closed_today"] += 1
+    return delta
+
+def _ensure_day(db: Session, day: date):
+    """Create `day`'s row, carrying the snapshot counters over from the latest earlier day."""
+    if db.scalar(select(DailyStats.id).where(DailyStats.date == day)) is not None:
+        return
+
+    previous = db.scalar(
+        select(DailyStats).where(DailyStats.date < day).order_by(DailyStats.date.desc()).limit(1)
+    )
+    row = DailyStats(date=day, issues_created_today=0, issues_closed_today=0)
+    for counter in SNAPSHOT_COUNTERS:
+        setattr(row, counter, (getattr(previous, counter) or 0) if previous else 0)
+
+    try:
+        # Savepoint: a concurrent transaction may create the same day first
+        with db.begin_nested():
+            db.add(row)
+    except IntegrityError:
+        pass
+
+def apply_stats_delta(db: Session, delta: Counter, day: Optional[date] = None):
+    """Add `delta` to the day's DailyStats counters inside the caller's transaction.
+
+    A single UPDATE of col = col + n, so concurrent writers never lose
+    increments. Call it right before commit: the row stays locked until then.
+    """
+    delta = {counter: amount for counter, amount in delta.items() if amount}
+    if not delta:
+        return
+
+    day = day or stats_day()
+    table = DailyStats.__table__
+    statement = table.update().where(table.c.date == day).values({
+        counter: func.coalesce(table.c[counter], 0) + amount for counter, amount in delta.items()
+    })
+
+    if db.execute(statement).rowcount == 0:
+        _ensure_day(db, day)
+        db.execute(statement)
+
+def record_issue_changes(db: Session, changes, actor_id=None):
+    """Record (issue_id, before, after) issue changes in the caller's transaction.
+
+    Appends the issue_events rows, adds resolution times to the day's
+    sketches and applies the daily and hourly counters.
+    """
+    daily, hourly = Counter(), Counter()
+    for _, before, after in changes:
+        daily.update(issue_stats_delta(before, after))
+        hourly.update(issue_rollup_delta(before, after))
+
+    record_resolution_times(db, resolution_samples(db, changes))
+    record_issue_events(db, changes, actor_id)
+    apply_stats_delta(db, daily)
+    apply_rollup_delta(db, hourly)
+
+def closed_between(db: Session, start: datetime, end: datetime) -> int:
+    """Resolutions in [start, end) according to the event log."""
+    return db.scalar(
+        select(func.count(IssueEvent.id)).where(
+            resolution_condition(),
+            IssueEvent.occurred_at >= start,
+            IssueEvent.occurred_at < end
+        )
+    )
+
+def _snapshot_counters(state: Optional[tuple], day: date) -> Counter:
+    if state is None:
+        return Counter()
+    counters = _issue_counters(state, day)
+    return Counter({counter: counters[counter] for counter in SNAPSHOT_COUNTERS if counters[counter]})
+
+def _latest_events(issue_ids):
+    """Subquery: each issue's latest issue_events row, the state the deltas last counted."""
+    ranked = select(
+        IssueEvent.issue_id, IssueEvent.to_status, IssueEvent.to_severity,
+        func.row_number().over(
+            partition_by=IssueEvent.issue_id, order_by=IssueEvent.occurred_at.desc()
+        ).label("position")
+    ).where(IssueEvent.issue_id.in_(issue_ids)).subquery()
+    return select(ranked).where(ranked.c.position == 1).subquery()
+
+def _log_start(db: Session) -> Optional[datetime]:
+    """When the issue_events log began (its earliest event), None while it is empty."""
+    firsts = db.execute(select(*(
+        select(func.min(IssueEvent.occurred_at)).where(IssueEvent.event_type == event_type.value).scalar_subquery()
+        for event_type in IssueEventType
+    ))).one()
+    return min((first for first in firsts if first is not None), default=None)
+
+def repair_snapshot_drift(db: Session, since: datetime) -> Counter:
+    """Correct issues changed since `since` behind the deltas' back, in the caller's transaction.
+
+    Every issue whose row changed (updated_at) or that has events since
+    `since` is compared with the state its latest issue_events row recorded,
+    which is exactly what the deltas counted. A mismatch, a row without
+    events, or a row gone without a "deleted" event is drift: the difference
+    is applied to today's snapshot counters and a corrective event appended,
+    so the log matches the row and a second pass finds nothing. Each chunk
+    is read in one statement, so a concurrent API write (row, event and
+    delta commit together) is seen either whole or not at all. Returns the
+    applied correction.
+
+    Issues created before the log began have no events until their status
+    or severity changes, and the snapshot already counts them (rebuild_stats
+    does), so an edit that records no event, like a title change, is not
+    drift for them.
+    """
+    day = stats_day()
+    changed = set(db.scalars(
+        # status IN (all) lets ix_issues_status_updated_at serve the range
+        select(Issue.id).where(Issue.status.in_(list(IssueStatus)), Issue.updated_at >= since)
+    ))
+    changed.update(db.scalars(
+        select(IssueEvent.issue_id).distinct().where(
+            IssueEvent.event_type.in_([event_type.value for event_type in IssueEventType]),
+            IssueEvent.occurred_at >= since
+        )
+    ))
+
+    repairs = []
+    changed = list(changed)
+    log_start = _log_start(db) if changed else None
+    for offset in range(0, len(changed), RESCAN_CHUNK):
+        chunk = changed[offset:offset + RESCAN_CHUNK]
+        latest = _latest_events(chunk)
+
+        for issue_id, status, severity, created_at, logged, to_status, to_severity in db.execute(
+            select(
+                Issue.id, Issue.status, Issue.severity, Issue.created_at,
+                latest.c.issue_id, latest.c.to_status, latest.c.to_severity
+            )
+            .outerjoin(latest, latest.c.issue_id == Issue.id)
+            .where(Issue.id.in_(chunk))
+        ):
+            if logged is None and (log_start is None or created_at < log_start):
+                continue  # predates the log: counted without events
+            recorded = (to_status, to_severity) if to_status is not None else None
+            repairs.append((issue_id, recorded, (_value(status), _value(severity))))
+
+        # Rows deleted without a "deleted" event
+        for issue_id, to_status, to_severity in db.execute(
+            select(latest.c.issue_id, latest.c.to_status, latest.c.to_severity).where(
+                latest.c.to_status.is_not(None),
+                ~exists().where(Issue.id == latest.c.issue_id)
+            )
+        ):
+            repairs.append((issue_id, (to_status, to_severity), None))
+
+    repairs = [(issue_id, recorded, actual) for issue_id, recorded, actual in repairs if recorded != actual]
+    drift = Counter()
+    for _, recorded, actual in repairs:
+        drift.update(_snapshot_counters(actual, day))
+        drift.subtract(_snapshot_counters(recorded, day))
+
+    record_issue_events(db, repairs)
+    apply_stats_delta(db, drift)
+    return drift
+
+def reconcile_stats():
+    """Background job: cheap consistency pass over the incrementally kept counters.
+
+    Since the last checkpoint (the latest reconciled_at) it re-scans the
+    issues that changed and repairs snapshot drift in today's row (see
+    repair_snapshot_drift), rolls the snapshot forward to today, and recounts
+    created/closed for each of those days. This corrects the cases deltas
+    can't see (writes that bypassed the API) while only touching rows changed
+    since the checkpoint. Deletes leave no row to re-scan, so if the total
+    still disagrees with the table it falls back to rebuild_stats().
+
+    Runs hold RECONCILE_LOCK: two overlapping runs (the stats and cleanup
+    jobs both fire at midnight) would each see the same drift and apply it
+    twice, so a run that finds the lock taken is skipped.
+    """
+    with job_lock(RECONCILE_LOCK) as acquired:
+        if not acquired:
+            logger.info("Skipping daily stats reconcile: already running")
+            return
+        return _reconcile_stats()
+
+def _reconcile_stats():
+    db = SessionLocal()
+    try:
+        latest = db.scalar(select(DailyStats).order_by(DailyStats.date.desc()).limit(1))
+        if latest is None:
+            db.close()
+            return rebuild_stats()
+
+        today = stats_day()
+        checkpoint = latest.reconciled_at or datetime.combine(latest.date, time.min)
+        day = min(checkpoint.date(), today)
+        now = datetime.utcnow()
+
+        logger.info(f"Reconciling daily stats since {checkpoint}")
+
+        drift = {counter: amount for counter, amount in repair_snapshot_drift(db, checkpoint).items() if amount}
+        if drift:
+            logger.warning(f"Corrected daily stats drift since {checkpoint}: {drift}")
+
+        while day <= today:
+            _ensure_day(db, day)
+            day_start, day_end = _day_range(day)
+
+            created = db.scalar(
+                select(func.count(Issue.id)).where(
+                    Issue.created_at >= day_start,
+                    Issue.created_at < day_end
+                )
+            )
+            closed = closed_between(db, day_start, day_end)
+            db.execute(
+                DailyStats.__table__.update().where(DailyStats.date == day).values(
+                    issues_created_today=created,
+                    issues_closed_today=closed,
+                    reconciled_at=now
+                )
+            )
+            day += timedelta(days=1)
+
+        # Deletes that bypassed the API leave no changed row behind; one
+        # statement, so concurrent API writes can't make the two disagree
+        counted, snapshot_total = db.execute(
+            select(
+                func.count(Issue.id),
+                select(DailyStats.total_issues).where(DailyStats.date == today).scalar_subquery()
+            )
+        ).one()
+
+        db.commit()
+        logger.info("Daily stats reconciled")
+
+        if counted != snapshot_total:
+            logger.warning(f"Daily stats count {snapshot_total} issues, table has {counted}; rebuilding")
+            db.close()
+            return rebuild_stats()
+
+    except Exception as e:
+        logger.error(f"Error reconciling daily stats: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def rebuild_stats():
+    """Recompute today's DailyStats row from the whole issues table (admin use).
+
+    Today's row is locked first so deltas from concurrent writes are applied
+    after the rebuilt counts, not overwritten by them.
+    """
+
     db = SessionLocal()
     try:
-        today = date.today()
-        yesterday = today - timedelta(days=1)
-        
-        logger.info(f"Updating daily stats for {today}")
-        
-        # Get or create daily stats record
-        daily_stats = db.query(DailyStats).filter(DailyStats.date == today).first()
-        if not daily_stats:
-            daily_stats = DailyStats(date=today)
-            db.add(daily_stats)
-        
-        # Count issues by status
-        status_counts = db.query(
-            Issue.status,
-            func.count(Issue.id).label('count')
-        ).group_by(Issue.status).all()
-        
-        # Update status counts
-        for status, count in status_counts:
-            if status == IssueStatus.OPEN:
-                daily_stats.open_count = count
-            elif status == IssueStatus.TRIAGED:
-                daily_stats.triaged_count = count
-            elif status == IssueStatus.IN_PROGRESS:
-                daily_stats.in_progress_count = count
-            elif status == IssueStatus.DONE:
-                daily_stats.done_count = count
-        
-        # Count issues by severity
-        severity_counts = db.query(
-            Issue.severity,
-            func.count(Issue.id).label('count')
-        ).group_by(Issue.severity).all()
-        
-        # Update severity counts
-        for severity, count in severity_counts:
-            if severity == IssueSeverity.LOW:
-                daily_stats.low_count = count
-            elif severity == IssueSeverity.MEDIUM:
-                daily_stats.medium_count = count
-            elif severity == IssueSeverity.HIGH:
-                daily_stats.high_count = count
-            elif severity == IssueSeverity.CRITICAL:
-                daily_stats.critical_count = count
-        
-        # Total issues
-        daily_stats.total_issues = db.query(Issue).count()
-        
+        today = stats_day()
+        day_start, day_end = _day_range(today)
+
+        logger.info(f"Rebuilding daily stats for {today}")
+
+        _ensure_day(db, today)
+        daily_stats = db.scalar(
+            select(DailyStats).where(DailyStats.date == today).with_for_update()
+        )
+
+        counts = Counter()
+        for status, severity, count in db.execute(
+            select(Issue.status, Issue.severity, func.count(Issue.id)).group_by(Issue.status, Issue.severity)
+        ):
+            counts[STATUS_COUNTERS.get(_value(status))] += count
+            counts[SEVERITY_COUNTERS.get(_value(severity))] += count
+            counts["total_issues"] += count
+
+        for counter in SNAPSHOT_COUNTERS:
+            setattr(daily_stats, counter, counts[counter])
+
         # Issues created today
-        daily_stats.issues_created_today = db.query(Issue).filter(
-            func.date(Issue.created_at) == today
-        ).count()
-        
-        # Issues closed today (status changed to DONE today)
-        daily_stats.issues_closed_today = db.query(Issue).filter(
-            and_(
-                Issue.status == IssueStatus.DONE,
-                func.date(Issue.updated_at) == today
+        daily_stats.issues_created_today = db.scalar(
+            select(func.count(Issue.id)).where(
+                Issue.created_at >= day_start,
+                Issue.created_at < day_end
             )
-        ).count()
-        
+        )
+
+        # Issues closed today (resolution events)
+        daily_stats.issues_closed_today = closed_between(db, day_start, day_end)
+        daily_stats.reconciled_at = datetime.utcnow()
+
         db.commit()
-        logger.info(f"Daily stats updated successfully for {today}")
-        
+        logger.info(f"Daily stats rebuilt successfully for {today}")
+
         return {
             "date": today,
             "total_issues": daily_stats.total_issues,
             "created_today": daily_stats.issues_created_today,
             "closed_today": daily_stats.issues_closed_today
         }
-        
+
     except Exception as e:
-        logger.error(f"Error updating daily stats: {e}")
+        logger.error(f"Error rebuilding daily stats: {e}")
         db.rollback()
         raise
     finally:
@@ -95,19 +396,19 @@ def update_stats():
 
 def get_historical_stats(days: int = 30):
     """Get historical statistics for the last N days."""
-    
+
     db = SessionLocal()
     try:
-        end_date = date.today()
+        end_date = stats_day()
         start_date = end_date - timedelta(days=days)
-        
+
         stats = db.query(DailyStats).filter(
             and_(
                 DailyStats.date >= start_date,
                 DailyStats.date <= end_date
             )
         ).order_by(DailyStats.date.desc()).all()
-        
+
         return [
             {
                 "date": stat.date.isoformat(),
@@ -121,9 +422,9 @@ def get_historical_stats(days: int = 30):
             }
             for stat in stats
         ]
-        
+
     except Exception as e:
         logger.error(f"Error getting historical stats: {e}")
         raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,98 @@
+# backend/app/services/uploads.py
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pathlib import Path
+from typing import Optional, Tuple
+from app.core.config import settings
+import codecs
+import hashlib
+import os
+import uuid
+
+CHUNK_SIZE = 64 * 1024
+SNIFF_BYTES = 512
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Leading bytes of the binary formats we accept
+MAGIC_NUMBERS = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/msword"),
+]
+
+def sniff_content_type(head: bytes, filename: str = "") -> Optional[str]:
+    """Guess the real content type from the first bytes instead of trusting the client."""
+    for magic, content_type in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return content_type
+
+    extension = os.path.splitext(filename or "")[1].lower()
+
+    # .docx is a zip archive; any other zip is rejected
+    if head.startswith(b"PK\x03\x04"):
+        return DOCX_TYPE if extension == ".docx" else "application/zip"
+
+    # Plain text: no NUL bytes and valid UTF-8 (the sample may end mid-character)
+    if b"\x00" not in head:
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        except UnicodeDecodeError:
+            return None
+        return "text/csv" if extension == ".csv" else "text/plain"
+
+    return None
+
+def _write_chunk(buffer, digest, chunk: bytes):
+    digest.update(chunk)
+    buffer.write(chunk)
+
+async def save_upload(file: UploadFile, directory: Path) -> Tuple[str, str]:
+    """Stream an upload to disk without blocking the event loop.
+
+    Disk writes and hashing run in the threadpool one chunk at a time. The
+    upload is rejected as soon as it exceeds MAX_UPLOAD_SIZE or its sniffed
+    type is not in ALLOWED_FILE_TYPES, and any partial file is removed.
+    Returns the stored path and the SHA-256 hex digest.
+    """
+    if file.size is not None and file.size > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds {settings.MAX_UPLOAD_SIZE} bytes"
+        )
+
+    chunk = await file.read(CHUNK_SIZE)
+    content_type = sniff_content_type(chunk[:SNIFF_BYTES], file.filename)
+    if content_type not in settings.ALLOWED_FILE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"File type {content_type or 'unknown'} is not allowed"
+        )
+
+    extension = os.path.splitext(file.filename or "")[1].lower()
+    path = directory / f"{uuid.uuid4()}{extension}"
+    digest = hashlib.sha256()
+    size = 0
+
+    buffer = await run_in_threadpool(path.open, "wb")
+    try:
+        while chunk:
+            size += len(chunk)
+            if size > settings.MAX_UPLOAD_SIZE:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File exceeds {settings.MAX_UPLOAD_SIZE} bytes"
+                )
+            await run_in_threadpool(_write_chunk, buffer, digest, chunk)
+            chunk = await file.read(CHUNK_SIZE)
+    except BaseException:
+        await run_in_threadpool(buffer.close)
+        await run_in_threadpool(path.unlink, missing_ok=True)
+        raise
+
+    await run_in_threadpool(buffer.close)
+    return str(path), digest.hexdigest()
@@ -1,26 +1,30 @@
 # backend/app/services/user_service.py
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.core.security import get_password_hash, verify_password
 
-def get_user_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+# bcrypt hashing is deliberately slow, so it runs in the threadpool rather than on the event loop
 
-def create_user(db: Session, user: UserCreate):
+async def get_user_by_email(db: AsyncSession, email: str):
+    return await db.scalar(select(User).where(User.email == email))
+
+async def create_user(db: AsyncSession, user: UserCreate):
     db_user = User(
         email=user.email,
-        hashed_password=get_password_hash(user.password),
+        hashed_password=await run_in_threadpool(get_password_hash, user.password),
         role=user.role,
         name=user.name 
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = get_user_by_email(db, email)
-    if not user or not verify_password(password, user.hashed_password):
+async def authenticate_user(db: AsyncSession, email: str, password: str):
+    user = await get_user_by_email(db, email)
+    if not user or not await run_in_threadpool(verify_password, password, user.hashed_password):
         return False
-    return user
\ No newline at end of file
+    return user
@@ -1 +0,0 @@
-"""Worker module for background tasks."""
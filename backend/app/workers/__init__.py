@@ -0,0 +1,6 @@
+"""Background jobs: queue tasks and workers (python -m app.workers), and the scheduler."""
+
+from app.workers.queue import enqueue, enqueue_now, task, TASKS
+from app.workers import tasks
+
+__all__ = ["enqueue", "enqueue_now", "task", "TASKS"]
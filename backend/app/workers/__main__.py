@@ -0,0 +1,28 @@
+# backend/app/workers/__main__.py
+"""Run background job workers: python -m app.workers [--concurrency N] [--processes]"""
+
+import argparse
+import logging
+
+from app.core.config import settings
+from app.workers.runner import run_worker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consume the job_queue table.")
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY)
+    parser.add_argument("--processes", action="store_true", default=settings.WORKER_USE_PROCESSES,
+                        help="one process per worker instead of threads")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logging.getLogger(__name__).info(
+        f"Starting {args.concurrency} worker {'processes' if args.processes else 'threads'}"
+    )
+    run_worker(args.concurrency, args.processes)
+
+if __name__ == "__main__":
+    main()
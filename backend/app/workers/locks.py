@@ -0,0 +1,71 @@
+# backend/app/workers/locks.py
+
+from contextlib import contextmanager
+from pathlib import Path
+from sqlalchemy import text
+from app.core.config import settings
+from app.db.session import engine
+import hashlib
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, single-process development only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+def lock_key(name: str) -> int:
+    """Stable signed 64-bit key for pg advisory locks (hash() is salted per process)."""
+    return int.from_bytes(hashlib.sha1(name.encode()).digest()[:8], "big", signed=True)
+
+@contextmanager
+def _advisory_lock(name: str):
+    key = lock_key(name)
+    with engine.connect() as connection:
+        acquired = connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})
+        # Session-level lock: end the transaction so the connection isn't left idle in one
+        connection.commit()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                try:
+                    connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                    connection.commit()
+                except Exception:
+                    # Never hand a connection still holding the lock back to the pool
+                    connection.invalidate()
+                    raise
+
+@contextmanager
+def _file_lock(name: str):
+    if fcntl is None:
+        logger.warning(f"File locks unavailable; running job {name} without a lock")
+        yield True
+        return
+
+    lock_dir = Path(settings.SCHEDULER_LOCK_DIR)
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    with open(lock_dir / f"{name}.lock", "a") as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+def job_lock(name: str):
+    """Context manager yielding whether this process now holds the lock `name`.
+
+    Never blocks. PostgreSQL uses a session advisory lock, so it holds across
+    every process and host sharing the database; other databases (SQLite)
+    fall back to an flock in SCHEDULER_LOCK_DIR, which covers the processes
+    of one host.
+    """
+    if engine.dialect.name == "postgresql":
+        return _advisory_lock(name)
+    return _file_lock(name)
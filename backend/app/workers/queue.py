@@ -0,0 +1,177 @@
+# backend/app/workers/queue.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete, and_, or_
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.queued_job import QueuedJob, QueuedJobStatus
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+import json
+import logging
+import random
+import uuid
+
+logger = logging.getLogger(__name__)
+
+QUEUED = QueuedJobStatus.QUEUED.value
+RUNNING = QueuedJobStatus.RUNNING.value
+
+class Task:
+    def __init__(self, func: Callable, max_attempts: int, visibility_timeout: int):
+        self.func = func
+        self.max_attempts = max_attempts
+        self.visibility_timeout = visibility_timeout
+
+# Task name -> Task, filled by @task in app.workers.tasks
+TASKS = {}
+
+def task(name: Optional[str] = None, max_attempts: Optional[int] = None, visibility_timeout: Optional[int] = None):
+    """Register a function as a queue task. Payload keys are passed as keyword arguments."""
+
+    def decorator(func):
+        TASKS[name or func.__name__] = Task(
+            func,
+            max_attempts or settings.JOB_MAX_ATTEMPTS,
+            visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+        )
+        return func
+
+    return decorator
+
+def enqueue(db, name: str, payload: Optional[dict] = None, delay_seconds: float = 0) -> QueuedJob:
+    """Queue `name` in the caller's transaction; workers see it once that commits.
+
+    Works with Session, AsyncSession and ThreadpoolSession alike, so route
+    handlers enqueue alongside their own writes and return immediately.
+    """
+    if name not in TASKS:
+        raise ValueError(f"Unknown task: {name}")
+
+    job = QueuedJob(
+        id=uuid.uuid4(),
+        task=name,
+        payload=json.dumps(payload or {}),
+        max_attempts=TASKS[name].max_attempts,
+        run_at=datetime.utcnow() + timedelta(seconds=delay_seconds),
+        created_at=datetime.utcnow()
+    )
+    db.add(job)
+    return job
+
+def enqueue_now(name: str, payload: Optional[dict] = None) -> uuid.UUID:
+    """Queue `name` in its own transaction, for code outside a request (scheduler, scripts)."""
+    db = SessionLocal()
+    try:
+        job = enqueue(db, name, payload)
+        db.commit()
+        return job.id
+    finally:
+        db.close()
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter, so failed jobs don't retry in lockstep."""
+    delay = min(settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+def _claimable(now: datetime):
+    return or_(
+        and_(QueuedJob.status == QUEUED, QueuedJob.run_at <= now),
+        and_(QueuedJob.status == RUNNING, QueuedJob.locked_until < now)
+    )
+
+def claim_job(db: Session, worker_id: str) -> Optional[QueuedJob]:
+    """Lease the next due job to worker_id, or return None when nothing is due.
+
+    On PostgreSQL FOR UPDATE SKIP LOCKED lets concurrent workers pass over
+    rows another worker is claiming; the guarded UPDATE keeps the claim
+    exclusive on databases without it (SQLite).
+    """
+    now = datetime.utcnow()
+    due = db.execute(
+        select(QueuedJob.id, QueuedJob.task).where(_claimable(now))
+        .order_by(QueuedJob.run_at).limit(1)
+        .with_for_update(skip_locked=True)
+    ).first()
+    if due is None:
+        db.rollback()
+        return None
+
+    job_id = due.id
+    timeout = TASKS[due.task].visibility_timeout if due.task in TASKS else settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+    claimed = db.execute(
+        update(QueuedJob).where(QueuedJob.id == job_id, _claimable(now)).values(
+            status=RUNNING,
+            attempts=QueuedJob.attempts + 1,
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=timeout),
+            started_at=now
+        )
+    ).rowcount
+    db.commit()
+    if not claimed:
+        return None
+
+    job = db.get(QueuedJob, job_id)
+    db.expunge(job)
+    return job
+
+def finish_job(db: Session, job: QueuedJob, worker_id: str, error: Optional[str] = None, retry: bool = True):
+    """Record the outcome of a leased job: done, queued again with backoff, or failed.
+
+    Matching on locked_by and attempts ignores a worker whose lease already
+    expired and was handed to someone else.
+    """
+    now = datetime.utcnow()
+    if error is None:
+        values = {"status": QueuedJobStatus.SUCCEEDED.value, "finished_at": now, "last_error": None}
+    elif retry and job.attempts < job.max_attempts:
+        values = {"status": QUEUED, "run_at": now + timedelta(seconds=retry_delay(job.attempts)), "last_error": error}
+    else:
+        values = {"status": QueuedJobStatus.FAILED.value, "finished_at": now, "last_error": error}
+
+    finished = db.execute(
+        update(QueuedJob).where(
+            QueuedJob.id == job.id,
+            QueuedJob.locked_by == worker_id,
+            QueuedJob.attempts == job.attempts
+        ).values(locked_by=None, locked_until=None, **values)
+    ).rowcount
+    db.commit()
+    if not finished:
+        logger.warning(f"Job {job.id} ({job.task}) finished after its lease expired; result discarded")
+
+def run_job(job: QueuedJob, worker_id: str):
+    """Execute a leased job and record how it went."""
+    task = TASKS.get(job.task)
+    error, retry = None, True
+    if task is None:
+        error, retry = f"Unknown task: {job.task}", False
+    elif job.attempts > job.max_attempts:
+        # Its last attempt's lease expired (worker crashed or hung)
+        error, retry = "Visibility timeout expired on the final attempt", False
+    else:
+        try:
+            task.func(**json.loads(job.payload))
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.task}) attempt {job.attempts} failed: {e}")
+            error = f"{type(e).__name__}: {e}"
+
+    db = SessionLocal()
+    try:
+        finish_job(db, job, worker_id, error, retry)
+    finally:
+        db.close()
+
+def prune_finished_jobs(older_than: timedelta) -> int:
+    """Delete succeeded and failed jobs that finished more than `older_than` ago."""
+    db = SessionLocal()
+    try:
+        deleted = db.execute(delete(QueuedJob).where(
+            QueuedJob.status.in_([QueuedJobStatus.SUCCEEDED.value, QueuedJobStatus.FAILED.value]),
+            QueuedJob.finished_at < datetime.utcnow() - older_than
+        )).rowcount
+        db.commit()
+        return deleted
+    finally:
+        db.close()
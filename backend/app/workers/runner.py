@@ -0,0 +1,88 @@
+# backend/app/workers/runner.py
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.workers.queue import claim_job, run_job
+import multiprocessing
+import logging
+import os
+import signal
+import socket
+import threading
+
+logger = logging.getLogger(__name__)
+
+def work(worker_id: str, stop: threading.Event, poll_interval: float):
+    """Claim and run jobs until `stop` is set; sleeps poll_interval when the queue is empty."""
+    while not stop.is_set():
+        db = SessionLocal()
+        try:
+            job = claim_job(db, worker_id)
+        except Exception as e:
+            logger.error(f"Worker {worker_id} could not claim a job: {e}")
+            job = None
+        finally:
+            db.close()
+
+        if job is None:
+            stop.wait(poll_interval)
+            continue
+
+        logger.info(f"Worker {worker_id} running {job.task} ({job.id}), attempt {job.attempts}")
+        run_job(job, worker_id)
+
+def run_threads(threads: int):
+    """Run `threads` workers in this process until SIGINT/SIGTERM, letting current jobs finish."""
+    stop = threading.Event()
+
+    def shutdown(signum, frame):
+        logger.info("Worker shutting down after current jobs...")
+        stop.set()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    workers = [
+        threading.Thread(
+            target=work,
+            args=(f"{prefix}:{index}", stop, settings.WORKER_POLL_INTERVAL_SECONDS),
+            name=f"worker-{index}"
+        )
+        for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+def _process_main(log_level: str):
+    # Spawned children start without the parent's logging setup
+    logging.basicConfig(level=log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    run_threads(1)
+
+def run_worker(concurrency: int, use_processes: bool = False):
+    """Run `concurrency` worker threads, or that many single-threaded processes.
+
+    Processes suit CPU-heavy tasks (rebuilds); threads are enough for jobs
+    that mostly wait on the database.
+    """
+    if not use_processes:
+        run_threads(concurrency)
+        return
+
+    # Spawned children build their own engine and connection pool
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_process_main, args=(settings.LOG_LEVEL,), name=f"worker-{index}") for index in range(concurrency)]
+    for process in processes:
+        process.start()
+
+    def shutdown(signum, frame):
+        logger.info("Stopping worker processes after current jobs...")
+        for process in processes:
+            process.terminate()  # SIGTERM: each child finishes its current job
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+    for process in processes:
+        process.join()
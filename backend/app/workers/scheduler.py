@@ -1,47 +1,150 @@
-# backend/app/worker/scheduler.py
+# backend/app/workers/scheduler.py
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
-from app.services.stats import update_stats
+from sqlalchemy import text, update, delete
+from sqlalchemy.exc import IntegrityError
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.job_run import JobRun, JobRunStatus
+from app.services import stats
+from app.workers.locks import job_lock
+from app.core.metrics import JOB_DURATION
+from app.core.event_stream import prune_stream_events
+from app.workers.queue import enqueue_now, prune_finished_jobs
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 import logging
 import atexit
+import functools
+import os
+import socket
+import time
 
 logger = logging.getLogger(__name__)
 
 # Create scheduler instance
-scheduler = BackgroundScheduler()
+scheduler = BackgroundScheduler(timezone=timezone.utc)
+
+# Every process anchors its interval triggers here, so all workers share the
+# same tick boundaries and a tick can be identified by its start time
+TICK_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+def tick_of(moment: datetime, interval: timedelta) -> datetime:
+    """Start (naive UTC) of the interval tick `moment` falls in."""
+    epoch = TICK_EPOCH.replace(tzinfo=None)
+    return epoch + (moment - epoch) // interval * interval
+
+def claim_run(job_id: str, scheduled_for: datetime) -> Optional[JobRun]:
+    """Record that this worker runs the tick; None if another worker already did."""
+    db = SessionLocal()
+    try:
+        run = JobRun(job_id=job_id, scheduled_for=scheduled_for, worker=WORKER_ID, started_at=datetime.utcnow())
+        db.add(run)
+        db.commit()
+        db.refresh(run)
+        db.expunge(run)
+        return run
+    except IntegrityError:
+        db.rollback()
+        return None
+    finally:
+        db.close()
+
+def finish_run(run: JobRun, status: JobRunStatus, duration: float, error: Optional[str] = None):
+    db = SessionLocal()
+    try:
+        db.execute(update(JobRun).where(JobRun.id == run.id).values(
+            status=status.value,
+            finished_at=datetime.utcnow(),
+            duration_ms=round(duration * 1000, 3),
+            error=error
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+def run_job(job_id: str, func, interval: timedelta):
+    """Run `func` for the current tick unless another worker holds or already ran it.
+
+    The job lock keeps runs from overlapping; the unique (job_id,
+    scheduled_for) row makes a tick run once even when workers fire it a
+    little apart. Duration and outcome are kept in job_runs.
+    """
+    scheduled_for = tick_of(datetime.utcnow(), interval)
+    with job_lock(job_id) as acquired:
+        if not acquired:
+            logger.debug(f"Skipping {job_id}: running on another worker")
+            return
+
+        run = claim_run(job_id, scheduled_for)
+        if run is None:
+            logger.debug(f"Skipping {job_id}: tick {scheduled_for} already ran")
+            return
+
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            outcome, error = JobRunStatus.FAILED, str(e)
+        else:
+            outcome, error = JobRunStatus.SUCCEEDED, None
+        
+        duration = time.perf_counter() - started
+        JOB_DURATION.observe(duration, (job_id, outcome.value))
+        finish_run(run, outcome, duration, error=error)
+
+def add_cluster_job(func, interval: timedelta, job_id: str, name: str):
+    scheduler.add_job(
+        func=run_job,
+        args=[job_id, func, interval],
+        trigger=IntervalTrigger(seconds=interval.total_seconds(), start_date=TICK_EPOCH),
+        id=job_id,
+        name=name,
+        replace_existing=True
+    )
+
+def job_body(func, task_name: str):
+    """`func` itself, or with SCHEDULER_USE_QUEUE a stub that queues it for app.workers."""
+    if settings.SCHEDULER_USE_QUEUE:
+        return functools.partial(enqueue_now, task_name)
+    return func
 
 def start_scheduler():
-    """Start the background scheduler with all jobs."""
+    """Start the background scheduler with all jobs.
+
+    Every API worker runs a scheduler, but each tick of each job executes on
+    only one of them (see run_job).
+    """
     
     logger.info("Starting background scheduler...")
     
-    # Add stats update job - every 30 minutes
-    scheduler.add_job(
-        func=update_stats,
-        trigger=IntervalTrigger(minutes=30),
-        id='update_stats_job',
-        name='Update daily statistics',
-        replace_existing=True
+    # Add stats reconciliation job. Counters are kept current by the issue
+    # endpoints; this only rechecks recent days.
+    add_cluster_job(
+        job_body(stats.reconcile_stats, 'reconcile_stats'),
+        timedelta(minutes=settings.STATS_UPDATE_INTERVAL_MINUTES),
+        'update_stats_job',
+        'Reconcile daily statistics'
     )
     
-    # Add daily cleanup job - at midnight
-    scheduler.add_job(
-        func=daily_cleanup,
-        trigger=CronTrigger(hour=0, minute=0),
-        id='daily_cleanup_job',
-        name='Daily cleanup tasks',
-        replace_existing=True
+    # Add daily cleanup job - at midnight UTC
+    add_cluster_job(
+        job_body(daily_cleanup, 'daily_cleanup'),
+        timedelta(hours=settings.CLEANUP_INTERVAL_HOURS),
+        'daily_cleanup_job',
+        'Daily cleanup tasks'
     )
     
-    # Add health check job - every 5 minutes
-    scheduler.add_job(
-        func=health_check,
-        trigger=IntervalTrigger(minutes=5),
-        id='health_check_job',
-        name='System health check',
-        replace_existing=True
+    # Add health check job
+    add_cluster_job(
+        health_check,
+        timedelta(minutes=settings.HEALTH_CHECK_INTERVAL_MINUTES),
+        'health_check_job',
+        'System health check'
     )
     
     scheduler.start()
@@ -50,35 +153,44 @@ def start_scheduler():
     # Shut down scheduler when exiting
     atexit.register(lambda: scheduler.shutdown())
 
-def daily_cleanup():
-    """Daily cleanup tasks."""
+def prune_job_runs():
+    """Drop scheduler history and finished queue jobs older than JOB_HISTORY_DAYS."""
+    db = SessionLocal()
     try:
-        logger.info("Running daily cleanup tasks...")
-        
-        # Clean up old log files, temp files, etc.
-        # This is where you'd add cleanup logic
-        
-        # Run stats update as part of daily cleanup
-        update_stats()
-        
-        logger.info("Daily cleanup completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Error during daily cleanup: {e}")
+        cutoff = datetime.utcnow() - timedelta(days=settings.JOB_HISTORY_DAYS)
+        deleted = db.execute(delete(JobRun).where(JobRun.started_at < cutoff)).rowcount
+        db.commit()
+    finally:
+        db.close()
+    
+    finished = prune_finished_jobs(timedelta(days=settings.JOB_HISTORY_DAYS))
+    logger.info(f"Pruned {deleted} job runs and {finished} finished queue jobs")
+
+def daily_cleanup():
+    """Daily cleanup tasks. Errors propagate so the run is recorded as failed."""
+    logger.info("Running daily cleanup tasks...")
+    
+    # Clean up old log files, temp files, etc.
+    # This is where you'd add cleanup logic
+    prune_job_runs()
+    if settings.SSE_PERSIST_EVENTS:
+        logger.info(f"Pruned {prune_stream_events()} stream events")
+    
+    # Roll the stats over to the new day (skipped if the stats job's run holds the lock)
+    stats.reconcile_stats()
+    
+    logger.info("Daily cleanup completed successfully")
 
 def health_check():
     """Basic system health check."""
+    # Check database connection
+    db = SessionLocal()
     try:
-        # Check database connection
-        from app.db.session import SessionLocal
-        db = SessionLocal()
-        db.execute("SELECT 1")
+        db.execute(text("SELECT 1"))
+    finally:
         db.close()
-        
-        logger.debug("Health check passed")
-        
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
+    
+    logger.debug("Health check passed")
 
 # For testing/manual execution
 if __name__ == "__main__":
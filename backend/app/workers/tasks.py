@@ -0,0 +1,27 @@
+# backend/app/workers/tasks.py
+
+from app.core.cache import cache
+from app.workers.queue import task
+from app.workers import scheduler
+from app.services import stats, rollups
+
+@task(visibility_timeout=1800)
+def rebuild_stats():
+    """Full recount of today's daily stats."""
+    stats.rebuild_stats()
+    # Only once the recount has committed, so no request re-caches the old figures
+    cache.invalidate_blocking("issues")
+
+@task()
+def reconcile_stats():
+    stats.reconcile_stats()
+
+@task(visibility_timeout=1800)
+def rebuild_rollups():
+    """Recompute settled hourly_stats rows from the issue_events log."""
+    rollups.rebuild_rollups()
+    cache.invalidate_blocking("issues")
+
+@task()
+def daily_cleanup():
+    scheduler.daily_cleanup()
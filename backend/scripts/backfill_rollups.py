@@ -0,0 +1,27 @@
+# backend/scripts/backfill_rollups.py
+"""Build the hourly_stats rollups from the issue_events log.
+
+Replays the log once as a server-side stream (issues older than the log
+are seeded from the issues table) and replaces the settled rollup rows, so it is
+safe to re-run:
+
+    python -m scripts.backfill_rollups
+
+Hours still receiving live changes are left alone (see
+rebuild_rollups), so it can run under traffic.
+"""
+
+import logging
+import sys
+
+from app.services.rollups import rebuild_rollups
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO)
+    hours = rebuild_rollups()
+    print(f"Wrote {hours} hourly rollups")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
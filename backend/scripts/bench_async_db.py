@@ -0,0 +1,102 @@
+# backend/scripts/bench_async_db.py
+"""Compare request throughput with the threadpool session and the async engine.
+
+Starts the API under uvicorn (one worker) once with USE_ASYNC_DB off, where
+the async routes run each query through a ThreadpoolSession, and once with
+it on, where they use an AsyncSession on the async driver (asyncpg, or
+aiosqlite for SQLite). Each time it drives --concurrency concurrent clients
+at the issue list for --seconds and reports requests/s, p50 and p99:
+
+    python -m scripts.bench_async_db --concurrency 64 --seconds 10
+
+Run it against a migrated (and ideally seeded, see bench_dashboard)
+scratch database: it adds a throwaway ADMIN user.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+from app.core.security import create_access_token
+from app.db.session import SessionLocal
+from app.models.user import User, RoleEnum
+from scripts.check_upload_latency import wait_until_ready
+
+def create_admin() -> str:
+    email = f"bench-async-{uuid.uuid4().hex[:8]}@example.com"
+    db = SessionLocal()
+    try:
+        db.add(User(email=email, name="Async benchmark", hashed_password="!", role=RoleEnum.ADMIN))
+        db.commit()
+    finally:
+        db.close()
+    return email
+
+async def drive(base_url: str, headers: dict, path: str, concurrency: int, seconds: float) -> list:
+    timings = []
+    deadline = time.monotonic() + seconds
+
+    async def client_loop(client: httpx.AsyncClient):
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            timings.append((time.perf_counter() - start) * 1000)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60) as client:
+        await client.get(path)  # warm-up
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return timings
+
+def load(base_url: str, headers: dict, path: str, concurrency: int, seconds: float) -> list:
+    """Runs in a load process, so the client's own event loop isn't the bottleneck."""
+    return asyncio.run(drive(base_url, headers, path, concurrency, seconds))
+
+def bench(args, use_async: bool, headers: dict) -> dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        env={**os.environ, "USE_ASYNC_DB": str(use_async).lower()}
+    )
+    try:
+        wait_until_ready(base_url, server)
+        per_process = max(1, args.concurrency // args.load_processes)
+        with multiprocessing.Pool(args.load_processes) as pool:
+            results = pool.starmap(load, [(base_url, headers, args.path, per_process, args.seconds)] * args.load_processes)
+    finally:
+        server.terminate()
+        server.wait()
+
+    timings = sorted(timing for result in results for timing in result)
+    return {
+        "rps": len(timings) / args.seconds,
+        "p50": statistics.median(timings),
+        "p99": timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--path", default="/api/issues/?limit=50")
+    parser.add_argument("--load-processes", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': create_admin()})}"}
+    for label, use_async in (("threadpool session", False), ("async engine", True)):
+        result = bench(args, use_async, headers)
+        print(f"{label:>18}: {result['rps']:.0f} req/s, p50 {result['p50']:.1f} ms, p99 {result['p99']:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# backend/scripts/bench_dashboard.py
+"""Measure dashboard summary latency (p50/p99).
+
+Seeds synthetic issues if asked, then times the summary the dashboard
+endpoints run:
+
+    python -m scripts.bench_dashboard --seed 1000000 --runs 200
+
+Seeded rows are ordinary issues owned by the first user; run it against a
+scratch database.
+"""
+
+from sqlalchemy import select, insert
+from datetime import datetime, timedelta
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+
+from app.db.session import SessionLocal, ThreadpoolSession
+from app.models.issue import Issue, IssueStatus, IssueSeverity
+from app.models.user import User
+from app.services.dashboard import dashboard_summary
+
+SEED_BATCH = 10000
+
+def seed(count: int, description_size: int = 0):
+    db = SessionLocal()
+    try:
+        owner = db.scalar(select(User.id).limit(1))
+        if owner is None:
+            raise SystemExit("Create a user before seeding issues")
+
+        start = datetime.utcnow() - timedelta(days=365)
+        for offset in range(0, count, SEED_BATCH):
+            rows = []
+            for _ in range(min(SEED_BATCH, count - offset)):
+                created_at = start + timedelta(seconds=random.randrange(365 * 86400))
+                rows.append({
+                    "id": uuid.uuid4(),
+                    "title": "Benchmark issue",
+                    "description": random.randbytes(description_size // 2).hex() or None,
+                    "status": random.choice(list(IssueStatus)),
+                    "severity": random.choice(list(IssueSeverity)),
+                    "created_by": owner,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                })
+            db.execute(insert(Issue), rows)
+            db.commit()
+            print(f"seeded {offset + len(rows)}/{count}", end="\r")
+        print()
+    finally:
+        db.close()
+
+async def measure(runs: int) -> list:
+    db = ThreadpoolSession(SessionLocal())
+    try:
+        await dashboard_summary(db)  # warm-up
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            await dashboard_summary(db)
+            timings.append((time.perf_counter() - start) * 1000)
+            await db.rollback()
+        return timings
+    finally:
+        await db.close()
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, help="insert this many synthetic issues first")
+    parser.add_argument("--runs", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.seed)
+
+    timings = sorted(asyncio.run(measure(args.runs)))
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{args.runs} runs: p50 {statistics.median(timings):.1f} ms, p99 {p99:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
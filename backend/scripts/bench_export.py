@@ -0,0 +1,80 @@
+# backend/scripts/bench_export.py
+"""Measure export throughput and check memory stays flat as rows stream out.
+
+Seeds synthetic issues if asked, then drains the same line generator
+GET /api/issues/export streams (as an ADMIN, no filters), sampling the
+process RSS as it goes, and fails if RSS grows by more than --max-growth-mb
+after the first batch:
+
+    python -m scripts.bench_export --seed 1000000 --format ndjson
+
+Seeded rows are ordinary issues owned by the first user; run it against a
+scratch database.
+"""
+
+from types import SimpleNamespace
+import argparse
+import os
+import resource
+import sys
+import time
+import uuid
+
+from app.api.issue import filtered_issues_query
+from app.core.config import settings
+from app.models.user import RoleEnum
+from app.services.export import export_issues
+from scripts.bench_dashboard import seed
+
+SAMPLES = 10
+
+def rss_mb() -> float:
+    """Current resident set size; falls back to the peak where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, help="insert this many synthetic issues first")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--max-growth-mb", type=float, default=20.0)
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.seed)
+
+    admin = SimpleNamespace(role=RoleEnum.ADMIN, id=uuid.uuid4())
+    lines = export_issues(filtered_issues_query(admin), args.format)
+
+    before = rss_mb()
+    start = time.perf_counter()
+    rows = size = 0  # one line per row; the CSV header goes out with the first
+    samples = []
+    for line in lines:
+        rows += 1
+        size += len(line)
+        if rows % settings.EXPORT_BATCH_SIZE == 0:
+            samples.append((rows, rss_mb()))
+    elapsed = time.perf_counter() - start
+    samples.append((rows, rss_mb()))
+
+    print(f"{rows} rows, {size / 2 ** 20:.1f} MB of {args.format} in {elapsed:.1f} s ({rows / max(elapsed, 1e-9):.0f} rows/s)")
+
+    step = max(1, len(samples) // SAMPLES)
+    print(f"RSS before: {before:.1f} MB")
+    for sampled_rows, rss in samples[::step] + ([samples[-1]] if (len(samples) - 1) % step else []):
+        print(f"RSS after {sampled_rows:>9} rows: {rss:.1f} MB")
+
+    first_batch = samples[0][1]
+    peak = max(rss for _, rss in samples)
+    print(f"growth after the first batch: {peak - first_batch:.1f} MB (peak {peak:.1f} MB)")
+    if peak - first_batch > args.max_growth_mb:
+        print(f"FAIL: RSS grew by more than {args.max_growth_mb} MB while streaming")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
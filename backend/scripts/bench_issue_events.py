@@ -0,0 +1,95 @@
+# backend/scripts/bench_issue_events.py
+"""Compare naive and coalesced issue change notifications during bulk triage.
+
+Simulates a burst of updates (every issue changed several times in quick
+succession) for a set of in-memory WebSocket clients, once sending a frame per
+mutation with json.dumps per broadcast and once through the coalescing
+IssueEventBuffer, and reports frames per client and CPU per event:
+
+    python -m scripts.bench_issue_events --connections 1000 --issues 200 --updates 5
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from datetime import datetime
+
+from app.core.issue_events import event_message, orjson
+from app.core.websocket import ConnectionManager, DROPPED_FRAMES
+
+class FakeSocket:
+    frames = 0
+    bytes = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        FakeSocket.frames += 1
+        FakeSocket.bytes += len(text)
+
+    async def close(self, code: int = 1000):
+        pass
+
+def triage_burst(issues: int, updates: int):
+    """(issue data, actor) per mutation: each issue changed `updates` times, interleaved."""
+    ids = [str(uuid.uuid4()) for _ in range(issues)]
+    owner = str(uuid.uuid4())
+    severities = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+    for round_ in range(updates):
+        for index, issue_id in enumerate(ids):
+            yield {
+                "id": issue_id, "title": f"Issue {index}", "status": "IN_PROGRESS",
+                "severity": severities[(index + round_) % 4], "created_by": owner, "assigned_to": None,
+                "created_at": "2026-01-01T00:00:00", "updated_at": datetime.utcnow().isoformat()
+            }, "triager@example.com"
+
+async def run(mode: str, connections: int, issues: int, updates: int):
+    manager = ConnectionManager()
+    for index in range(connections):
+        await manager.connect(FakeSocket(), f"user-{index}", "ADMIN")
+    await asyncio.sleep(0)
+    FakeSocket.frames = FakeSocket.bytes = 0
+    dropped_before = sum(DROPPED_FRAMES._values.values())
+
+    events = list(triage_burst(issues, updates))
+    started, cpu_started = time.perf_counter(), time.thread_time()
+    for data, actor in events:
+        if mode == "naive":
+            message = event_message("issue_updated", data, actor)
+            manager.deliver_frame(json.dumps(message, default=str), data)
+        else:
+            await manager.notify_issue_updated(data, actor)
+    manager.events.flush()
+    cpu = time.thread_time() - cpu_started
+    while any(connection.queue for connection in manager.connections.values()):
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{mode:>9}: {len(events)} events -> {FakeSocket.frames // connections} frames per client, "
+        f"{FakeSocket.bytes // connections / 1024:.0f} KiB per client, "
+        f"{cpu / len(events) * 1e6:.1f} us CPU per event to encode and queue, "
+        f"{elapsed * 1000:.0f} ms until delivered, "
+        f"{(sum(DROPPED_FRAMES._values.values()) - dropped_before) // connections} dropped per client (full queue)"
+    )
+    for websocket in list(manager.connections):
+        manager.disconnect(websocket)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare naive and coalesced issue notifications.")
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--issues", type=int, default=200)
+    parser.add_argument("--updates", type=int, default=5, help="changes per issue within the burst")
+    args = parser.parse_args()
+
+    print(f"encoder: {'orjson' if orjson is not None else 'json'}")
+    for mode in ("naive", "coalesced"):
+        asyncio.run(run(mode, args.connections, args.issues, args.updates))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
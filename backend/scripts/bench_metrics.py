@@ -0,0 +1,72 @@
+# backend/scripts/bench_metrics.py
+"""Measure the per-request cost of the /metrics instrumentation.
+
+Drives a no-op ASGI app with and without MetricsMiddleware (plus a bare
+histogram observe) and reports the microseconds added per request, so a
+change to app/core/metrics.py can be checked against the budget. Like
+timeit, each figure is the best of --repeats interleaved rounds, so a busy
+machine doesn't fail the check:
+
+    python -m scripts.bench_metrics --requests 200000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from app.core.metrics import Histogram, MetricsMiddleware, REGISTRY
+
+BUDGET_US = 5.0
+
+class Route:
+    path = "/api/issues/{issue_id}"
+
+async def endpoint(scope, receive, send):
+    scope["route"] = Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+async def receive():
+    return {"type": "http.request"}
+
+async def send(message):
+    pass
+
+async def per_request_us(app, requests: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/issues/1"}
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure metrics instrumentation overhead.")
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    middleware = MetricsMiddleware(endpoint)
+    rounds = [
+        (asyncio.run(per_request_us(endpoint, args.requests)), asyncio.run(per_request_us(middleware, args.requests)))
+        for _ in range(args.repeats)
+    ]
+    baseline = min(bare for bare, _ in rounds)
+    instrumented = min(timed for _, timed in rounds)
+    overhead = instrumented - baseline
+
+    histogram = Histogram("bench_observe_seconds", "Benchmark only.", ("route",))
+    REGISTRY.remove(histogram)
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        histogram.observe(0.003, ("/api/issues/",))
+    observe = (time.perf_counter() - started) / args.requests * 1e6
+
+    print(f"bare request:      {baseline:.2f} us")
+    print(f"with middleware:   {instrumented:.2f} us")
+    print(f"overhead:          {overhead:.2f} us per request (budget {BUDGET_US:.1f} us)")
+    print(f"histogram observe: {observe:.2f} us")
+    return 0 if overhead <= BUDGET_US else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
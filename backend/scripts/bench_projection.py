@@ -0,0 +1,111 @@
+# backend/scripts/bench_projection.py
+"""Measure what a `fields=` projection saves on the issue list (p50/p99 and payload size).
+
+Seeds synthetic issues with descriptions if asked, then times the list
+page's keyset query loading full Issue rows against the projected columns,
+and the whole GET /api/issues/ request with and without `fields=`, reporting
+the response size of each:
+
+    python -m scripts.bench_projection --seed 100000 --description-size 2000 --runs 200
+
+Seeded rows are ordinary issues owned by the first user; run it against a
+scratch database. It also adds a throwaway ADMIN user.
+"""
+
+from fastapi.testclient import TestClient
+from types import SimpleNamespace
+import argparse
+import statistics
+import sys
+import time
+import uuid
+
+from app.api.issue import filtered_issues_query, parse_fields
+from app.core.pagination import apply_keyset
+from app.core.security import create_access_token
+from app.db.session import SessionLocal
+from app.main import app
+from app.models.issue import Issue
+from app.models.user import User, RoleEnum
+from scripts.bench_dashboard import seed
+
+def create_admin() -> str:
+    email = f"bench-projection-{uuid.uuid4().hex[:8]}@example.com"
+    db = SessionLocal()
+    try:
+        db.add(User(email=email, name="Projection benchmark", hashed_password="!", role=RoleEnum.ADMIN))
+        db.commit()
+    finally:
+        db.close()
+    return email
+
+def summary(timings: list) -> str:
+    timings = sorted(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return f"p50 {statistics.median(timings):.1f} ms, p99 {p99:.1f} ms"
+
+def time_queries(runs: int, limit: int, fields: str) -> dict:
+    """The list page's statement, as list_issues runs it with and without a projection."""
+    admin = SimpleNamespace(role=RoleEnum.ADMIN, id=uuid.uuid4())
+    query = apply_keyset(filtered_issues_query(admin), Issue.created_at, Issue.id).limit(limit + 1)
+    columns = dict.fromkeys(parse_fields(fields) + ["created_at", "updated_at"])
+    projected = query.with_only_columns(*(Issue.__table__.c[name] for name in columns))
+
+    loads = {
+        "full rows": lambda db: db.scalars(query).all(),
+        f"fields={fields}": lambda db: db.execute(projected).all(),
+    }
+    db = SessionLocal()
+    try:
+        timings = {}
+        for label, load in loads.items():
+            load(db)  # warm-up
+            timings[label] = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                load(db)
+                timings[label].append((time.perf_counter() - start) * 1000)
+                db.rollback()  # drop the identity map so every run loads the rows again
+        return timings
+    finally:
+        db.close()
+
+def time_requests(runs: int, limit: int, fields: str) -> dict:
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': create_admin()})}"
+
+    results = {}
+    for label, params in (("full rows", {"limit": limit}), (f"fields={fields}", {"limit": limit, "fields": fields})):
+        client.get("/api/issues/", params=params).raise_for_status()  # warm-up
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            response = client.get("/api/issues/", params=params)
+            timings.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+        results[label] = (timings, len(response.content))
+    return results
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, help="insert this many synthetic issues first")
+    parser.add_argument("--description-size", type=int, default=2000, help="characters per seeded description")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--fields", default="title,status,severity")
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.seed, args.description_size)
+
+    print(f"query, {args.runs} runs of one {args.limit}-issue page:")
+    for label, timings in time_queries(args.runs, args.limit, args.fields).items():
+        print(f"  {label:>28}: {summary(timings)}")
+
+    print(f"GET /api/issues/, {args.runs} runs:")
+    for label, (timings, size) in time_requests(args.runs, args.limit, args.fields).items():
+        print(f"  {label:>28}: {summary(timings)}, {size / 1024:.1f} KB per page")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# backend/scripts/bench_websocket_broadcast.py
+"""Measure WebSocket broadcast latency with a share of stalled clients.
+
+Connects in-memory fake sockets to a ConnectionManager, some of which never
+finish a send, then times how long broadcast() takes to return and how long
+until every healthy client has the message:
+
+    python -m scripts.bench_websocket_broadcast --connections 10000 --stalled 0.05 --messages 50
+
+With per-connection send queues the stalled clients only fill their own
+queues; neither number should grow with the stalled share.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from app.core.websocket import ConnectionManager, DROPPED_FRAMES
+
+class FakeSocket:
+    delivered = 0
+    target = 0
+    all_delivered = None
+
+    def __init__(self, stalled: bool):
+        self.stalled = stalled
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.stalled:
+            await asyncio.sleep(3600)
+        FakeSocket.delivered += 1
+        if FakeSocket.delivered >= FakeSocket.target:
+            FakeSocket.all_delivered.set()
+
+    async def close(self, code: int = 1000):
+        pass
+
+def percentiles(samples_ms) -> str:
+    ordered = sorted(samples_ms)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {statistics.median(ordered):.2f} ms, p99 {p99:.2f} ms, max {ordered[-1]:.2f} ms"
+
+async def run(connections: int, stalled_share: float, messages: int):
+    manager = ConnectionManager()
+    stalled = int(connections * stalled_share)
+    healthy = connections - stalled
+    for index in range(connections):
+        await manager.connect(FakeSocket(stalled=index < stalled), f"user-{index % 1000}")
+    await asyncio.sleep(0)  # let every sender task start
+
+    returned, delivered = [], []
+    for sequence in range(1, messages + 1):
+        FakeSocket.target = healthy * sequence
+        FakeSocket.all_delivered = asyncio.Event()
+
+        started = time.perf_counter()
+        await manager.broadcast({"type": "issue_updated", "data": {"id": sequence, "title": "x" * 200}})
+        returned.append((time.perf_counter() - started) * 1000)
+        await FakeSocket.all_delivered.wait()
+        delivered.append((time.perf_counter() - started) * 1000)
+
+    print(f"{connections} connections, {stalled} stalled, {messages} messages")
+    print(f"broadcast returned:   {percentiles(returned)}")
+    print(f"all healthy received: {percentiles(delivered)}")
+    print(f"frames dropped for stalled clients: {sum(DROPPED_FRAMES._values.values())}")
+
+    for websocket in list(manager.connections):
+        manager.disconnect(websocket)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure WebSocket broadcast latency.")
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--stalled", type=float, default=0.05, help="share of clients that never finish a send")
+    parser.add_argument("--messages", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.connections, args.stalled, args.messages))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
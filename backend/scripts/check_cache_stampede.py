@@ -0,0 +1,158 @@
+# backend/scripts/check_cache_stampede.py
+"""Check that concurrent cache misses compute a response only once.
+
+Fires --requests concurrent calls at one cold key through Cache.cached, split
+across --workers Cache instances sharing one backend (each instance stands in
+for a worker process with its own single-flight table), and checks the
+backing computation ran exactly once and every caller got its result. Then
+invalidates the namespace, from the event loop and from a thread the way
+queue tasks do, and checks that the generation key sends each next burst to
+a fresh computation instead of the stale entry.
+
+It runs once on the in-process LRU and once on RedisBackend. Without
+--redis-url RedisBackend talks to a minimal in-process Redis-protocol
+stand-in (GET/SET/INCRBY/DEL), so no server is needed:
+
+    python -m scripts.check_cache_stampede --requests 200 --workers 4
+    python -m scripts.check_cache_stampede --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+
+from app.core.cache import Cache, MemoryBackend, RedisBackend
+from scripts.check_pubsub import StandInServer
+
+class CacheStandInServer(StandInServer):
+    """Just enough of the Redis protocol for RedisBackend."""
+
+    def __init__(self):
+        super().__init__()
+        self.values = {}  # key -> (value, expires_at or None)
+        self.connections = {}  # handler task -> writer
+
+    def lookup(self, key):
+        value, expires_at = self.values.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+    def reply(self, name, args) -> bytes:
+        if name == b"GET":
+            return self.encode(self.lookup(args[0]))
+        if name == b"SET":
+            options = [arg.upper() for arg in args[2:]]
+            if b"NX" in options and self.lookup(args[0]) is not None:
+                return self.encode(None)
+            ttl = int(args[2 + options.index(b"EX") + 1]) if b"EX" in options else None
+            self.values[args[0]] = (args[1], time.monotonic() + ttl if ttl else None)
+            return b"+OK\r\n"
+        if name in (b"INCR", b"INCRBY"):  # redis-py sends INCRBY key 1
+            value = int(self.lookup(args[0]) or 0) + int(args[1] if len(args) > 1 else 1)
+            self.values[args[0]] = (str(value).encode(), None)
+            return self.encode(value)
+        if name == b"DEL":
+            return self.encode(sum(self.values.pop(key, None) is not None for key in args))
+        return b"+OK\r\n"  # CLIENT SETINFO, SELECT...
+
+    async def close(self):
+        """Drop client connections (redis-py keeps them pooled) and let the handlers finish."""
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*self.connections)
+
+    async def handle(self, reader, writer):
+        self.connections[asyncio.current_task()] = writer
+        try:
+            while (command := await self.read_command(reader)) is not None:
+                writer.write(self.reply(command[0].upper(), command[1:]))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections.pop(asyncio.current_task(), None)
+            writer.close()
+
+async def burst(workers, endpoints, requests: int):
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        endpoints[i % len(workers)](range_days=30) for i in range(requests)
+    ))
+    return results, (time.perf_counter() - started) * 1000
+
+async def check(args, label: str, backend) -> list:
+    workers = [Cache(backend, default_ttl=60) for _ in range(args.workers)]
+    # A namespace of its own, so reruns against a shared Redis start cold
+    namespace = f"check_stampede_{uuid.uuid4().hex[:8]}"
+    computations = []
+
+    async def compute_stats(range_days: int):
+        """Stands in for an aggregate query: slow enough for every caller to miss."""
+        computations.append(range_days)
+        await asyncio.sleep(args.compute_ms / 1000)
+        return {"computation": len(computations), "range_days": range_days}
+
+    endpoints = [worker.cached(namespace)(compute_stats) for worker in workers]
+    failures = []
+    print(f"{label}:")
+
+    results, elapsed = await burst(workers, endpoints, args.requests)
+    print(f"  cold burst: {args.requests} requests, {len(computations)} computations, {elapsed:.0f} ms")
+    if len(computations) != 1:
+        failures.append(f"cold burst computed {len(computations)} times")
+    if any(result != {"computation": 1, "range_days": 30} for result in results):
+        failures.append("cold burst returned differing results")
+
+    results, elapsed = await burst(workers, endpoints, args.requests)
+    print(f"  warm burst: {args.requests} requests, {len(computations)} computations, {elapsed:.0f} ms")
+    if len(computations) != 1 or any(result["computation"] != 1 for result in results):
+        failures.append("warm burst did not come from the cache")
+
+    invalidations = (
+        ("after invalidate", workers[0].invalidate(namespace)),
+        # A thread of its own, as queue tasks call it; a stand-in on this loop keeps serving
+        ("after invalidate_blocking", asyncio.to_thread(workers[0].invalidate_blocking, namespace)),
+    )
+    for expected, (name, invalidation) in enumerate(invalidations, start=2):
+        await invalidation
+        results, elapsed = await burst(workers, endpoints, args.requests)
+        print(f"  {name}: {args.requests} requests, {len(computations)} computations, {elapsed:.0f} ms")
+        if len(computations) != expected:
+            failures.append(f"burst {name} computed {len(computations) - expected + 1} times, expected once")
+        if any(result["computation"] != expected for result in results):
+            failures.append(f"burst {name} served the stale entry")
+
+    return [f"{label}: {failure}" for failure in failures]
+
+async def run(args) -> int:
+    failures = await check(args, "in-process LRU", MemoryBackend())
+    if args.redis_url:
+        failures += await check(args, f"RedisBackend on {args.redis_url}", RedisBackend(args.redis_url))
+    else:
+        stand_in = CacheStandInServer()
+        server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            try:
+                failures += await check(args, "RedisBackend on the in-process stand-in", RedisBackend(f"redis://127.0.0.1:{port}/0"))
+            finally:
+                await stand_in.close()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4, help="Cache instances sharing the backend")
+    parser.add_argument("--compute-ms", type=int, default=200)
+    parser.add_argument("--redis-url", help="check RedisBackend on this server instead of the in-process stand-in")
+    return asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+# backend/scripts/check_cycle_analytics.py
+"""Check that resolutions reach the cycle-time analytics through the real endpoints.
+
+Creates issues through POST /api/issues/, resolves them through PUT and the
+batch "status" op (including a reopen and second resolution), then reads
+the stats endpoints (MTTR, throughput, range, resolution percentiles) and
+the daily counters and checks every resolution was counted:
+
+    python -m scripts.check_cycle_analytics --issues 5
+
+Run it against a migrated scratch database: it adds a throwaway ADMIN user
+and issue history. The issues themselves are deleted again at the end.
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from datetime import datetime, timedelta
+import argparse
+import sys
+import uuid
+
+from app.core.security import create_access_token
+from app.db.session import SessionLocal
+from app.main import app
+from app.models.daily_stats import DailyStats
+from app.models.issue import IssueSeverity
+from app.models.user import User, RoleEnum
+from app.services.stats import stats_day
+
+def create_admin() -> str:
+    email = f"check-analytics-{uuid.uuid4().hex[:8]}@example.com"
+    db = SessionLocal()
+    try:
+        db.add(User(email=email, name="Analytics check", hashed_password="!", role=RoleEnum.ADMIN))
+        db.commit()
+    finally:
+        db.close()
+    return email
+
+def closed_today() -> int:
+    db = SessionLocal()
+    try:
+        return db.scalar(select(DailyStats.issues_closed_today).where(DailyStats.date == stats_day())) or 0
+    finally:
+        db.close()
+
+class Analytics:
+    """Reads of every endpoint a resolution should show up in, over one fixed window."""
+
+    def __init__(self, client: TestClient, start: datetime, end: datetime):
+        self.client = client
+        self.window = {"from": start.isoformat(), "to": end.isoformat()}
+
+    def get(self, path: str, **params) -> dict:
+        response = self.client.get(f"/api/stats/{path}", params={**self.window, **params})
+        response.raise_for_status()
+        return response.json()
+
+    def snapshot(self) -> dict:
+        mttr = self.get("mttr")["severities"]
+        return {
+            "mttr": {severity: summary["count"] for severity, summary in mttr.items()},
+            "mttr_avg": {severity: summary["avg_hours"] for severity, summary in mttr.items()},
+            "sketches": {
+                severity: summary["count"]
+                for severity, summary in self.get("resolution-percentiles")["severities"].items()
+            },
+            "throughput": sum(bucket["resolved"] for bucket in self.get("throughput", bucket="day")["buckets"]),
+            "range": sum(bucket["issues_closed"] for bucket in self.get("range", bucket="hour")["buckets"]),
+            "closed_today": closed_today(),
+        }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=5, help="issues per severity")
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': create_admin()})}"
+    now = datetime.utcnow().replace(microsecond=0)
+    analytics = Analytics(client, now - timedelta(hours=1), now + timedelta(hours=1))
+    before = analytics.snapshot()
+
+    ids, expected = [], {severity.value: 0 for severity in IssueSeverity}
+    for severity in IssueSeverity:
+        for _ in range(args.issues):
+            response = client.post("/api/issues/", data={"title": "Analytics check", "severity": severity.value})
+            response.raise_for_status()
+            ids.append(response.json()["id"])
+            expected[severity.value] += 1
+
+    # Half resolved one by one, the rest closed in one batch
+    half = len(ids) // 2
+    for issue_id in ids[:half]:
+        client.put(f"/api/issues/{issue_id}", json={"status": "IN_PROGRESS"}).raise_for_status()
+        client.put(f"/api/issues/{issue_id}", json={"status": "RESOLVED"}).raise_for_status()
+    response = client.post("/api/issues/batch", json={
+        "operations": [{"op": "status", "id": issue_id, "data": {"status": "CLOSED"}} for issue_id in ids[half:]]
+    })
+    response.raise_for_status()
+    failed = [result for result in response.json()["results"] if result["status_code"] != 200]
+    if failed:
+        print(f"batch status op failed: {failed}")
+        return 1
+
+    # Reopen and resolve again: a second resolution of the same issue
+    client.put(f"/api/issues/{ids[0]}", json={"status": "OPEN"}).raise_for_status()
+    client.put(f"/api/issues/{ids[0]}", json={"status": "CLOSED"}).raise_for_status()
+    expected[IssueSeverity.LOW.value] += 1
+    resolutions = sum(expected.values())
+
+    after = analytics.snapshot()
+    failures = []
+    for severity, count in expected.items():
+        got = after["mttr"][severity] - before["mttr"][severity]
+        if got != count:
+            failures.append(f"mttr {severity}: {got} resolutions, expected {count}")
+        if after["mttr_avg"][severity] is None:
+            failures.append(f"mttr {severity}: no average")
+        got = after["sketches"][severity] - before["sketches"][severity]
+        if got != count:
+            failures.append(f"resolution-percentiles {severity}: {got} samples, expected {count}")
+    for name in ("throughput", "range", "closed_today"):
+        got = after[name] - before[name]
+        if got != resolutions:
+            failures.append(f"{name}: {got} resolutions, expected {resolutions}")
+
+    for issue_id in ids:
+        client.delete(f"/api/issues/{issue_id}")
+
+    print(f"{len(ids)} issues, {resolutions} resolutions: mttr {after['mttr_avg']}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
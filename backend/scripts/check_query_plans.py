@@ -0,0 +1,135 @@
+# backend/scripts/check_query_plans.py
+"""Fail if any hot issue query falls back to a full table scan, or a keyset
+page sorts every matching row instead of reading them in index order.
+
+Run against a migrated (and ideally seeded) database:
+
+    python -m scripts.check_query_plans
+
+On PostgreSQL sequential scans are disabled for the session, so a plan that
+still contains "Seq Scan on issues" means no index can serve the query. On
+SQLite a bare "SCAN issues" (no index) is treated the same way. Pages are
+built with the list endpoint's own keyset statement (ORDER BY created_at DESC,
+id DESC), so a "Sort Key: ... created_at" node or "USE TEMP B-TREE FOR ORDER
+BY" means page cost grows with the number of matching issues.
+"""
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from types import SimpleNamespace
+from datetime import datetime, time, timedelta
+import sys
+import uuid
+
+from app.db.session import SessionLocal
+from app.models.issue import Issue, IssueStatus, IssueSeverity
+from app.models.user import RoleEnum
+from app.api.issue import filtered_issues_query
+from app.services.dashboard import DASHBOARD_QUERY, SUMMARY_QUERY, WORKLOAD_QUERY
+from app.core.pagination import apply_keyset, encode_cursor
+
+
+class explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+@compiles(explain)
+def _compile_explain(element, compiler, **kw):
+    prefix = "EXPLAIN QUERY PLAN" if compiler.dialect.name == "sqlite" else "EXPLAIN"
+    return f"{prefix} {compiler.process(element.statement, **kw)}"
+
+def hot_queries():
+    """The statements the API and stats job run on every request or tick."""
+    admin = SimpleNamespace(role=RoleEnum.ADMIN, id=uuid.uuid4())
+    reporter = SimpleNamespace(role=RoleEnum.REPORTER, id=uuid.uuid4())
+    cursor = encode_cursor(datetime.utcnow(), uuid.uuid4())
+    day_start = datetime.combine(datetime.utcnow().date(), time.min)
+    day_end = day_start + timedelta(days=1)
+
+    return {
+        "list first page": apply_keyset(
+            filtered_issues_query(admin), Issue.created_at, Issue.id
+        ).limit(51),
+        "list deep page": apply_keyset(
+            filtered_issues_query(admin), Issue.created_at, Issue.id, cursor
+        ).limit(51),
+        "reporter list page": apply_keyset(
+            filtered_issues_query(reporter), Issue.created_at, Issue.id, cursor
+        ).limit(51),
+        "status/severity filter": apply_keyset(
+            filtered_issues_query(admin, IssueStatus.OPEN, IssueSeverity.HIGH), Issue.created_at, Issue.id
+        ).limit(51),
+        "status/severity filter deep page": apply_keyset(
+            filtered_issues_query(admin, IssueStatus.OPEN, IssueSeverity.HIGH), Issue.created_at, Issue.id, cursor
+        ).limit(51),
+        "issue counts": SUMMARY_QUERY,
+        "dashboard summary": DASHBOARD_QUERY,
+        "assignee workload": WORKLOAD_QUERY,
+        "assignee filter": apply_keyset(
+            filtered_issues_query(admin, assigned_to=uuid.uuid4()), Issue.created_at, Issue.id
+        ).limit(51),
+        "created today": select(Issue.id).where(
+            Issue.created_at >= day_start, Issue.created_at < day_end
+        ),
+        "closed today": select(Issue.id).where(
+            Issue.status == IssueStatus.CLOSED,
+            Issue.updated_at >= day_start,
+            Issue.updated_at < day_end
+        ),
+    }
+
+def is_full_scan(dialect_name: str, plan_lines) -> bool:
+    for line in plan_lines:
+        if dialect_name == "sqlite":
+            if line.strip().startswith("SCAN issues") and "INDEX" not in line:
+                return True
+        elif "Seq Scan on issues" in line:
+            return True
+    return False
+
+def is_full_sort(dialect_name: str, plan_lines) -> bool:
+    for line in plan_lines:
+        if dialect_name == "sqlite":
+            if "USE TEMP B-TREE FOR ORDER BY" in line:
+                return True
+        elif "Sort Key:" in line and "created_at" in line:
+            return True
+    return False
+
+def main() -> int:
+    db = SessionLocal()
+    failures = []
+    try:
+        dialect_name = db.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            db.execute(text("SET enable_seqscan = off"))
+
+        for name, statement in hot_queries().items():
+            result = db.execute(explain(statement))
+            # Read the raw DBAPI rows: the plan does not match the select's column types.
+            # PostgreSQL returns one text column, SQLite returns (id, parent, notused, detail)
+            plan = [row[-1] for row in result.cursor.fetchall()]
+            if is_full_scan(dialect_name, plan):
+                status = "FULL SCAN"
+            elif is_full_sort(dialect_name, plan):
+                status = "FULL SORT"
+            else:
+                status = "ok"
+            print(f"[{status}] {name}")
+            for line in plan:
+                print(f"    {line}")
+            if status != "ok":
+                failures.append(name)
+    finally:
+        db.close()
+
+    if failures:
+        print(f"{len(failures)} hot queries fall back to a full scan or sort: {', '.join(failures)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# backend/scripts/check_reconcile_concurrency.py
+"""Check that overlapping reconcile runs apply snapshot drift only once.
+
+Brings today's daily stats in line with the table, creates an issue the way
+the API does, then closes it with a raw UPDATE that bypasses the deltas.
+Two processes then start reconcile_stats at the same moment, each pausing
+between reading the drift and applying it (as the stats and cleanup jobs can
+at midnight), and the check fails unless today's counters match the table
+afterwards:
+
+    python -m scripts.check_reconcile_concurrency
+
+Run it against a migrated scratch database: the issue is deleted again at
+the end, but its events stay in the log.
+"""
+
+from sqlalchemy import select, func, update
+from collections import Counter
+from datetime import datetime
+import multiprocessing
+import sys
+import time
+import uuid
+
+from app.db.session import SessionLocal
+from app.models.daily_stats import DailyStats
+from app.models.issue import Issue, IssueStatus, IssueSeverity
+from app.models.user import User
+from app.services import stats
+
+PAUSE_SECONDS = 1.0
+
+def table_counters(db) -> Counter:
+    counts = Counter()
+    for status, severity, count in db.execute(
+        select(Issue.status, Issue.severity, func.count(Issue.id)).group_by(Issue.status, Issue.severity)
+    ):
+        counts[stats.STATUS_COUNTERS.get(status.value)] += count
+        counts[stats.SEVERITY_COUNTERS.get(severity.value)] += count
+        counts["total_issues"] += count
+    return counts
+
+def snapshot(db) -> Counter:
+    row = db.scalar(select(DailyStats).where(DailyStats.date == stats.stats_day()))
+    return Counter({counter: getattr(row, counter) or 0 for counter in stats.SNAPSHOT_COUNTERS})
+
+def create_drift() -> uuid.UUID:
+    db = SessionLocal()
+    try:
+        owner = db.scalar(select(User.id).limit(1))
+        if owner is None:
+            raise SystemExit("Create a user before running the check")
+
+        issue = Issue(id=uuid.uuid4(), title="Reconcile check", severity=IssueSeverity.LOW, created_by=owner)
+        db.add(issue)
+        stats.record_issue_changes(db, [(issue.id, None, (IssueStatus.OPEN, IssueSeverity.LOW))])
+        db.commit()
+
+        # Behind the deltas' back: no event, no counter change
+        db.execute(update(Issue).where(Issue.id == issue.id).values(
+            status=IssueStatus.CLOSED, updated_at=datetime.utcnow()
+        ))
+        db.commit()
+        return issue.id
+    finally:
+        db.close()
+
+def delete_issue(issue_id: uuid.UUID):
+    db = SessionLocal()
+    try:
+        issue = db.get(Issue, issue_id)
+        db.delete(issue)
+        stats.record_issue_changes(db, [(issue_id, (issue.status, issue.severity, issue.created_at), None)])
+        db.commit()
+    finally:
+        db.close()
+
+def reconcile(barrier):
+    """Runs in each reconcile process."""
+    apply_stats_delta = stats.apply_stats_delta
+
+    def paused_apply(*args, **kwargs):
+        # Widen the gap between reading the drift and applying it
+        time.sleep(PAUSE_SECONDS)
+        apply_stats_delta(*args, **kwargs)
+
+    stats.apply_stats_delta = paused_apply
+    barrier.wait()
+    stats.reconcile_stats()
+
+def main() -> int:
+    stats.rebuild_stats()
+    issue_id = create_drift()
+
+    barrier = multiprocessing.Barrier(2)
+    runs = [multiprocessing.Process(target=reconcile, args=(barrier,)) for _ in range(2)]
+    for run in runs:
+        run.start()
+    for run in runs:
+        run.join()
+
+    db = SessionLocal()
+    try:
+        expected, counted = table_counters(db), snapshot(db)
+    finally:
+        db.close()
+    delete_issue(issue_id)
+
+    mismatched = {
+        counter: (counted[counter], expected[counter])
+        for counter in stats.SNAPSHOT_COUNTERS if counted[counter] != expected[counter]
+    }
+    if mismatched or any(run.exitcode for run in runs):
+        print(f"FAIL: daily stats (counted, table) after two concurrent reconciles: {mismatched}")
+        return 1
+    print("ok: drift applied once by two concurrent reconciles")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# backend/scripts/check_sketch_accuracy.py
+"""Check resolution-time sketches against exact percentiles on synthetic data.
+
+Builds one sketch per synthetic day, merges them the way the percentile
+endpoint does, and fails if any p50/p90/p99 is off by more than the
+configured relative accuracy:
+
+    python -m scripts.check_sketch_accuracy
+"""
+
+import math
+import random
+import sys
+
+from app.core.config import settings
+from app.core.sketch import DDSketch
+from app.services.sketches import QUANTILES
+
+DISTRIBUTIONS = {
+    # Minutes to months, like real resolution times
+    "lognormal": lambda rng: rng.lognormvariate(math.log(6 * 3600), 1.5),
+    "exponential": lambda rng: rng.expovariate(1 / (2 * 86400)),
+    "uniform": lambda rng: rng.uniform(60, 30 * 86400),
+    # A cluster of instant closes plus a long tail
+    "bimodal": lambda rng: rng.uniform(0, 120) if rng.random() < 0.3 else rng.lognormvariate(math.log(3 * 86400), 1.0),
+}
+
+def exact_quantile(values, q: float) -> float:
+    """Lower-rank exact quantile, the definition DDSketch approximates."""
+    return values[math.floor(q * (len(values) - 1))]
+
+def main(days: int = 90, per_day: int = 500, seed: int = 42) -> int:
+    accuracy = settings.RESOLUTION_SKETCH_ACCURACY
+    rng = random.Random(seed)
+    failures = 0
+
+    for name, draw in DISTRIBUTIONS.items():
+        merged = DDSketch(accuracy)
+        values = []
+        for _ in range(days):
+            daily = DDSketch(accuracy)
+            for _ in range(rng.randint(0, per_day * 2)):
+                value = draw(rng)
+                daily.add(value)
+                values.append(value)
+            # Round-trip through the stored form, as the database does
+            merged.merge(DDSketch.from_dict(daily.to_dict()))
+
+        values.sort()
+        for q in QUANTILES:
+            exact = exact_quantile(values, q)
+            estimate = merged.quantile(q)
+            error = abs(estimate - exact) / exact if exact else abs(estimate)
+            ok = error <= accuracy + 1e-12
+            failures += not ok
+            print(f"[{'ok' if ok else 'FAIL'}] {name} p{round(q * 100)}: exact {exact:.1f}s, sketch {estimate:.1f}s, error {error:.4%}")
+
+    if failures:
+        print(f"{failures} quantiles exceed the {accuracy:.2%} relative accuracy bound")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
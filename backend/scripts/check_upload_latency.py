@@ -0,0 +1,143 @@
+# backend/scripts/check_upload_latency.py
+"""Check that large uploads don't stall other requests.
+
+Starts the API under uvicorn (one worker, so every request shares one event
+loop), times a probe endpoint on its own, then again while --uploads large
+attachments are streamed in parallel through POST /api/issues/ from a
+separate process (so the probes only time the server), and fails if the
+probe's p99 under upload load exceeds --max-p99-ms:
+
+    python -m scripts.check_upload_latency --uploads 8 --size-mb 8
+
+Run it against a migrated scratch database: it adds a throwaway ADMIN user.
+The uploaded issues and their files are deleted again at the end.
+"""
+
+from datetime import datetime
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+from app.core.security import create_access_token
+from app.db.session import SessionLocal
+from app.models.user import User, RoleEnum
+
+def create_admin() -> str:
+    email = f"check-uploads-{uuid.uuid4().hex[:8]}@example.com"
+    db = SessionLocal()
+    try:
+        db.add(User(email=email, name="Upload check", hashed_password="!", role=RoleEnum.ADMIN))
+        db.commit()
+    finally:
+        db.close()
+    return email
+
+def summary(timings: list) -> str:
+    timings = sorted(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return f"{len(timings)} probes: p50 {statistics.median(timings):.1f} ms, p99 {p99:.1f} ms"
+
+async def probe(client: httpx.AsyncClient, path: str, until) -> list:
+    timings = []
+    while not until():
+        start = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        timings.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+    return timings
+
+def attachment(size: int) -> bytes:
+    # A PDF header so the sniffed type is allowed; the rest is incompressible filler
+    return b"%PDF-1.4\n" + os.urandom(size)
+
+async def upload(client: httpx.AsyncClient, content: bytes) -> str:
+    response = await client.post(
+        "/api/issues/",
+        data={"title": f"Upload check {datetime.utcnow().isoformat()}"},
+        files={"file": ("check.pdf", content, "application/pdf")},
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+async def upload_all(base_url: str, headers: dict, count: int, size: int) -> list:
+    content = attachment(size)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=120) as client:
+        return await asyncio.gather(*(upload(client, content) for _ in range(count)))
+
+def send_uploads(base_url: str, headers: dict, count: int, size: int) -> list:
+    """Runs in the uploader process; returns the created issue ids."""
+    return asyncio.run(upload_all(base_url, headers, count, size))
+
+async def run(args, base_url: str, uploader) -> int:
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': create_admin()})}"}
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=120) as client:
+        # Warm-up: the first upload pays one-off imports and connection setup
+        issue_ids = [await upload(client, attachment(1024))]
+
+        deadline = time.monotonic() + args.baseline_seconds
+        baseline = await probe(client, args.probe, lambda: time.monotonic() > deadline)
+        print(f"idle:          {summary(baseline)}")
+
+        started = time.perf_counter()
+        uploads = uploader.apply_async(send_uploads, (base_url, headers, args.uploads, args.size_mb * 1024 * 1024))
+        loaded = await probe(client, args.probe, uploads.ready)
+        issue_ids.extend(uploads.get())
+        elapsed = time.perf_counter() - started
+        print(f"{args.uploads} uploads of {args.size_mb} MB in {elapsed:.1f} s")
+        print(f"under uploads: {summary(loaded)}")
+
+        for issue_id in issue_ids:
+            (await client.delete(f"/api/issues/{issue_id}")).raise_for_status()
+
+    p99 = sorted(loaded)[min(len(loaded) - 1, int(len(loaded) * 0.99))]
+    if p99 > args.max_p99_ms:
+        print(f"FAIL: probe p99 {p99:.1f} ms under uploads exceeds {args.max_p99_ms} ms")
+        return 1
+    return 0
+
+def wait_until_ready(base_url: str, server: subprocess.Popen):
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("uvicorn exited before it was ready")
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit("uvicorn did not become ready")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=8, help="parallel uploads")
+    parser.add_argument("--size-mb", type=int, default=8, help="size of each upload (under MAX_UPLOAD_SIZE)")
+    parser.add_argument("--probe", default="/health", help="endpoint timed during the uploads")
+    parser.add_argument("--baseline-seconds", type=float, default=2.0)
+    parser.add_argument("--max-p99-ms", type=float, default=100.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"]
+    )
+    try:
+        wait_until_ready(base_url, server)
+        with multiprocessing.Pool(1) as uploader:
+            return asyncio.run(run(args, base_url, uploader))
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+# backend/scripts/rebuild_stats.py
+"""Recompute today's daily statistics from the full issues table.
+
+The counters are normally maintained incrementally by the issue endpoints and
+checked by the scheduled reconciliation. Run this after bulk imports, manual
+SQL edits or restoring a backup:
+
+    python -m scripts.rebuild_stats
+"""
+
+import logging
+import sys
+
+from app.services.stats import rebuild_stats
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO)
+    result = rebuild_stats()
+    print(
+        f"{result['date']}: {result['total_issues']} issues, "
+        f"{result['created_today']} created, {result['closed_today']} closed today"
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,9 @@ import type { DashboardData } from '$lib/types/dashboard';
 
 const API_BASE_URL = 'http://localhost:8000';
 
+// Largest page GET /api/issues/ serves (ISSUES_MAX_PAGE_SIZE)
+const ISSUES_PAGE_LIMIT = 200;
+
 interface ApiResponse<T> {
   data?: T;
   error?: string;
@@ -116,13 +119,30 @@ class ApiClient {
   }
 
   // Issues
+  // The list is served one keyset page at a time; follow X-Next-Cursor until it runs out
   async getIssues(): Promise<ApiResponse<Issue[]>> {
-    const url = `${this.baseURL}/api/issues/`;
-    const response = await fetch(url, {
-      headers: this.getAuthHeaders(),
-    });
+    const issues: Issue[] = [];
+    let cursor: string | null = null;
 
-    return this.handleResponse(response);
+    do {
+      const params = new URLSearchParams({ limit: String(ISSUES_PAGE_LIMIT) });
+      if (cursor) {
+        params.set('cursor', cursor);
+      }
+
+      const response = await fetch(`${this.baseURL}/api/issues/?${params}`, {
+        headers: this.getAuthHeaders(),
+      });
+      const page = await this.handleResponse<Issue[]>(response);
+      if (!page.data) {
+        return page;
+      }
+
+      issues.push(...page.data);
+      cursor = response.headers.get('X-Next-Cursor');
+    } while (cursor);
+
+    return { data: issues, status: 200 };
   }
 
   async createIssue(formData: FormData): Promise<ApiResponse<Issue>> {
@@ -146,41 +166,14 @@ class ApiClient {
     return this.handleResponse(response);
   }
 
-  // ✅ Dashboard stats - Returns structure that matches DashboardData type
+  // ✅ Dashboard stats - counted server-side over every issue, not just one page
   async getDashboardStats(): Promise<ApiResponse<DashboardData>> {
-    const issuesResponse = await this.getIssues();
-
-    if (!issuesResponse.data) {
-      return {
-        error: issuesResponse.error || 'Failed to load dashboard data',
-        status: issuesResponse.status,
-      };
-    }
-
-    const issues = issuesResponse.data;
-
-    const severities = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL'];
-    const statuses = ['OPEN', 'TRIAGED', 'IN_PROGRESS', 'DONE'];
-
-    const severity_breakdown = severities.map(sev => ({
-      severity: sev,
-      count: issues.filter(i => i.severity === sev).length,
-    }));
-
-    const status_breakdown = statuses.map(stat => ({
-      status: stat,
-      count: issues.filter(i => i.status === stat).length,
-    }));
-
-    const total_open = issues.filter(i => i.status === 'OPEN').length;
-
-    const dashboardData: DashboardData = {
-      severity_breakdown,
-      status_breakdown,
-      total_open,
-    };
+    const url = `${this.baseURL}/api/dashboard/stats`;
+    const response = await fetch(url, {
+      headers: this.getAuthHeaders(),
+    });
 
-    return { data: dashboardData, status: 200 };
+    return this.handleResponse(response);
   }
 
   async healthCheck(): Promise<ApiResponse<{ message: string }>> {
@@ -23,7 +23,7 @@ export interface LoginCredentials {
 }
 
 // Issue types - Fixed and consistent
-export type IssueStatus = 'OPEN' | 'TRIAGED' | 'IN_PROGRESS' | 'DONE';
+export type IssueStatus = 'OPEN' | 'IN_PROGRESS' | 'RESOLVED' | 'CLOSED';
 export type IssueSeverity = 'LOW' | 'MEDIUM' | 'HIGH' | 'CRITICAL';
 
 export interface Issue {